@@ -1,21 +1,29 @@
 import unittest
-from astrocoordtests import Test_Coord
-from astrodatetests import Test_Date
+from astrocoordtests import Test_Coord, Test_CoordArray
+from astrodatetests import Test_CompactDate, Test_Date, Test_Instant
+from chebyshev_ephemeristests import Test_ChebyshevEphemeris
 from datetimestringtests import Test_DateTimeString
+from deltattests import Test_DeltaT
 from distancetests import Test_Distance
 from earthtests import Test_Earth
+from geocentrictests import Test_Geocentric
+from heliocentric_positiontests import Test_HeliocentricPosition
 from jupitertests import Test_Jupiter
+from lrucachetests import Test_LRUCache
 from marstests import Test_Mars
 from mercurytests import Test_Mercury
 from neptunetests import Test_Neptune
+from rise_transit_settests import Test_RiseTransitSet
 from saturntests import Test_Saturn
+from solar_systemtests import Test_SolarSystem
 from suntests import Test_Sun
 from uranustests import Test_Uranus
 from venustests import Test_Venus
 
-test_cases = [Test_Coord, Test_Date, Test_DateTimeString, Test_Distance,
-              Test_Earth, Test_Jupiter, Test_Mars, Test_Mercury, Test_Neptune,
-              Test_Saturn, Test_Sun, Test_Uranus, Test_Venus]
+test_cases = [Test_Coord, Test_CoordArray, Test_Date, Test_ChebyshevEphemeris, Test_CompactDate, Test_DateTimeString,
+              Test_DeltaT, Test_Distance, Test_Earth, Test_Geocentric, Test_HeliocentricPosition, Test_Instant,
+              Test_Jupiter, Test_LRUCache, Test_Mars, Test_Mercury, Test_Neptune, Test_RiseTransitSet, Test_Saturn,
+              Test_SolarSystem, Test_Sun, Test_Uranus, Test_Venus]
 
 testLoader = unittest.TestLoader()
 tests = []
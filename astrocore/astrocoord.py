@@ -1,7 +1,9 @@
 import astrodate
 import earth
+import lrucache
 import math
 import mathutils
+import numpy as np
 
 
 COORD_MODE_HORIZON = u'hor'         # degrees (Azimuth)
@@ -20,13 +22,109 @@ COORD1_TYPES = [COORD1_TYPE_RA, COORD1_TYPE_HA]
 
 MODE_DELIMITER = '|'
 
+GALACTIC_POLE_RA = 192.25           # degrees (B1950)
+GALACTIC_POLE_DEC = 27.4            # degrees (B1950)
+GALACTIC_NODE_LONGITUDE = 33.0      # degrees (the galactic longitude of the ascending node on the equator)
+
+ROTATION_CACHE_SIZE = 256           # the most rotation matrices kept (by pair of frames and epoch)
+ROTATION_CACHE = lrucache.LRUCache(ROTATION_CACHE_SIZE)
+
+SCALAR_TYPES = (float, int, long)
+
+
+def angles_from_vectors(v):
+    """
+    Convert unit vectors to angles.
+    :param v: the vectors (x, y, z along the last axis of an ndarray)
+    :return: the longitudes (in degrees, [0, 360)), the latitudes (in degrees)
+    """
+    lng = np.mod(np.degrees(np.arctan2(v[..., 1], v[..., 0])), 360.0)
+    lng = np.where(lng >= 360.0, 0.0, lng)
+    return lng, np.degrees(np.arcsin(np.clip(v[..., 2], -1.0, 1.0)))
+
+
+def calculate_julianTD(date, epochTD=None):
+    """
+    Calculate the julian date in dynamical time of a date or an epoch.
+    :param date: the date (any time mode, it is not changed)
+    :param epochTD: the epoch (in dynamical time, overrides the date)
+    :return: the julian date (in dynamical time)
+    """
+    if epochTD is not None:
+        return astrodate.Instant.alloc_with_date(astrodate.AstroDate().alloc_with_epochTD(epochTD)).get_julianTD()
+    if date is None:
+        raise ValueError("Date (TD) is required!")
+    # the instant of the date, so that the date is not converted to TDT
+    return astrodate.Instant.alloc_with_date(date).get_julianTD()
+
+
+def calculate_mean_obliquity(date, epochTD=None):
+    """
+    Calculate the mean obliquity of the ecliptic.
+    :param date: the date (any time mode, it is not changed)
+    :param epochTD: the epoch (in dynamical time, overrides the date)
+    :return: the mean obliquity (in degrees)
+    """
+    n = earth.Nutation()
+    n.calculate_with_julianTD(calculate_julianTD(date, epochTD))
+    return n.get_mean_obliquity()
+
+
+def calculate_precession_angles(from_jde, to_jde):
+    """
+    Calculate the IAU 1976 precession angles between two epochs (Meeus, Astronomical Algorithms, 21.2).
+    :param from_jde: the starting epoch (julian date in dynamical time)
+    :param to_jde: the final epoch (julian date in dynamical time)
+    :return: zeta, z, theta (in degrees)
+    """
+    T = (from_jde - astrodate.J2000) / 36525.0
+    t = (to_jde - from_jde) / 36525.0
+    c = 2306.2181 + ((1.39656 - (0.000139 * T)) * T)
+    zeta = ((c + ((0.30188 - (0.000344 * T)) + (0.017998 * t)) * t) * t)
+    z = ((c + ((1.09468 + (0.000066 * T)) + (0.018203 * t)) * t) * t)
+    theta = (((2004.3109 - ((0.85330 + (0.000217 * T)) * T)) - (((0.42665 + (0.000217 * T)) + (0.041833 * t)) * t)) * t)
+    return zeta / 3600.0, z / 3600.0, theta / 3600.0
+
+
+def calculate_precession_matrix(from_jde, to_jde):
+    """
+    Calculate the IAU 1976 precession matrix between two epochs.
+    :param from_jde: the starting epoch (julian date in dynamical time)
+    :param to_jde: the final epoch (julian date in dynamical time)
+    :return: the 3x3 ndarray
+    """
+    zeta, z, theta = calculate_precession_angles(from_jde, to_jde)
+    return np.dot(rotation_z(-z), np.dot(rotation_y(theta), rotation_z(-zeta)))
+
+
+def calculate_rotation_from_equatorial(frame, jde=None):
+    """
+    Calculate the rotation matrix from equatorial coordinates to a frame.
+    :param frame: COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC or COORD_MODE_GALACTIC
+    :param jde: the epoch of the ecliptic (julian date in dynamical time)
+    :return: the 3x3 ndarray
+    """
+    if frame == COORD_MODE_EQUATORIAL:
+        return np.identity(3)
+    if frame == COORD_MODE_ECLIPTIC:
+        n = earth.Nutation()
+        n.calculate_with_julianTD(jde)
+        return rotation_x(n.get_mean_obliquity())
+    if frame == COORD_MODE_GALACTIC:
+        # the node of the galactic equator to x, the galactic pole to z, then the longitude of the node
+        return np.dot(rotation_z(-GALACTIC_NODE_LONGITUDE),
+                      np.dot(rotation_x(90.0 - GALACTIC_POLE_DEC), rotation_z(GALACTIC_POLE_RA + 90.0)))
+    raise ValueError("Invalid frame! (Must be Equatorial, Ecliptic or Galactic)")
+
 
 def dd_from_dms(d, m, s):
+    # the sign is read from the degrees as given, so that -0 degrees (as -0.0 or "-0") is negative
+    negative = str(d).lstrip().startswith("-")
     d = mathutils.to_int(d, None)
     m = mathutils.to_int(m, None)
     s = mathutils.to_float(s, None)
     if (d is not None) and (m is not None) and (s is not None):
-        if d < 0:
+        if negative:
             sgn = -1
         else:
             sgn = 1
@@ -40,12 +138,68 @@ def dms_from_dd(dd):
     if dd is not None:
         d = int(dd)
         dm = abs(dd - d) * 60.0
+        if (d == 0) and (dd < 0.0):
+            d = -0.0    # keeps the sign of a value between -1 and 0 (-0.0 == 0)
         m = int(dm + 0.0005)
         s = mathutils.fix((dm - m) * 60.0, 2)
         return d, m, s
     return None
 
 
+def __get_cached_rotation(key, calculate):
+    rotation = ROTATION_CACHE.get(key)
+    if rotation is None:
+        m = calculate()
+        m.setflags(write=False)
+        # the rows as floats too, for rotating single coordinates without NumPy
+        rotation = (m, m.tolist())
+        ROTATION_CACHE.put(key, rotation)
+    return rotation
+
+
+def __get_precession(from_jde, to_jde):
+    if (from_jde is None) or (to_jde is None):
+        raise ValueError("Date (TD) is required!")
+    from_jde = float(from_jde)
+    to_jde = float(to_jde)
+    return __get_cached_rotation((COORD_MODE_EQUATORIAL, from_jde, to_jde),
+                                 lambda: calculate_precession_matrix(from_jde, to_jde))
+
+
+def __get_rotation(from_frame, to_frame, jde):
+    if COORD_MODE_ECLIPTIC not in (from_frame, to_frame):
+        jde = None
+    elif jde is None:
+        raise ValueError("Date (TD) is required!")
+    return __get_cached_rotation((from_frame, to_frame, jde),
+                                 lambda: np.dot(calculate_rotation_from_equatorial(to_frame, jde),
+                                                calculate_rotation_from_equatorial(from_frame, jde).T))
+
+
+def get_precession_matrix(from_jde, to_jde):
+    """
+    Get the precession matrix between two epochs, so that the product of it and a unit vector in equatorial
+    coordinates of from_jde is the vector in equatorial coordinates of to_jde. The matrices are kept in the LRU cache
+    of the rotation matrices, keyed on the pair of epochs.
+    :param from_jde: the starting epoch (julian date in dynamical time, i.e. astrodate.J2000)
+    :param to_jde: the final epoch (julian date in dynamical time)
+    :return: the 3x3 ndarray (read only)
+    """
+    return __get_precession(from_jde, to_jde)[0]
+
+
+def get_rotation_matrix(from_frame, to_frame, jde=None):
+    """
+    Get the rotation matrix between two frames, so that the product of it and a unit vector in from_frame is the
+    vector in to_frame. The matrices are kept in an LRU cache keyed on the frames and the epoch.
+    :param from_frame: COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC or COORD_MODE_GALACTIC
+    :param to_frame: COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC or COORD_MODE_GALACTIC
+    :param jde: the epoch of the ecliptic (julian date in dynamical time, required when either frame is ecliptic)
+    :return: the 3x3 ndarray (read only)
+    """
+    return __get_rotation(from_frame, to_frame, jde)[0]
+
+
 def make_mode(m, u=None, t=None):
     m = safe_lower(m)
     u = safe_lower(u)
@@ -73,6 +227,88 @@ def normalize_dd2(dd):
     return dd
 
 
+def precess_angles(ra, dec, from_jde, to_jde):
+    """
+    Precess equatorial coordinates (IAU 1976) from one epoch to another with one rotation matrix.
+    :param ra: the right ascensions (in degrees, a float or an array)
+    :param dec: the declinations (in degrees, matching ra)
+    :param from_jde: the epoch of the coordinates (julian date in dynamical time, i.e. astrodate.J2000)
+    :param to_jde: the epoch to precess to (julian date in dynamical time)
+    :return: the right ascensions (in degrees, [0, 360)), the declinations (in degrees)
+    """
+    return __rotate(ra, dec, __get_precession(from_jde, to_jde))
+
+
+def __rotate(dd1, dd2, rotation):
+    m, rows = rotation
+    if isinstance(dd1, SCALAR_TYPES) and isinstance(dd2, SCALAR_TYPES):
+        # one coordinate is quicker with floats than with NumPy
+        a1 = dd1 * math.pi / 180.0
+        a2 = dd2 * math.pi / 180.0
+        x = math.cos(a2) * math.cos(a1)
+        y = math.cos(a2) * math.sin(a1)
+        z = math.sin(a2)
+        r0, r1, r2 = rows
+        x, y, z = ((r0[0] * x) + (r0[1] * y) + (r0[2] * z), (r1[0] * x) + (r1[1] * y) + (r1[2] * z),
+                   (r2[0] * x) + (r2[1] * y) + (r2[2] * z))
+        lng = math.atan2(y, x) * 180.0 / math.pi
+        if lng < 0.0:
+            lng += 360.0
+        if lng >= 360.0:
+            lng = 0.0
+        return lng, math.asin(max(-1.0, min(1.0, z))) * 180.0 / math.pi
+    return angles_from_vectors(np.dot(vectors_from_angles(dd1, dd2), m.T))
+
+
+def rotate_angles(dd1, dd2, from_frame, to_frame, jde=None):
+    """
+    Convert coordinates between the equatorial, ecliptic and galactic frames with one rotation matrix.
+    :param dd1: the longitudes (or right ascensions, in degrees, a float or an array)
+    :param dd2: the latitudes (or declinations, in degrees, matching dd1)
+    :param from_frame: COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC or COORD_MODE_GALACTIC
+    :param to_frame: COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC or COORD_MODE_GALACTIC
+    :param jde: the epoch of the ecliptic (julian date in dynamical time, required when either frame is ecliptic)
+    :return: the longitudes (in degrees, [0, 360)), the latitudes (in degrees)
+    """
+    return __rotate(dd1, dd2, __get_rotation(from_frame, to_frame, jde))
+
+
+def rotation_x(angle):
+    """
+    Calculate the matrix rotating the frame about the x axis.
+    :param angle: the angle (in degrees)
+    :return: the 3x3 ndarray
+    """
+    a = angle * math.pi / 180.0
+    c = math.cos(a)
+    s = math.sin(a)
+    return np.array([[1.0, 0.0, 0.0], [0.0, c, s], [0.0, -s, c]])
+
+
+def rotation_y(angle):
+    """
+    Calculate the matrix rotating the frame about the y axis.
+    :param angle: the angle (in degrees)
+    :return: the 3x3 ndarray
+    """
+    a = angle * math.pi / 180.0
+    c = math.cos(a)
+    s = math.sin(a)
+    return np.array([[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]])
+
+
+def rotation_z(angle):
+    """
+    Calculate the matrix rotating the frame about the z axis.
+    :param angle: the angle (in degrees)
+    :return: the 3x3 ndarray
+    """
+    a = angle * math.pi / 180.0
+    c = math.cos(a)
+    s = math.sin(a)
+    return np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
 def safe_lower(s):
     if s is not None:
         return s.lower()
@@ -130,16 +366,113 @@ def validate_hours(h, m, s):
     return False
 
 
-class AstroCoord:
+def vectors_from_angles(dd1, dd2):
+    """
+    Convert angles to unit vectors.
+    :param dd1: the longitudes (in degrees)
+    :param dd2: the latitudes (in degrees)
+    :return: the vectors (x, y, z along the last axis of an ndarray)
+    """
+    a1 = np.radians(dd1)
+    a2 = np.radians(dd2)
+    cos_a2 = np.cos(a2)
+    return np.stack((cos_a2 * np.cos(a1), cos_a2 * np.sin(a1), np.sin(a2)), axis=-1)
+
+
+class CoordFrame(object):
+    """
+    The parsed mode of a coordinate: the frame (one of COORD_MODES) and, for equatorial coordinates, the unit of
+    the first coordinate (COORD1_UNITS) and its type (COORD1_TYPES). Frames are immutable and interned, so there is
+    one frame for each mode (get_frame returns it) and a mode string is parsed only once.
+    """
+
+    __slots__ = ("mode", "frame", "unit", "type", "degrees", "hours", "right_ascension", "hour_angle")
+
+    def __init__(self, mode, frame, unit, type):
+        equatorial = frame == COORD_MODE_EQUATORIAL
+        for name, value in (("mode", mode), ("frame", frame), ("unit", unit), ("type", type),
+                            ("degrees", (not equatorial) or (unit == COORD1_UNIT_DEGREES)),
+                            ("hours", equatorial and (unit == COORD1_UNIT_HOURS)),
+                            ("right_ascension", equatorial and (type == COORD1_TYPE_RA)),
+                            ("hour_angle", equatorial and (type == COORD1_TYPE_HA))):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CoordFrame is immutable!")
+
+    def __repr__(self):
+        return "CoordFrame({!r})".format(self.mode)
+
+    @staticmethod
+    def __get_frame(frame, unit, type):
+        # the interned frame of the parts of a mode, kept under the parts so the mode is made only once
+        key = (frame, unit, type)
+        f = FRAMES.get(key)
+        if f is None:
+            f = get_frame(make_mode(frame, unit, type))
+            FRAMES[key] = f
+        return f
+
+    def with_type(self, type):
+        """
+        Get the frame with another type of the first coordinate.
+        :param type: COORD1_TYPE_RA or COORD1_TYPE_HA
+        :return: the CoordFrame
+        """
+        return self.__get_frame(self.frame, self.unit, type)
+
+    def with_unit(self, unit):
+        """
+        Get the frame with another unit of the first coordinate.
+        :param unit: COORD1_UNIT_DEGREES or COORD1_UNIT_HOURS
+        :return: the CoordFrame
+        """
+        return self.__get_frame(self.frame, unit, self.type)
+
+
+FRAMES = {}     # the interned frames, by mode string (as given and as made by make_mode) and by (frame, unit, type)
+
+
+def get_frame(mode):
+    """
+    Get the interned frame of a mode.
+    :param mode: the mode string (i.e. 'equ|hrs|ra'), or a CoordFrame
+    :return: the CoordFrame (None for None)
+    """
+    if (mode is None) or isinstance(mode, CoordFrame):
+        return mode
+    frame = FRAMES.get(mode)
+    if frame is None:
+        m, u, t = split_mode(mode)
+        key = make_mode(m, u, t) or mode
+        frame = FRAMES.get(key)
+        if frame is None:
+            frame = CoordFrame(key, m, u, t)
+            FRAMES[key] = frame
+        FRAMES[mode] = frame
+    return frame
+
+
+FRAME_HORIZON = get_frame(make_mode(COORD_MODE_HORIZON))
+FRAME_ECLIPTIC = get_frame(make_mode(COORD_MODE_ECLIPTIC))
+FRAME_GALACTIC = get_frame(make_mode(COORD_MODE_GALACTIC))
+FRAME_EQUATORIAL_RA = get_frame(make_mode(COORD_MODE_EQUATORIAL, COORD1_UNIT_HOURS, COORD1_TYPE_RA))
+FRAME_EQUATORIAL_HA = get_frame(make_mode(COORD_MODE_EQUATORIAL, COORD1_UNIT_HOURS, COORD1_TYPE_HA))
+
+
+class AstroCoord(object):
+    """
+    A coordinate, held as the decimal degrees of its two coordinates (decimal hours for the first coordinate when
+    the mode is in hours). The degrees (or hours), minutes and seconds are calculated from them when asked for,
+    so converting between modes does not round the seconds at every step.
+    """
+
+    __slots__ = ("dd1", "dd2", "frame", "date", "latitude")
 
     def __init__(self):
-        self.deg1 = None
-        self.min1 = None
-        self.sec1 = None
-        self.deg2 = None
-        self.min2 = None
-        self.sec2 = None
-        self.mode = None
+        self.dd1 = None
+        self.dd2 = None
+        self.frame = None
         self.date = None
         self.latitude = None
 
@@ -161,24 +494,36 @@ class AstroCoord:
         c.set_with_tuple(coord)
         return c
 
+    @staticmethod
+    def __dd_from_parts(d, m, s):
+        # the decimal degrees of degrees, minutes and seconds as the setters take them (a missing part is 0)
+        if mathutils.to_int(d, None) is None:
+            d = 0
+        return dd_from_dms(d, mathutils.to_int(m, 0), mathutils.to_float(s, 0.0))
+
+    @staticmethod
+    def __dms(dd):
+        if dd is None:
+            return None, None, None
+        return dms_from_dd(dd)
+
+    mode = property(lambda self: self.frame.mode if self.frame is not None else None,
+                    lambda self, mode: self.set_mode(mode))
+    deg1 = property(lambda self: self.__dms(self.dd1)[0])
+    min1 = property(lambda self: self.__dms(self.dd1)[1])
+    sec1 = property(lambda self: self.__dms(self.dd1)[2])
+    deg2 = property(lambda self: self.__dms(self.dd2)[0])
+    min2 = property(lambda self: self.__dms(self.dd2)[1])
+    sec2 = property(lambda self: self.__dms(self.dd2)[2])
+
     def add_coord1(self, d):
-        dd1 = self.get_dd1() + d
-        dd1 = normalize_dd1(dd1, self.is_hours())
-        d1, m1, s1 = dms_from_dd(dd1)
-        self.set_deg1(d1)
-        self.set_min1(m1)
-        self.set_sec1(s1)
+        self.dd1 = normalize_dd1(self.get_dd1() + d, self.is_hours())
 
     def add_coord2(self, d):
-        dd2 = self.get_dd2() + d
-        dd2 = normalize_dd2(dd2)
-        d2, m2, s2 = dms_from_dd(dd2)
-        self.set_deg2(d2)
-        self.set_min2(m2)
-        self.set_sec2(s2)
+        self.dd2 = normalize_dd2(self.get_dd2() + d)
 
     def calculate_angular_separation(self, coord2):
-        if (self.mode == coord2.mode) and (self.is_equatorial() or self.is_ecliptic()):
+        if (self.frame is get_frame(coord2.mode)) and (self.is_equatorial() or self.is_ecliptic()):
             c1_1 = self.get_dd1()
             c2_1 = coord2.get_dd1()
             if self.is_hours():
@@ -203,37 +548,26 @@ class AstroCoord:
         raise ValueError, "Invalid coordinate! (Must be Equatorial or Ecliptic)"
 
     def calculate_mean_obliquity(self, epochTD=None):
-        if epochTD is not None:
-            d = astrodate.AstroDate().alloc_with_epochTD(epochTD)
-        else:
-            if self.date is None:
-                raise ValueError, "Date (TD) is required!"
-            self.date.to_tdt()
-            d = self.date
-        n = earth.Nutation()
-        n.calculate_with_julianTD(d.get_julian())
-        return n.get_mean_obliquity()
+        return calculate_mean_obliquity(self.date, epochTD)
 
     def get_dd1(self):
-        return dd_from_dms(self.deg1, self.min1, self.sec1)
+        return self.dd1
 
     def get_dd2(self):
-        return dd_from_dms(self.deg2, self.min2, self.sec2)
+        return self.dd2
 
     def get_pretty_string(self, format="dms"):
         s = ""
         if format.lower() == "dms":
-            d1 = int(self.deg1)
-            m1 = int(self.min1)
-            s1 = self.sec1
-            d2 = int(self.deg2)
-            m2 = int(self.min2)
-            s2 = self.sec2
+            d1, m1, s1 = dms_from_dd(self.dd1)
+            d2, m2, s2 = dms_from_dd(self.dd2)
+            sign1 = "-" if self.dd1 < 0.0 else ""
+            sign2 = "-" if self.dd2 < 0.0 else "+"
             if self.is_hours():
-                s1 = "{:02d}h{:02d}m{:05.2f}s".format(d1, m1, s1)
+                s1 = "{}{:02d}h{:02d}m{:05.2f}s".format(sign1, abs(int(d1)), m1, s1)
             else:
-                s1 = "{:02d}d{:02d}m{:05.2f}s".format(d1, m1, s1)
-            s2 = " {:+02d}d{:02d}m{:05.2f}s".format(d2, m2, s2)
+                s1 = "{}{:02d}d{:02d}m{:05.2f}s".format(sign1, abs(int(d1)), m1, s1)
+            s2 = " {}{:d}d{:02d}m{:05.2f}s".format(sign2, abs(int(d2)), m2, s2)
             s = s1 + s2
         elif format.lower() == "d":
             d1 = self.get_dd1()
@@ -242,47 +576,56 @@ class AstroCoord:
         return s
 
     def get_tuple(self):
-        return self.deg1, self.min1, self.sec1, self.deg2, self.min2, self.sec2, self.mode
+        d1, m1, s1 = self.__dms(self.dd1)
+        d2, m2, s2 = self.__dms(self.dd2)
+        return d1, m1, s1, d2, m2, s2, self.mode
 
     def is_degrees(self):
-        mode = split_mode(self.mode)
-        return not (mode[0] == COORD_MODE_EQUATORIAL) or (mode[0] == COORD_MODE_EQUATORIAL) and (mode[1] == COORD1_UNIT_DEGREES)
+        return self.frame.degrees
 
     def is_ecliptic(self):
-        mode = split_mode(self.mode)
-        return mode[0] == COORD_MODE_ECLIPTIC
+        return self.frame.frame == COORD_MODE_ECLIPTIC
 
     def is_equatorial(self):
-        mode = split_mode(self.mode)
-        return mode[0] == COORD_MODE_EQUATORIAL
+        return self.frame.frame == COORD_MODE_EQUATORIAL
 
     def is_galactic(self):
-        mode = split_mode(self.mode)
-        return mode[0] == COORD_MODE_GALACTIC
+        return self.frame.frame == COORD_MODE_GALACTIC
 
     def is_horizon(self):
-        mode = split_mode(self.mode)
-        return mode[0] == COORD_MODE_HORIZON
+        return self.frame.frame == COORD_MODE_HORIZON
 
     def is_hours(self):
-        mode = split_mode(self.mode)
-        return (mode[0] == COORD_MODE_EQUATORIAL) and (mode[1] == COORD1_UNIT_HOURS)
+        return self.frame.hours
 
     def is_hour_angle(self):
-        mode = split_mode(self.mode)
-        return (mode[0] == COORD_MODE_EQUATORIAL) and (mode[2] == COORD1_TYPE_HA)
+        return self.frame.hour_angle
 
     def is_right_ascension(self):
-        mode = split_mode(self.mode)
-        return (mode[0] == COORD_MODE_EQUATORIAL) and (mode[2] == COORD1_TYPE_RA)
+        return self.frame.right_ascension
+
+    def precess(self, from_jde, to_jde=None):
+        """
+        Precess the equatorial coordinate (IAU 1976) from one epoch to another, keeping its unit and type.
+        :param from_jde: the epoch of the coordinate (julian date in dynamical time, i.e. astrodate.J2000)
+        :param to_jde: the epoch to precess to (julian date in dynamical time, defaults to the date)
+        """
+        frame = self.frame
+        if to_jde is None:
+            to_jde = calculate_julianTD(self.date)
+        self.to_right_ascension()
+        self.to_degrees()
+        self.dd1, self.dd2 = precess_angles(self.get_dd1(), self.get_dd2(), from_jde, to_jde)
+        if frame.hour_angle:
+            self.to_hour_angle()
+        if frame.hours:
+            self.to_hours()
+        else:
+            self.to_degrees()
 
     def set(self, deg1=None, min1=None, sec1=None, deg2=None, min2=None, sec2=None, mode=None):
-        self.set_deg1(deg1)
-        self.set_min1(min1)
-        self.set_sec1(sec1)
-        self.set_deg2(deg2)
-        self.set_min2(min2)
-        self.set_sec2(sec2)
+        self.dd1 = self.__dd_from_parts(deg1, min1, sec1)
+        self.dd2 = self.__dd_from_parts(deg2, min2, sec2)
         self.set_mode(mode)
 
     def set_date(self, date):
@@ -292,21 +635,17 @@ class AstroCoord:
             self.date = None
 
     def set_deg1(self, deg1):
-        d = 0
-        if deg1 is not None:
-            d = mathutils.to_int(deg1, 0)
-        self.deg1 = d
+        d, m, s = self.__dms(self.dd1)
+        self.dd1 = self.__dd_from_parts(deg1, m, s)
 
     def set_deg2(self, deg2):
-        d = 0
-        if deg2 is not None:
-            d = mathutils.to_int(deg2, 0)
-        self.deg2 = d
+        d, m, s = self.__dms(self.dd2)
+        self.dd2 = self.__dd_from_parts(deg2, m, s)
 
     def set_with_degrees(self, dd1, dd2, mode):
-        d1, m1, s1 = dms_from_dd(dd1)
-        d2, m2, s2 = dms_from_dd(dd2)
-        self.set(d1, m1, s1, d2, m2, s2, mode)
+        self.dd1 = float(dd1)
+        self.dd2 = float(dd2)
+        self.set_mode(mode)
 
     def set_with_tuple(self, coord):
         self.set(coord[0], coord[1], coord[2], coord[3], coord[4], coord[5], coord[6])
@@ -318,66 +657,48 @@ class AstroCoord:
         self.latitude = l
 
     def set_min1(self, min1):
-        m = 0
-        if min1 is not None:
-            m = mathutils.to_int(min1, 0)
-        self.min1 = m
+        d, m, s = self.__dms(self.dd1)
+        self.dd1 = self.__dd_from_parts(d, min1, s)
 
     def set_min2(self, min2):
-        m = 0
-        if min2 is not None:
-            m = mathutils.to_int(min2, 0)
-        self.min2 = m
+        d, m, s = self.__dms(self.dd2)
+        self.dd2 = self.__dd_from_parts(d, min2, s)
 
     def set_mode(self, mode):
-        self.mode = mode
+        """
+        Set the mode.
+        :param mode: the mode string (i.e. 'equ|hrs|ra') or CoordFrame
+        """
+        self.frame = get_frame(mode)
 
     def set_sec1(self, sec1):
-        s = 0
-        if sec1 is not None:
-            s = mathutils.to_float(sec1, 0.0)
-        self.sec1 = s
+        d, m, s = self.__dms(self.dd1)
+        self.dd1 = self.__dd_from_parts(d, m, sec1)
 
     def set_sec2(self, sec2):
-        s = 0
-        if sec2 is not None:
-            s = mathutils.to_float(sec2, 0.0)
-        self.sec2 = s
+        d, m, s = self.__dms(self.dd2)
+        self.dd2 = self.__dd_from_parts(d, m, sec2)
 
     def to_degrees(self):
         if not self.is_equatorial():
             raise ValueError, "Invalid coord! (Must be Equatorial)"
         if self.is_hours():
-            dd = self.get_dd1() * 15.0
-            d1, m1, s1 = dms_from_dd(dd)
-            mode_parts = split_mode(self.mode)
-            mode = make_mode(mode_parts[0], COORD1_UNIT_DEGREES, mode_parts[2])
-            self.set_deg1(d1)
-            self.set_min1(m1)
-            self.set_sec1(s1)
-            self.set_mode(mode)
+            self.dd1 = self.get_dd1() * 15.0
+            self.frame = self.frame.with_unit(COORD1_UNIT_DEGREES)
 
     def to_hour_angle(self):
         if not self.is_equatorial():
             raise ValueError, "Invalid coordinate! (Must be Equatorial)"
         if self.is_right_ascension():
             self.__equ_conv()
-            mode_parts = split_mode(self.mode)
-            mode = make_mode(mode_parts[0], mode_parts[1], COORD1_TYPE_HA)
-            self.set_mode(mode)
+            self.frame = self.frame.with_type(COORD1_TYPE_HA)
 
     def to_hours(self):
         if not self.is_equatorial():
             raise ValueError, "Invalid coordinate! (Must be Equatorial)"
         if self.is_degrees():
-            dd = self.get_dd1() / 15.0
-            d1, m1, s1 = dms_from_dd(dd)
-            mode_parts = split_mode(self.mode)
-            mode = make_mode(mode_parts[0], COORD1_UNIT_HOURS, mode_parts[2])
-            self.set_deg1(d1)
-            self.set_min1(m1)
-            self.set_sec1(s1)
-            self.set_mode(mode)
+            self.dd1 = self.get_dd1() / 15.0
+            self.frame = self.frame.with_unit(COORD1_UNIT_HOURS)
 
     def to_ecliptic(self):
         if self.is_ecliptic():
@@ -386,127 +707,56 @@ class AstroCoord:
         if not self.is_right_ascension():
             self.to_right_ascension()
         self.to_degrees()
-        a1 = self.get_dd1() * math.pi / 180.0
-        a2 = self.get_dd2() * math.pi / 180.0
-        e = self.calculate_mean_obliquity() * math.pi / 180.0
-        sin_a1 = math.sin(a1)
-        sin_e = math.sin(e)
-        cos_e = math.cos(e)
-        a4 = math.asin((math.sin(a2) * cos_e) - (math.cos(a2) * sin_a1 * sin_e)) * 180.0 / math.pi
-        y = (sin_a1 * cos_e) + (math.tan(a2) * sin_e)
-        x = math.cos(a1)
-        a3 = math.atan2(y, x) * 180.0 / math.pi
-        d1, m1, s1 = dms_from_dd(a3)
-        d2, m2, s2 = dms_from_dd(a4)
-        mode = make_mode(COORD_MODE_ECLIPTIC)
-        self.set_deg1(d1)
-        self.set_min1(m1)
-        self.set_sec1(s1)
-        self.set_deg2(d2)
-        self.set_min2(m2)
-        self.set_sec2(s2)
-        self.set_mode(mode)
+        self.dd1, self.dd2 = rotate_angles(self.get_dd1(), self.get_dd2(), COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC,
+                                           calculate_julianTD(self.date))
+        self.frame = FRAME_ECLIPTIC
 
     def to_equatorial(self, epochTD=None):
         if self.is_ecliptic():
-            a1deg = self.get_dd1()
-            a2deg = self.get_dd2()
-            a1rad = a1deg * math.pi / 180.0
-            a2rad = a2deg * math.pi / 180.0
-            edeg = self.calculate_mean_obliquity(epochTD)
-            erad = edeg * math.pi / 180.0
-            sin_a1 = math.sin(a1rad)
-            sin_e = math.sin(erad)
-            cos_e = math.cos(erad)
-            a4rad = math.asin((math.sin(a2rad) * cos_e) + (math.cos(a2rad) * sin_a1 * sin_e))
-            a4deg = a4rad * 180.0 / math.pi
-            y = (sin_a1 * cos_e) - (math.tan(a2rad) * sin_e)
-            x = math.cos(a1rad)
-            a3rad = math.atan2(y, x)
-            a3deg = a3rad * 180.0 / math.pi
-            d1, m1, s1 = dms_from_dd(a3deg / 15.0)
-            d2, m2, s2 = dms_from_dd(a4deg)
-            mode = make_mode(COORD_MODE_EQUATORIAL, COORD1_UNIT_HOURS, COORD1_TYPE_RA)
-            self.set_deg1(d1)
-            self.set_min1(m1)
-            self.set_sec1(s1)
-            self.set_deg2(d2)
-            self.set_min2(m2)
-            self.set_sec2(s2)
-            self.set_mode(mode)
+            ra, dec = rotate_angles(self.get_dd1(), self.get_dd2(), COORD_MODE_ECLIPTIC, COORD_MODE_EQUATORIAL,
+                                    calculate_julianTD(self.date, epochTD))
+            self.dd1 = ra / 15.0
+            self.dd2 = dec
+            self.frame = FRAME_EQUATORIAL_RA
         if self.is_horizon():
             if self.latitude is None:
                 raise ValueError, "Invalid latitude!"
             self.__to_equatorial_from_horizon()
-            mode = make_mode(COORD_MODE_EQUATORIAL, COORD1_UNIT_HOURS, COORD1_TYPE_HA)
-            self.mode = mode
+            self.frame = FRAME_EQUATORIAL_HA
         if self.is_galactic():
-            a1 = (self.get_dd1() - 33.0) * math.pi / 180.0
-            a2 = self.get_dd2() * math.pi / 180.0
-            a4 = math.asin((math.cos(a2) * 0.887815 * math.sin(a1)) + (math.sin(a2) * 0.4602)) * 180.0 / math.pi
-            y = math.cos(a2) * math.cos(a1)
-            x = (math.sin(a2) * 0.887815) - (math.cos(a2) * 0.4602 * math.sin(a1))
-            a3 = math.atan2(y, x) * 180.0 / math.pi
-            a3 += 192.25
-            if a3 >= 360.0:
-                a3 -= 360.0
-            d1, m1, s1 = dms_from_dd(a3 / 15.0)
-            d2, m2, s2 = dms_from_dd(a4)
-            mode = make_mode(COORD_MODE_EQUATORIAL, COORD1_UNIT_HOURS, COORD1_TYPE_RA)
-            self.set_deg1(d1)
-            self.set_min1(m1)
-            self.set_sec1(s1)
-            self.set_deg2(d2)
-            self.set_min2(m2)
-            self.set_sec2(s2)
-            self.set_mode(mode)
+            ra, dec = rotate_angles(self.get_dd1(), self.get_dd2(), COORD_MODE_GALACTIC, COORD_MODE_EQUATORIAL)
+            self.dd1 = ra / 15.0
+            self.dd2 = dec
+            self.frame = FRAME_EQUATORIAL_RA
 
     def to_galactic(self):
-        if self.is_ecliptic() or self.is_horizon():
+        if self.is_ecliptic():
+            self.dd1, self.dd2 = rotate_angles(self.get_dd1(), self.get_dd2(), COORD_MODE_ECLIPTIC,
+                                               COORD_MODE_GALACTIC, calculate_julianTD(self.date))
+            self.frame = FRAME_GALACTIC
+        if self.is_horizon():
             self.to_equatorial()
         if self.is_equatorial():
             if self.is_hour_angle():
                 self.to_right_ascension()
             self.to_degrees()
-            a1 = self.get_dd1() * math.pi / 180.0
-            a2 = self.get_dd2() * math.pi / 180.0
-            sin_b = (math.cos(a2) * 0.887815 * math.cos(a1 - 3.355395)) + (math.sin(a2) * 0.4602)
-            a3 = math.asin(sin_b) * 180.0 / math.pi
-            y = math.sin(a2) - (sin_b * 0.4602)
-            x = math.cos(a2) * math.sin(a1 - 3.355395) * 0.887815
-            a4 = math.atan2(y, x) * 180.0 / math.pi
-            if a4 < 0.0:
-                a4 += 360.0
-            a4 += 33.0
-            if a4 >= 360.0:
-                a4 -= 360.0
-            d1, m1, s1 = dms_from_dd(a4)
-            d2, m2, s2 = dms_from_dd(a3)
-            mode = make_mode(COORD_MODE_GALACTIC)
-            self.set_deg1(d1)
-            self.set_min1(m1)
-            self.set_sec1(s1)
-            self.set_deg2(d2)
-            self.set_min2(m2)
-            self.set_sec2(s2)
-            self.set_mode(mode)
+            self.dd1, self.dd2 = rotate_angles(self.get_dd1(), self.get_dd2(), COORD_MODE_EQUATORIAL,
+                                               COORD_MODE_GALACTIC)
+            self.frame = FRAME_GALACTIC
 
     def to_horizon(self):
         if self.is_ecliptic() or self.is_galactic():
             self.to_equatorial()
         if self.is_equatorial():
             self.__to_horizon_from_equatorial()
-            mode = make_mode(COORD_MODE_HORIZON)
-            self.set_mode(mode)
+            self.frame = FRAME_HORIZON
 
     def to_right_ascension(self):
         if not self.is_equatorial():
             raise ValueError, "Invalid coordinate! (Must be Equatorial)"
         if self.is_hour_angle():
             self.__equ_conv()
-            mode_parts = split_mode(self.mode)
-            mode = make_mode(mode_parts[0], mode_parts[1], COORD1_TYPE_RA)
-            self.set_mode(mode)
+            self.frame = self.frame.with_type(COORD1_TYPE_RA)
 
     def __equ_conv(self):
         if self.date is None:
@@ -518,10 +768,7 @@ class AstroCoord:
         a3 = a2 - a1
         while a3 < 0.0:
             a3 += 24.0
-        d, m, s = dms_from_dd(a3)
-        self.set_deg1(d)
-        self.set_min1(m)
-        self.set_sec1(s)
+        self.dd1 = a3
 
     def __to_equatorial_from_horizon(self):
         alt_deg = self.get_dd1()
@@ -544,14 +791,8 @@ class AstroCoord:
         if sin_az >= 0.0:
             ha_deg = 360.0 - ha_deg
         ha_deg /= 15.0
-        d1, m1, s1 = dms_from_dd(ha_deg)
-        d2, m2, s2 = dms_from_dd(dec_deg)
-        self.set_deg1(d1)
-        self.set_min1(m1)
-        self.set_sec1(s1)
-        self.set_deg2(d2)
-        self.set_min2(m2)
-        self.set_sec2(s2)
+        self.dd1 = ha_deg
+        self.dd2 = dec_deg
 
     def __to_horizon_from_equatorial(self):
         self.to_hours()
@@ -576,14 +817,272 @@ class AstroCoord:
         az_deg = math.acos(cos_az) * 180.0 / math.pi
         if sin_ha >= 0.0:
             az_deg = 360.0 - az_deg
-        d1, m1, s1 = dms_from_dd(alt_deg)
-        d2, m2, s2 = dms_from_dd(az_deg)
-        self.set_deg1(d1)
-        self.set_min1(m1)
-        self.set_sec1(s1)
-        self.set_deg2(d2)
-        self.set_min2(m2)
-        self.set_sec2(s2)
+        self.dd1 = alt_deg
+        self.dd2 = az_deg
+
+
+class AstroCoordArray(object):
+    """
+    An array of coordinates sharing one mode, date and latitude, held as arrays of decimal degrees (decimal hours
+    for the first coordinate when the mode is in hours) rather than as degrees, minutes and seconds.
+    The conversions are those of AstroCoord done for every coordinate at once, and match AstroCoord element by
+    element. Unlike AstroCoord, the date is not converted.
+    """
+
+    def __init__(self):
+        self.dd1 = None
+        self.dd2 = None
+        self.frame = None
+        self.date = None
+        self.latitude = None
+
+    @staticmethod
+    def alloc_with_coords(coords):
+        a = AstroCoordArray()
+        a.set_with_coords(coords)
+        return a
+
+    @staticmethod
+    def alloc_with_degrees(dd1, dd2, mode):
+        a = AstroCoordArray()
+        a.set_with_degrees(dd1, dd2, mode)
+        return a
+
+    mode = property(lambda self: self.frame.mode if self.frame is not None else None,
+                    lambda self, mode: self.set_mode(mode))
+
+    def __len__(self):
+        if self.dd1 is None:
+            return 0
+        return len(self.dd1)
+
+    def __get_lst(self):
+        # the local sidereal time of the date (in decimal hours), from a copy of the date
+        if self.date is None:
+            raise ValueError("Date (LST) is required!")
+        d = astrodate.AstroDate.alloc_with_date(self.date)
+        d.to_lst()
+        return d.get_decimal_hours()
+
+    def __get_latitude(self):
+        if self.latitude is None:
+            raise ValueError("Invalid latitude!")
+        return self.latitude * (math.pi / 180.0)
+
+    def calculate_mean_obliquity(self, epochTD=None):
+        return calculate_mean_obliquity(self.date, epochTD)
+
+    def get_coord(self, i):
+        """
+        Get one coordinate.
+        :param i: the index of the coordinate
+        :return: the AstroCoord (with the date and latitude of the array)
+        """
+        c = AstroCoord.alloc_with_degrees(float(self.dd1[i]), float(self.dd2[i]), self.frame)
+        c.set_date(self.date)
+        if self.latitude is not None:
+            c.set_latitude(float(np.broadcast_to(self.latitude, self.dd1.shape)[i]))
+        return c
+
+    def get_dd1(self):
+        return self.dd1
+
+    def get_dd2(self):
+        return self.dd2
+
+    def get_mode(self):
+        return self.mode
+
+    def is_degrees(self):
+        return self.frame.degrees
+
+    def is_ecliptic(self):
+        return self.frame.frame == COORD_MODE_ECLIPTIC
+
+    def is_equatorial(self):
+        return self.frame.frame == COORD_MODE_EQUATORIAL
+
+    def is_galactic(self):
+        return self.frame.frame == COORD_MODE_GALACTIC
+
+    def is_horizon(self):
+        return self.frame.frame == COORD_MODE_HORIZON
+
+    def is_hours(self):
+        return self.frame.hours
+
+    def is_hour_angle(self):
+        return self.frame.hour_angle
+
+    def is_right_ascension(self):
+        return self.frame.right_ascension
+
+    def precess(self, from_jde, to_jde=None):
+        """
+        Precess the equatorial coordinates (IAU 1976) from one epoch to another with one matrix product, keeping
+        their unit and type.
+        :param from_jde: the epoch of the coordinates (julian date in dynamical time, i.e. astrodate.J2000)
+        :param to_jde: the epoch to precess to (julian date in dynamical time, defaults to the date)
+        """
+        frame = self.frame
+        if to_jde is None:
+            to_jde = calculate_julianTD(self.date)
+        self.to_right_ascension()
+        self.to_degrees()
+        self.dd1, self.dd2 = precess_angles(self.dd1, self.dd2, from_jde, to_jde)
+        if frame.hour_angle:
+            self.to_hour_angle()
+        if frame.hours:
+            self.to_hours()
+        else:
+            self.to_degrees()
+
+    def set_date(self, date):
+        self.date = date
+
+    def set_latitude(self, latitudes):
+        """
+        Set the latitude of the observer.
+        :param latitudes: the latitude (in degrees), or an array of latitudes matching the coordinates
+        """
+        self.latitude = mathutils.normalize_array(latitudes, -90.0, 90.0)
+
+    def set_mode(self, mode):
+        self.frame = get_frame(mode)
+
+    def set_with_coords(self, coords):
+        """
+        Set from coordinates, which must all have the same mode.
+        :param coords: a sequence of AstroCoord
+        """
+        frames = set(c.frame for c in coords)
+        if len(frames) != 1:
+            raise ValueError("Invalid coordinates! (Must all have one mode)")
+        self.set_with_degrees([c.get_dd1() for c in coords], [c.get_dd2() for c in coords], frames.pop())
+
+    def set_with_degrees(self, dd1, dd2, mode):
+        """
+        Set from decimal degrees.
+        :param dd1: the first coordinates (in decimal degrees, or decimal hours when the mode is in hours)
+        :param dd2: the second coordinates (in decimal degrees)
+        :param mode: the mode of the coordinates (i.e. 'equ|hrs|ra', or a CoordFrame)
+        """
+        self.dd1 = np.atleast_1d(np.array(dd1, dtype=np.float64))
+        self.dd2 = np.atleast_1d(np.array(dd2, dtype=np.float64))
+        if self.dd1.shape != self.dd2.shape:
+            raise ValueError("Invalid coordinates! (The arrays must match)")
+        self.set_mode(mode)
+
+    def to_degrees(self):
+        if not self.is_equatorial():
+            raise ValueError("Invalid coord! (Must be Equatorial)")
+        if self.is_hours():
+            self.dd1 = self.dd1 * 15.0
+            self.frame = self.frame.with_unit(COORD1_UNIT_DEGREES)
+
+    def to_ecliptic(self):
+        if self.is_ecliptic():
+            return
+        self.to_equatorial()
+        if not self.is_right_ascension():
+            self.to_right_ascension()
+        self.to_degrees()
+        self.dd1, self.dd2 = rotate_angles(self.dd1, self.dd2, COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC,
+                                           calculate_julianTD(self.date))
+        self.frame = FRAME_ECLIPTIC
+
+    def to_equatorial(self, epochTD=None):
+        toRad = math.pi / 180.0
+        if self.is_ecliptic():
+            ra, dec = rotate_angles(self.dd1, self.dd2, COORD_MODE_ECLIPTIC, COORD_MODE_EQUATORIAL,
+                                    calculate_julianTD(self.date, epochTD))
+            self.dd1 = ra / 15.0
+            self.dd2 = dec
+            self.frame = FRAME_EQUATORIAL_RA
+        if self.is_horizon():
+            lat = self.__get_latitude()
+            alt = self.dd1 * toRad
+            az = self.dd2 * toRad
+            sin_alt = np.sin(alt)
+            sin_lat = np.sin(lat)
+            cos_lat = np.cos(lat)
+            sin_dec = (sin_alt * sin_lat) + (np.cos(alt) * cos_lat * np.cos(az))
+            dec = np.arcsin(sin_dec)
+            cos_ha = (sin_alt - (sin_lat * sin_dec)) / (cos_lat * np.cos(dec))
+            ha = np.arccos(np.clip(cos_ha, -1.0, 1.0)) / toRad
+            ha = np.where(np.sin(az) >= 0.0, 360.0 - ha, ha)
+            self.dd1 = ha / 15.0
+            self.dd2 = dec / toRad
+            self.frame = FRAME_EQUATORIAL_HA
+        if self.is_galactic():
+            ra, dec = rotate_angles(self.dd1, self.dd2, COORD_MODE_GALACTIC, COORD_MODE_EQUATORIAL)
+            self.dd1 = ra / 15.0
+            self.dd2 = dec
+            self.frame = FRAME_EQUATORIAL_RA
+
+    def to_galactic(self):
+        if self.is_ecliptic():
+            self.dd1, self.dd2 = rotate_angles(self.dd1, self.dd2, COORD_MODE_ECLIPTIC, COORD_MODE_GALACTIC,
+                                               calculate_julianTD(self.date))
+            self.frame = FRAME_GALACTIC
+        if self.is_horizon():
+            self.to_equatorial()
+        if self.is_equatorial():
+            if self.is_hour_angle():
+                self.to_right_ascension()
+            self.to_degrees()
+            self.dd1, self.dd2 = rotate_angles(self.dd1, self.dd2, COORD_MODE_EQUATORIAL, COORD_MODE_GALACTIC)
+            self.frame = FRAME_GALACTIC
+
+    def to_horizon(self):
+        if self.is_ecliptic() or self.is_galactic():
+            self.to_equatorial()
+        if self.is_equatorial():
+            lat = self.__get_latitude()
+            self.to_hours()
+            self.to_hour_angle()
+            self.to_degrees()
+            toRad = math.pi / 180.0
+            ha = self.dd1 * toRad
+            dec = self.dd2 * toRad
+            sin_dec = np.sin(dec)
+            sin_lat = np.sin(lat)
+            cos_lat = np.cos(lat)
+            sin_alt = (sin_dec * sin_lat) + (np.cos(dec) * cos_lat * np.cos(ha))
+            alt = np.arcsin(sin_alt)
+            cos_az = (sin_dec - (sin_lat * sin_alt)) / (cos_lat * np.cos(alt))
+            az = np.arccos(np.clip(cos_az, -1.0, 1.0)) / toRad
+            self.dd1 = alt / toRad
+            self.dd2 = np.where(np.sin(ha) >= 0.0, 360.0 - az, az)
+            self.frame = FRAME_HORIZON
+
+    def to_hour_angle(self):
+        if not self.is_equatorial():
+            raise ValueError("Invalid coordinate! (Must be Equatorial)")
+        if self.is_right_ascension():
+            self.__equ_conv()
+            self.frame = self.frame.with_type(COORD1_TYPE_HA)
+
+    def to_hours(self):
+        if not self.is_equatorial():
+            raise ValueError("Invalid coordinate! (Must be Equatorial)")
+        if self.is_degrees():
+            self.dd1 = self.dd1 / 15.0
+            self.frame = self.frame.with_unit(COORD1_UNIT_HOURS)
+
+    def to_right_ascension(self):
+        if not self.is_equatorial():
+            raise ValueError("Invalid coordinate! (Must be Equatorial)")
+        if self.is_hour_angle():
+            self.__equ_conv()
+            self.frame = self.frame.with_type(COORD1_TYPE_RA)
+
+    def __equ_conv(self):
+        # the hour angle from the right ascension, or the right ascension from the hour angle
+        lst = self.__get_lst()
+        self.to_hours()
+        h = lst - self.dd1
+        self.dd1 = np.where(h < 0.0, h + 24.0, h)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import unittest
 import astrodate
+import numpy
 from astrocoord import *
 
 
@@ -48,6 +49,29 @@ class Test_Coord(unittest.TestCase):
         t = c.get_tuple()
         self.assertTupleEqual(t, (9, 34, 53.58, 19, 32, 14.18, u'equ|hrs|ra'))
 
+    def test_chained_conversions(self):
+        d = astrodate.AstroDate().alloc_with_tuple((1998, 8, 10, 23, 10, 0.0, u'utc'))
+        d.set_longitude(-1.9166667)
+        c = AstroCoord.alloc_with_degrees(16.695, 36.466667, u'equ|hrs|ra')
+        c.set_date(d)
+        c.set_latitude(52.5)
+        for i in range(20):
+            c.to_ecliptic()
+            c.to_galactic()
+            c.to_horizon()
+            c.to_equatorial()
+            c.to_right_ascension()
+            c.to_hours()
+        # the seconds are not rounded between the conversions and the rotations are exact inverses, so they do not drift
+        self.assertAlmostEqual(c.get_dd1(), 16.695, 9)
+        self.assertAlmostEqual(c.get_dd2(), 36.466667, 9)
+
+        c = AstroCoord.alloc_with_degrees(-0.8333, 0.0, u'hor')
+        self.assertTupleEqual(c.get_tuple(), (0, 49, 59.88, 0, 0, 0.0, u'hor'))
+        c = AstroCoord.alloc_with_tuple(c.get_tuple())
+        self.assertAlmostEqual(c.get_dd1(), -0.8333, 9)
+        self.assertEqual(c.get_pretty_string(), "-00d49m59.88s +0d00m00.00s")
+
     def test_equatorial_mode(self):
         d = astrodate.AstroDate()
         d.set_longitude(-64.0)
@@ -82,6 +106,13 @@ class Test_Coord(unittest.TestCase):
         t = c.get_tuple()
         self.assertTupleEqual(t, (139, 41, 9.29, 4, 52, 22.00, u'ecl'))
 
+        # the date of the coordinate is not converted
+        d = astrodate.AstroDate().alloc_with_tuple((1950, 1, 1, 11, 59, 30.0, u'utc'))
+        c.set_date(d)
+        c.set_with_tuple((9, 34, 53.6, 19, 32, 14.2, u'equ|hrs|ra'))
+        c.to_ecliptic()
+        self.assertTupleEqual(d.get_tuple(), (1950, 1, 1, 11, 59, 30.0, u'utc'))
+
     def test_equatorial_to_galactic(self):
         d = astrodate.AstroDate().alloc_with_julian(astrodate.J1950, "tdt")
         c = AstroCoord()
@@ -93,7 +124,7 @@ class Test_Coord(unittest.TestCase):
         c.to_galactic()
         # print(c.get_pretty_coordinate())
         t = c.get_tuple()
-        self.assertTupleEqual(t, (232, 14, 52.51, 51, 7, 20.16, u'gal'))
+        self.assertTupleEqual(t, (232, 14, 52.38, 51, 7, 20.16, u'gal'))
 
     def test_equatorial_to_horizon(self):
         c = AstroCoord()
@@ -120,7 +151,7 @@ class Test_Coord(unittest.TestCase):
         c.to_horizon()
         # print(c.get_pretty_coordinate())
         t = c.get_tuple()
-        self.assertTupleEqual(t, (77, 21, 40.56, 39, 33, 35.22, u'hor'))
+        self.assertTupleEqual(t, (77, 21, 40.57, 39, 33, 35.2, u'hor'))
 
         # print
 
@@ -138,6 +169,26 @@ class Test_Coord(unittest.TestCase):
         t = c.get_tuple()
         self.assertTupleEqual(t, (49, 10, 7.93, 269, 8, 48.01, u'hor'))
 
+    def test_frames(self):
+        frame = get_frame(u'equ|hrs|ra')
+        self.assertIs(get_frame('EQU|HRS|RA'), frame)
+        self.assertIs(get_frame(frame), frame)
+        self.assertIs(frame, FRAME_EQUATORIAL_RA)
+        self.assertIsNone(get_frame(None))
+        self.assertTupleEqual((frame.frame, frame.unit, frame.type), (u'equ', u'hrs', u'ra'))
+        self.assertTrue(frame.hours and frame.right_ascension)
+        self.assertFalse(frame.degrees or frame.hour_angle)
+        self.assertIs(frame.with_unit(COORD1_UNIT_DEGREES).with_type(COORD1_TYPE_HA), get_frame(u'equ|deg|ha'))
+        self.assertRaises(AttributeError, setattr, frame, 'unit', COORD1_UNIT_DEGREES)
+
+        c = AstroCoord.alloc_with_tuple((5, 51, 44.0, 23, 13, 10.0, u'Equ|Hrs|HA'))
+        self.assertIs(c.frame, FRAME_EQUATORIAL_HA)
+        self.assertEqual(c.mode, u'equ|hrs|ha')
+        c.mode = u'equ|deg|ha'
+        self.assertTrue(c.is_degrees())
+        c.set_mode(FRAME_ECLIPTIC)
+        self.assertTupleEqual(c.get_tuple(), (5, 51, 44.0, 23, 13, 10.0, u'ecl'))
+
     def test_galactic_to_equatorial(self):
         d = astrodate.AstroDate().alloc_with_julian(astrodate.J1950, "tdt")
         c = AstroCoord()
@@ -149,7 +200,7 @@ class Test_Coord(unittest.TestCase):
         c.to_equatorial()
         # print(c.get_pretty_coordinate())
         t = c.get_tuple()
-        self.assertTupleEqual(t, (10, 21, 0.00, 10, 3, 10.98, 'equ|hrs|ra'))
+        self.assertTupleEqual(t, (10, 21, 0.00, 10, 3, 10.93, 'equ|hrs|ra'))
 
     def test_horizon_to_equatorial(self):
         c = AstroCoord()
@@ -204,6 +255,131 @@ class Test_Coord(unittest.TestCase):
         t = c.get_tuple()
         self.assertTupleEqual(t, (16, 41, 42.0, 36, 28, 0.0, 'equ|hrs|ra'))
 
+    def test_precession(self):
+        # theta Persei, with its proper motion to 2028 November 13.19 TD (Meeus, Astronomical Algorithms, 21.b)
+        jde = 2462088.69
+        c = AstroCoord.alloc_with_tuple((2, 44, 11.986, 49, 13, 42.48, u'equ|hrs|ra'))
+        c.set_with_degrees(c.get_dd1() + (0.03425 * 28.86705 / 3600.0), c.get_dd2() - (0.0895 * 28.86705 / 3600.0),
+                           c.mode)
+        c.precess(astrodate.J2000, jde)
+        self.assertEqual(c.mode, u'equ|hrs|ra')
+        self.assertAlmostEqual(c.get_dd1() * 15.0, 41.547214, 5)
+        self.assertAlmostEqual(c.get_dd2(), 49.348483, 5)
+        self.assertTupleEqual(c.get_tuple(), (2, 46, 11.33, 49, 20, 54.54, u'equ|hrs|ra'))
+
+        # back again, and to the date of the coordinate
+        c.precess(jde, astrodate.J2000)
+        self.assertAlmostEqual(c.get_dd1(), 2.0 + (44.0 / 60.0) + ((11.986 + (0.03425 * 28.86705)) / 3600.0), 10)
+        c.set_date(astrodate.AstroDate().alloc_with_julian(jde, "tdt"))
+        c.precess(astrodate.J2000)
+        self.assertTupleEqual(c.get_tuple(), (2, 46, 11.33, 49, 20, 54.54, u'equ|hrs|ra'))
+
+        hits = ROTATION_CACHE.get_hits()
+        m = get_precession_matrix(astrodate.J2000, jde)
+        self.assertEqual(ROTATION_CACHE.get_hits(), hits + 1)
+        self.assertTrue(numpy.allclose(m.dot(m.T), numpy.eye(3), 0.0, 1.0E-15))
+        self.assertTrue(numpy.allclose(get_precession_matrix(jde, astrodate.J2000), m.T, 0.0, 1.0E-12))
+        self.assertTrue(numpy.array_equal(get_precession_matrix(jde, jde), numpy.eye(3)))
+        self.assertRaises(ValueError, AstroCoord.alloc_with_degrees(10.0, 20.0, u'ecl').precess, astrodate.J2000, jde)
+        self.assertRaises(ValueError, AstroCoord.alloc_with_degrees(10.0, 20.0, u'equ|deg|ra').precess, jde)
+
+    def test_rotation_matrices(self):
+        jde = astrodate.J2000
+        frames = (COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC, COORD_MODE_GALACTIC)
+        for f1 in frames:
+            for f2 in frames:
+                m = get_rotation_matrix(f1, f2, jde)
+                self.assertTrue(numpy.allclose(m.dot(m.T), numpy.eye(3), 0.0, 1.0E-15))
+                self.assertTrue(numpy.allclose(get_rotation_matrix(f2, f1, jde), m.T, 0.0, 1.0E-15))
+        hits = ROTATION_CACHE.get_hits()
+        get_rotation_matrix(COORD_MODE_EQUATORIAL, COORD_MODE_GALACTIC)
+        self.assertEqual(ROTATION_CACHE.get_hits(), hits + 1)
+        self.assertRaises(ValueError, get_rotation_matrix, COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC)
+
+        # the galactic pole and the ascending node of the galactic plane
+        l, b = rotate_angles(GALACTIC_POLE_RA, GALACTIC_POLE_DEC, COORD_MODE_EQUATORIAL, COORD_MODE_GALACTIC)
+        self.assertAlmostEqual(b, 90.0, 9)
+        l, b = rotate_angles(GALACTIC_POLE_RA + 90.0, 0.0, COORD_MODE_EQUATORIAL, COORD_MODE_GALACTIC)
+        self.assertAlmostEqual(l, GALACTIC_NODE_LONGITUDE, 9)
+        self.assertAlmostEqual(b, 0.0, 9)
+
+        # a batch of coordinates rotates as the single coordinates do
+        ra = numpy.array([0.0, 45.0, 201.3, 359.9])
+        dec = numpy.array([-89.0, 10.0, -30.5, 60.0])
+        lng, lat = rotate_angles(ra, dec, COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC, jde)
+        for i in range(len(ra)):
+            l, b = rotate_angles(ra[i], dec[i], COORD_MODE_EQUATORIAL, COORD_MODE_ECLIPTIC, jde)
+            self.assertAlmostEqual(lng[i], l, 12)
+            self.assertAlmostEqual(lat[i], b, 12)
+
+
+class Test_CoordArray(unittest.TestCase):
+
+    def setUp(self):
+        self.date = astrodate.AstroDate()
+        self.date.set_longitude(-1.9166667)
+        self.date.set_with_tuple((1998, 8, 10, 23, 10, 0.0, u'utc'))
+        self.latitude = 52.5
+        rng = numpy.random.RandomState(7)
+        self.ra = rng.uniform(0.0, 24.0, 200)
+        self.dec = rng.uniform(-85.0, 85.0, 200)
+
+    def assertMatches(self, coords, a, places=9):
+        self.assertEqual(a.get_mode(), coords[0].mode)
+        period = 24.0 if a.is_hours() else 360.0
+        for i, c in enumerate(coords):
+            d1 = (a.get_dd1()[i] - c.get_dd1() + (period / 2.0)) % period - (period / 2.0)
+            self.assertAlmostEqual(d1, 0.0, places)
+            self.assertAlmostEqual(a.get_dd2()[i], c.get_dd2(), places)
+
+    def convert(self, dd1, dd2, mode, conversion):
+        coords = [AstroCoord.alloc_with_degrees(float(d1), float(d2), mode) for d1, d2 in zip(dd1, dd2)]
+        for c in coords:
+            c.set_date(astrodate.AstroDate.alloc_with_date(self.date))
+            c.set_latitude(self.latitude)
+        a = AstroCoordArray.alloc_with_coords(coords)
+        a.set_date(self.date)
+        a.set_latitude(self.latitude)
+        getattr(a, conversion)()
+        for c in coords:
+            getattr(c, conversion)()
+        self.assertMatches(coords, a)
+        return a
+
+    def test_conversions(self):
+        mode = make_mode(COORD_MODE_EQUATORIAL, COORD1_UNIT_HOURS, COORD1_TYPE_RA)
+        ecl = self.convert(self.ra, self.dec, mode, "to_ecliptic")
+        self.convert(ecl.get_dd1(), ecl.get_dd2(), ecl.get_mode(), "to_equatorial")
+        gal = self.convert(self.ra, self.dec, mode, "to_galactic")
+        self.convert(gal.get_dd1(), gal.get_dd2(), gal.get_mode(), "to_equatorial")
+        hor = self.convert(self.ra, self.dec, mode, "to_horizon")
+        self.convert(hor.get_dd1(), hor.get_dd2(), hor.get_mode(), "to_equatorial")
+        self.assertTupleEqual(self.date.get_tuple(), (1998, 8, 10, 23, 10, 0.0, u'utc'))
+
+    def test_precession(self):
+        jde = 2462088.69
+        coords = [AstroCoord.alloc_with_degrees(float(ra), float(dec), u'equ|hrs|ra')
+                  for ra, dec in zip(self.ra, self.dec)]
+        a = AstroCoordArray.alloc_with_coords(coords)
+        a.precess(astrodate.J2000, jde)
+        for c in coords:
+            c.precess(astrodate.J2000, jde)
+        self.assertMatches(coords, a, 12)
+        a.precess(jde, astrodate.J2000)
+        d1 = (a.get_dd1() - self.ra + 12.0) % 24.0 - 12.0
+        self.assertTrue(numpy.allclose(d1, 0.0, 0.0, 1.0E-10))
+        self.assertTrue(numpy.allclose(a.get_dd2(), self.dec, 0.0, 1.0E-10))
+
+    def test_horizon(self):
+        a = AstroCoordArray.alloc_with_degrees([16.695], [36.466667], u'equ|hrs|ra')
+        a.set_date(self.date)
+        a.set_latitude(self.latitude)
+        self.assertTupleEqual(a.get_coord(0).get_tuple(), (16, 41, 42.0, 36, 28, 0.0, u'equ|hrs|ra'))
+        a.to_horizon()
+        self.assertAlmostEqual(a.get_dd1()[0], 49.168869, 5)
+        self.assertAlmostEqual(a.get_dd2()[0], 269.146670, 5)
+        self.assertRaises(ValueError, AstroCoordArray.alloc_with_degrees, [1.0, 2.0], [3.0], u'ecl')
+
 
 if __name__ == '__main__':
 
@@ -1,6 +1,7 @@
 import deltat
 import math
 import mathutils
+import numpy as np
 import time
 
 
@@ -19,6 +20,8 @@ TIME_MODES = [TIME_MODE_LCT, TIME_MODE_UTC, TIME_MODE_TDT, TIME_MODE_GST, TIME_M
 DATETIME_PRINT_FORMAT = '%b %d, %Y %H:%M:%S'
 TIME_SECONDS_PRECISION = 2
 SECONDS_MAX = None
+GREGORIAN_START = (1582, 10, 15)    # the first date of the Gregorian calendar (earlier dates are Julian)
+GREGORIAN_START_DAY = 2299161       # the day number of GREGORIAN_START
 
 
 def calculate_julian(year, month, day, hours=None, minutes=None, seconds=None):
@@ -38,10 +41,11 @@ def calculate_julian(year, month, day, hours=None, minutes=None, seconds=None):
     hrs = mathutils.to_int(hours)
     mns = mathutils.to_int(minutes)
     scs = mathutils.to_float(seconds)
+    gregorian = (yr, mth, day) >= GREGORIAN_START
     if mth <= 2:
         yr -= 1
         mth += 12
-    if yr >= 1582:
+    if gregorian:
         A = yr / 100
         B = 2 - A + (A / 4)
     else:
@@ -56,6 +60,84 @@ def calculate_julian(year, month, day, hours=None, minutes=None, seconds=None):
         hrs)) / 24.0
 
 
+def calculate_day_number(year, month, day):
+    """
+    Calculate the day number of a date (the julian date at noon), with the calendars of calculate_julian.
+    :param year:    the year (an int)
+    :param month:   the month (an int)
+    :param day:     the day (an int)
+    :return:        the day number
+    """
+    gregorian = (year, month, day) >= GREGORIAN_START
+    if month <= 2:
+        year -= 1
+        month += 12
+    if gregorian:
+        A = year // 100
+        B = 2 - A + (A // 4)
+    else:
+        B = 0
+    return 1720995 + B + ((1461 * year) // 4) + ((306001 * (month + 1)) // 10000) + day
+
+
+def calendar_from_day_number(n):
+    """
+    Calculate the date of a day number (the julian date at noon), with the calendars of calculate_julian.
+    The divisions of Meeus' algorithm are done exactly on integers (rounding down), so it holds for negative days.
+    :param n:   the day number (an int)
+    :return:    the date tuple (year, month, day)
+    """
+    if n >= GREGORIAN_START_DAY:
+        A = ((4 * n) - 7468865) // 146097
+        B = n + 1 + A - (A // 4)
+    else:
+        B = n
+    C = B + 1524
+    D = ((20 * C) - 2442) // 7305
+    E = (1461 * D) // 4
+    G = (10000 * (C - E)) // 306001
+    day = C - E - ((306001 * G) // 10000)
+    if G < 14:
+        month = G - 1
+    else:
+        month = G - 13
+    if month > 2:
+        return D - 4716, month, day
+    return D - 4715, month, day
+
+
+def calendar_from_julian(jds, precision=TIME_SECONDS_PRECISION):
+    """
+    Calculate the dates and times of an array of julian dates (with the calendars of calculate_julian).
+    :param jds:         the julian dates (a sequence or ndarray)
+    :param precision:   the digits of the seconds to round to, carrying into the minutes (None for no rounding)
+    :return:            the years, months, days, hours, minutes (int ndarrays) and seconds (a float ndarray)
+    """
+    jd = np.asarray(jds, dtype=np.float64) + 0.5
+    n = np.floor(jd).astype(np.int64)
+    seconds = (jd - n) * 86400.0
+    if precision is not None:
+        seconds = np.floor((seconds * (10.0 ** precision)) + 0.5) / (10.0 ** precision)
+        carry = seconds >= 86400.0
+        n = n + carry
+        seconds = np.where(carry, seconds - 86400.0, seconds)
+    A = ((4 * n) - 7468865) // 146097
+    B = np.where(n >= GREGORIAN_START_DAY, n + 1 + A - (A // 4), n)
+    C = B + 1524
+    D = ((20 * C) - 2442) // 7305
+    E = (1461 * D) // 4
+    G = (10000 * (C - E)) // 306001
+    days = C - E - ((306001 * G) // 10000)
+    months = np.where(G < 14, G - 1, G - 13)
+    years = np.where(months > 2, D - 4716, D - 4715)
+    hours = (seconds // 3600.0).astype(np.int64)
+    minutes = ((seconds // 60.0) % 60).astype(np.int64)
+    seconds = seconds - (60.0 * (seconds // 60.0))
+    if precision is not None:
+        seconds = np.round(seconds, precision)
+    return years, months, days, hours, minutes, seconds
+
+
 def dh_from_hms(hours, minutes, seconds):
     """
     Converts a time to decimal hours.
@@ -132,6 +214,27 @@ def get_max_seconds():
     return SECONDS_MAX
 
 
+def gst_from_julian(jds, precision=None):
+    """
+    Calculate the greenwich mean sidereal times of an array of julian dates (as AstroDate.to_gst does).
+    :param jds:         the julian dates (in universal time, a float or an array)
+    :param precision:   the digits of the seconds to round to as AstroDate does (None for no rounding)
+    :return:            the sidereal times (in decimal hours, matching jds)
+    """
+    jds = np.asarray(jds, dtype=np.float64)
+    jd0 = np.floor(jds - 0.5) + 0.5
+    T = (jd0 - 2451545.0) / 36525.0
+    T0 = np.mod(6.69737455833 + (T * (2400.0513369 + (T * 0.00002586222 + (T * 0.00000000172)))), 24.0)
+    if precision is not None:
+        # the time of day from the hours, minutes and rounded seconds of the date, as held by AstroDate
+        sf = 10.0 ** precision
+        units = np.floor(((jds - jd0) * 86400.0 * sf) + 0.5)
+        H = (((np.mod(units, 60.0 * sf) / sf / 60.0) + np.mod(units // (60.0 * sf), 60.0)) / 60.0) + \
+            (units // (3600.0 * sf))
+        return round_hours(np.mod(T0 + (1.002737909 * H), 24.0), precision)
+    return np.mod(T0 + (1.002737909 * ((jds - jd0) * 24.0)), 24.0)
+
+
 def hms_from_dh(dh):
     """
     Converts decimal hours to a time tuple.
@@ -162,6 +265,62 @@ def is_leap_year(year):
     return None
 
 
+def julian_from_calendar(years, months, days, hours=0, minutes=0, seconds=0.0):
+    """
+    Calculate the julian dates of arrays of dates and times (with the calendars of calculate_julian).
+    The arguments broadcast together and the seconds are not rounded.
+    :param years:   the years (ints)
+    :param months:  the months (ints)
+    :param days:    the days (ints)
+    :param hours:   the hours
+    :param minutes: the minutes
+    :param seconds: the seconds
+    :return:        the julian dates (an ndarray)
+    """
+    y = np.asarray(years, dtype=np.int64)
+    m = np.asarray(months, dtype=np.int64)
+    d = np.asarray(days, dtype=np.int64)
+    gregorian = ((y * 10000) + (m * 100) + d) >= ((GREGORIAN_START[0] * 10000) + (GREGORIAN_START[1] * 100) +
+                                                   GREGORIAN_START[2])
+    early = m <= 2
+    y = y - early
+    m = m + (12 * early)
+    A = y // 100
+    B = np.where(gregorian, 2 - A + (A // 4), 0)
+    n = 1720995 + B + ((1461 * y) // 4) + ((306001 * (m + 1)) // 10000) + d
+    fraction = (((((np.asarray(seconds, dtype=np.float64) / 60.0) + minutes) / 60.0) + hours) / 24.0)
+    return (n - 0.5) + fraction
+
+
+def lst_from_julian(jds, longitudes, precision=None):
+    """
+    Calculate the local mean sidereal times of julian dates at longitudes (as AstroDate.to_lst does).
+    The dates and longitudes broadcast together, i.e. jds[:, None] and longitudes[None, :] for a grid.
+    With precision the times are rounded at the same steps as AstroDate, so that hms_from_dh of a time is exactly
+    the time of to_lst.
+    :param jds:         the julian dates (in universal time, a float or an array)
+    :param longitudes:  the longitudes (in degrees, - for west, + for east)
+    :param precision:   the digits of the seconds to round to as AstroDate does (None for no rounding)
+    :return:            the sidereal times (in decimal hours)
+    """
+    return np.mod(gst_from_julian(jds, precision) + (np.asarray(longitudes, dtype=np.float64) / 15.0), 24.0)
+
+
+def round_hours(dh, precision=TIME_SECONDS_PRECISION):
+    """
+    Round an array of decimal hours (from 0 to 24) to a precision of seconds, as hms_from_dh then dh_from_hms do.
+    :param dh:          the decimal hours
+    :param precision:   the digits of the seconds
+    :return:            the rounded decimal hours
+    """
+    h = np.trunc(dh)
+    dm = (dh - h) * 60.0
+    m = np.trunc(dm + 0.0005)
+    sf = 10.0 ** precision
+    s = np.trunc((((dm - m) * 60.0) * sf) + 0.5) / sf
+    return (((s / 60.0) + m) / 60.0) + h
+
+
 def to_day_of_week_from_julian(jd):
     """
     Converts a julian to day of the week.
@@ -761,28 +920,9 @@ class AstroDate:
         jul = mathutils.to_float(jul, None)
         if jul is not None:
             jd = 0.5 + jul
-            I = mathutils.to_int(jd)
-            F = jd - I
-            if I > 2229160:
-                A = mathutils.to_int((I - 1867216.25) / 36524.25)
-                B = I + 1 + A - mathutils.to_int(A / 4.0)
-            else:
-                B = I
-            C = B + 1524
-            D = mathutils.to_int((C - 122.1) / 365.25)
-            E = mathutils.to_int(365.25 * D)
-            G = mathutils.to_int((C - E) / 30.6001)
-            d = C - E + F - mathutils.to_int(30.6001 * G)
-            if G < 13.5:
-                mth = G - 1
-            else:
-                mth = G - 13
-            if mth > 2.5:
-                yr = D - 4716
-            else:
-                yr = D - 4715
-            day = mathutils.to_int(d)
-            h = (d - day) * 24
+            I = int(math.floor(jd))
+            yr, mth, day = calendar_from_day_number(I)
+            h = (jd - I) * 24
             hrs, mns, scs = hms_from_dh(h)
             self.set_year(yr)
             self.set_month(mth)
@@ -1006,6 +1146,735 @@ class AstroDate:
             self.set_with_julian(j - t, TIME_MODE_UTC)
 
 
+CENTISECONDS_PER_DAY = 8640000
+
+
+class CompactAstroDate(object):
+    """
+    A variant of AstroDate with the same methods, holding a date as a day number (the julian date at noon, an int)
+    and the fraction of the day from midnight instead of as separate calendar fields. Adding time and converting
+    between time modes are arithmetic on the pair; the calendar fields are calculated from it only when they are
+    read (and kept until the pair changes). Times are exact rather than rounded to TIME_SECONDS_PRECISION at
+    every step, so results can differ from AstroDate by the last digit of the seconds.
+    """
+
+    __slots__ = ("day_number", "fraction", "has_time", "mode", "daylight_saving", "zone_correction", "longitude",
+                 "fields")
+
+    def __init__(self):
+        self.day_number = None
+        self.fraction = 0.0
+        self.has_time = False
+        self.mode = None
+        self.daylight_saving = True
+        self.zone_correction = 0
+        self.longitude = 0
+        self.fields = None
+
+    @staticmethod
+    def alloc(year, month=1, day=1, hours=0, minutes=0, seconds=0.0, mode=TIME_MODE_UTC):
+        """
+        Allocate a CompactAstroDate and set.
+        :param year:    the year
+        :param month:   the month
+        :param day:     the day
+        :param hours:   the hours
+        :param minutes: the minutes
+        :param seconds: the seconds
+        :param mode:    the time mode
+        :return: the CompactAstroDate object
+        """
+        d = CompactAstroDate()
+        d.set(year, month, day, hours, minutes, seconds, mode)
+        return d
+
+    @staticmethod
+    def alloc_now_lct():
+        d = CompactAstroDate()
+        d.now_lct()
+        return d
+
+    @staticmethod
+    def alloc_now_utc():
+        d = CompactAstroDate()
+        d.now_utc()
+        return d
+
+    @staticmethod
+    def alloc_with_date(date):
+        """
+        Allocate a CompactAstroDate as a copy of a date.
+        :param date:    the CompactAstroDate or AstroDate to copy
+        :return: the CompactAstroDate object
+        """
+        d = CompactAstroDate()
+        if isinstance(date, CompactAstroDate):
+            for name in CompactAstroDate.__slots__:
+                setattr(d, name, getattr(date, name))
+            return d
+        d.set_with_tuple(date.get_tuple())
+        d.set_zone_correction(date.get_zone_correction())
+        d.set_daylight_savings(date.get_daylight_savings())
+        d.set_longitude(date.get_longitude())
+        return d
+
+    @staticmethod
+    def alloc_with_epochTD(epochTD):
+        d = CompactAstroDate()
+        d.set_with_epochTD(epochTD)
+        return d
+
+    @staticmethod
+    def alloc_with_julian(jd, mode=TIME_MODE_UTC):
+        """
+        Allocate a CompactAstroDate and set.
+        :param jd:      the julian date
+        :param mode:    the time mode
+        :return: the CompactAstroDate object
+        """
+        d = CompactAstroDate()
+        d.set_with_julian(jd, mode)
+        return d
+
+    @staticmethod
+    def alloc_with_tuple(dat):
+        d = CompactAstroDate()
+        d.set_with_tuple(dat)
+        return d
+
+    def __set_fraction(self, fraction, carry_days=True):
+        # set the fraction of the day, carrying whole days into the day number (or dropping them)
+        days = int(math.floor(fraction))
+        if days:
+            fraction -= days
+            if carry_days:
+                self.day_number += days
+        self.fraction = fraction
+        self.fields = None
+
+    def __get_fields(self):
+        # the calendar fields (year, month, day, hours, minutes, seconds), with the seconds to TIME_SECONDS_PRECISION
+        if self.fields is None:
+            n = self.day_number
+            cs = int((self.fraction * CENTISECONDS_PER_DAY) + 0.5)
+            if cs >= CENTISECONDS_PER_DAY:
+                cs -= CENTISECONDS_PER_DAY
+                n += 1
+            year, month, day = calendar_from_day_number(n)
+            self.fields = (year, month, day, cs // 360000, (cs // 6000) % 60, (cs % 6000) / 100.0)
+        return self.fields
+
+    def __set_fields(self, year, month, day, hours, minutes, seconds):
+        self.day_number = calculate_day_number(year, month, day)
+        self.fraction = (((((seconds / 60.0) + minutes) / 60.0) + hours) / 24.0)
+        self.fields = None
+
+    def __get_gst_zero(self):
+        # the mean sidereal time at 0h UT of the date (in decimal hours)
+        T = ((self.day_number - 0.5) - 2451545.0) / 36525.0
+        T0 = 6.69737455833 + (T * (2400.0513369 + (T * 0.00002586222 + (T * 0.00000000172))))
+        return T0 % 24.0
+
+    year = property(lambda self: self.__get_fields()[0] if self.day_number is not None else None)
+    month = property(lambda self: self.__get_fields()[1] if self.day_number is not None else None)
+    day = property(lambda self: self.__get_fields()[2] if self.day_number is not None else None)
+    hours = property(lambda self: self.__get_fields()[3] if self.has_time else None)
+    minutes = property(lambda self: self.__get_fields()[4] if self.has_time else None)
+    seconds = property(lambda self: self.__get_fields()[5] if self.has_time else None)
+
+    def add_days(self, dd):
+        if self.day_number is not None:
+            self.day_number += mathutils.to_int(dd, 0)
+            self.fields = None
+
+    def add_hours(self, dh):
+        if self.has_time:
+            self.__set_fraction(self.fraction + (mathutils.to_int(dh, 0) / 24.0))
+
+    def add_minutes(self, dm):
+        if self.has_time:
+            self.__set_fraction(self.fraction + (mathutils.to_int(dm, 0) / 1440.0))
+
+    def add_seconds(self, ds):
+        if self.has_time:
+            self.__set_fraction(self.fraction + (mathutils.to_float(ds, 0.0) / 86400.0))
+
+    def add_months(self, dm):
+        if self.day_number is not None:
+            year, month, day, hours, minutes, seconds = self.__get_fields()
+            month += mathutils.to_int(dm, 0)
+            year += (month - 1) // 12
+            month = ((month - 1) % 12) + 1
+            self.day_number = calculate_day_number(year, month, day)
+            self.fields = None
+
+    def add_years(self, dy):
+        if self.day_number is not None:
+            year, month, day, hours, minutes, seconds = self.__get_fields()
+            self.day_number = calculate_day_number(year + mathutils.to_int(dy, 0), month, day)
+            self.fields = None
+
+    def difference(self, date1, useZeroHours=False):
+        """
+        Calculate the absolute difference between date objects in decimal days.
+        The two objects MUST have the same mode.
+        :param date1:    the date to calculate difference with
+        :return:    the absolute difference in decimal days
+        """
+        if self.mode == date1.mode:
+            if isinstance(date1, CompactAstroDate):
+                dd = self.day_number - date1.day_number
+                if not useZeroHours:
+                    dd += self.fraction - date1.fraction
+                return abs(dd)
+            return abs(self.get_julian(useZeroHours) - date1.get_julian(useZeroHours))
+        raise ValueError("Date modes do not match!")
+
+    def get_date_of_easter(self):
+        return get_date_of_easter(self.year)
+
+    def get_day(self):
+        return self.day
+
+    def get_daylight_savings(self):
+        return self.daylight_saving
+
+    def get_days_in_month(self):
+        return get_days_in_month(self.month, self.year)
+
+    def get_decimal_hours(self):
+        if self.has_time:
+            return self.fraction * 24.0
+        return None
+
+    def get_julian(self, useZeroHours=False):
+        """
+        Calculate the julian day.
+        :return:    julian
+        """
+        if useZeroHours:
+            return self.day_number - 0.5
+        return (self.day_number - 0.5) + self.fraction
+
+    def get_longitude(self):
+        return self.longitude
+
+    def get_month(self):
+        return self.month
+
+    def get_pretty_string(self, format=DATETIME_PRINT_FORMAT):
+        year, month, day, hours, minutes, seconds = self.__get_fields()
+        s = time.strftime(format, (year, month, day, hours, minutes, int(seconds), 0, 0, 0))
+        if self.mode is not None:
+            s += ' ' + self.mode.upper()
+        return s
+
+    def get_tuple(self):
+        """
+        Get the current date/time as a tuple.
+        :return:    the date/time (year, month, day[, hours, minutes, seconds[, mode]])
+        """
+        if self.day_number is None:
+            return None
+        fields = self.__get_fields()
+        if not self.has_time:
+            return fields[:3]
+        if self.mode is not None:
+            return fields + (self.mode,)
+        return fields
+
+    def get_year(self):
+        return self.year
+
+    def get_zone_correction(self):
+        return self.zone_correction
+
+    def is_date_set(self):
+        return self.day_number is not None
+
+    def is_gst(self):
+        return self.mode == TIME_MODE_GST
+
+    def is_lct(self):
+        return self.mode == TIME_MODE_LCT
+
+    def is_leap_year(self):
+        return is_leap_year(self.year)
+
+    def is_lst(self):
+        return self.mode == TIME_MODE_LST
+
+    def is_mode_set(self):
+        return self.mode is not None
+
+    def is_tdt(self):
+        return self.mode == TIME_MODE_TDT
+
+    def is_time_set(self):
+        return self.has_time
+
+    def is_utc(self):
+        return self.mode == TIME_MODE_UTC
+
+    def now_lct(self):
+        dat = time.localtime(time.time())
+        self.set(dat[0], dat[1], dat[2], dat[3], dat[4], dat[5], TIME_MODE_LCT)
+        self.set_daylight_savings(dat[8] == 1)
+
+    def now_utc(self):
+        dat = time.gmtime(time.time())
+        self.set(dat[0], dat[1], dat[2], dat[3], dat[4], dat[5], TIME_MODE_UTC)
+        self.set_daylight_savings(dat[8] == 1)
+
+    def set(self, year, month=1, day=1, hours=0, minutes=0, seconds=0.0, mode=TIME_MODE_UTC):
+        """
+        Set the date and time (limiting each field to its range, as AstroDate does).
+        :param year:    the year
+        :param month:   the month
+        :param day:     the day
+        :param hours:   the hours
+        :param minutes: the minutes
+        :param seconds: the seconds
+        :param mode:    the mode
+        """
+        self.day_number = None
+        self.fraction = 0.0
+        self.has_time = False
+        self.mode = None
+        self.fields = None
+        if (year is not None) and (month is not None) and (day is not None):
+            y = mathutils.to_int(year, None)
+            if y is None:
+                return
+            m = min(max(mathutils.to_int(month, 1), 1), 12)
+            d = min(max(mathutils.to_int(day, 1), 1), get_days_in_month(m, y))
+            if (hours is not None) and (minutes is not None) and (seconds is not None):
+                h = min(max(mathutils.to_int(hours, 0), 0), 23)
+                mn = min(max(mathutils.to_int(minutes, 0), 0), 59)
+                s = min(max(mathutils.to_float(seconds, 0.0), 0.0), get_max_seconds())
+                self.__set_fields(y, m, d, h, mn, s)
+                self.has_time = True
+                if mode is not None:
+                    self.set_mode(mode)
+            else:
+                self.__set_fields(y, m, d, 0, 0, 0.0)
+
+    def __replace_field(self, i, value):
+        fields = list(self.__get_fields())
+        fields[i] = value
+        year, month, day, hours, minutes, seconds = fields
+        day = min(day, get_days_in_month(month, year))
+        self.__set_fields(year, month, day, hours, minutes, seconds)
+
+    def set_day(self, day=1):
+        if self.day_number is not None:
+            self.__replace_field(2, min(max(mathutils.to_int(day, 1), 1), self.get_days_in_month()))
+
+    def set_daylight_savings(self, daylight_savings):
+        if daylight_savings is not None:
+            self.daylight_saving = daylight_savings
+
+    def set_hours(self, h=0):
+        if self.has_time:
+            self.__replace_field(3, min(max(mathutils.to_int(h, 0), 0), 23))
+
+    def set_longitude(self, longitude=0.0):
+        l = mathutils.to_float(longitude, 0.0)
+        if l is not None:
+            l = mathutils.normalize_degrees(l, -180.0, 180.0)
+        self.longitude = l
+
+    def set_minutes(self, minutes=0):
+        if self.has_time:
+            self.__replace_field(4, min(max(mathutils.to_int(minutes, 0), 0), 59))
+
+    def set_mode(self, mode=TIME_MODE_UTC):
+        m = TIME_MODE_UTC
+        if mode is not None:
+            mode = mode.lower()
+            if mode in TIME_MODES:
+                m = mode
+        self.mode = m
+
+    def set_month(self, month=1):
+        if self.day_number is not None:
+            self.__replace_field(1, min(max(mathutils.to_int(month, 1), 1), 12))
+
+    def set_seconds(self, seconds=0.0):
+        if self.has_time:
+            self.__replace_field(5, min(max(mathutils.to_float(seconds, 0.0), 0.0), get_max_seconds()))
+
+    def set_with_epochTD(self, epochTD):
+        self.set(mathutils.to_int(epochTD), 1, 1, 0, 0, 0.0, TIME_MODE_TDT)
+
+    def set_with_hours(self, dh=0.0, mode=TIME_MODE_UTC):
+        """
+        Set the time from decimal hours.
+        :param dh:      the time as decimal hours
+        :param mode:    the time mode (default: 'utc')
+        """
+        if self.day_number is not None:
+            self.has_time = True
+            self.__set_fraction(mathutils.to_float(dh, 0.0) / 24.0, False)
+            self.set_mode(mode)
+
+    def set_with_julian(self, jul, mode=TIME_MODE_UTC):
+        """
+        Set date from a julian day.
+        :param jul:     julian
+        :param mode:    the time mode (default: 'utc')
+        """
+        jul = mathutils.to_float(jul, None)
+        if jul is not None:
+            jd = jul + 0.5
+            self.day_number = int(math.floor(jd))
+            self.fraction = jd - self.day_number
+            self.has_time = True
+            self.fields = None
+            self.set_mode(mode)
+
+    def set_with_tuple(self, dat):
+        """
+        Set from a tuple of values.
+        (year, month, day[, hours, minutes, seconds[, mode]]
+        :param dat:     the tuple of values to set with
+        """
+        if dat is None:
+            self.set(None)
+        elif len(dat) == 7:
+            self.set(dat[0], dat[1], dat[2], dat[3], dat[4], dat[5], dat[6])
+        elif len(dat) == 6:
+            self.set(dat[0], dat[1], dat[2], dat[3], dat[4], dat[5])
+        elif len(dat) == 3:
+            self.set(dat[0], dat[1], dat[2])
+        else:
+            self.set(None)
+
+    def set_year(self, year):
+        y = mathutils.to_int(year, None)
+        if (y is not None) and (self.day_number is not None):
+            self.__replace_field(0, y)
+
+    def set_zone_correction(self, zc):
+        zc = mathutils.to_int(zc, 0)
+        if zc is not None:
+            zc = mathutils.normalize_hours(zc, -24.0, 24.0)
+        self.zone_correction = zc
+
+    def to_gst(self):
+        """
+        Converts to greenwich mean sidereal time.
+        Note: this method depends on longitude being set to convert from LST.
+        Note: this method depends on zone_correction and daylight_savings being set to convert from LCT.
+        """
+        if self.is_tdt() or self.is_lct():
+            self.to_utc()
+        if self.is_utc():
+            self.__set_fraction((self.__get_gst_zero() + (1.002737909 * self.fraction * 24.0)) / 24.0, False)
+            self.mode = TIME_MODE_GST
+        if self.is_lst():
+            self.__set_fraction(self.fraction - (self.longitude / 360.0), False)
+            self.mode = TIME_MODE_GST
+
+    def to_lct(self, alt_zone_correction=None, alt_daylight_saving=None):
+        """
+        Convert to local civil time.
+        Note: this method depends on longitude being set to convert from LST.
+        Note: this method depends on zone_correction and daylight_savings being set to convert to LCT.
+        :param alt_zone_correction:    the alternate zone_correction
+        :param alt_daylight_saving:    the alternate daylight_saving
+        :return:    the alternate date/time CompactAstroDate object
+        """
+        if self.is_tdt() or self.is_lst() or self.is_gst():
+            self.to_utc()
+        if self.is_utc():
+            t = self.zone_correction
+            if self.daylight_saving:
+                t += 1
+            self.__set_fraction(self.fraction + (t / 24.0))
+            self.mode = TIME_MODE_LCT
+        alt_d = None
+        if alt_zone_correction is not None:
+            alt_d = CompactAstroDate.alloc_with_date(self)
+            alt_d.add_hours(alt_zone_correction - self.zone_correction)
+        if alt_daylight_saving is not None:
+            if alt_d is None:
+                alt_d = CompactAstroDate.alloc_with_date(self)
+            if self.daylight_saving and not alt_daylight_saving:
+                alt_d.add_hours(-1)
+            elif not self.daylight_saving and alt_daylight_saving:
+                alt_d.add_hours(1)
+        return alt_d
+
+    def to_lst(self, alt_longitude=None):
+        """
+        Convert to local mean sidereal time.
+        Note: this method depends on longitude being set to convert to LST.
+        Note: this method depends on zone_correction and daylight_savings being set to convert from LCT.
+        :param alt_longitude:    the alternate longitude
+        :return:    the alternate date/time CompactAstroDate object
+        """
+        if self.is_tdt():
+            self.to_utc()
+        if self.is_lct() or self.is_utc():
+            self.to_gst()
+        if self.is_gst():
+            self.__set_fraction(self.fraction + (self.longitude / 360.0))
+            self.mode = TIME_MODE_LST
+        if alt_longitude is not None:
+            alt_d = CompactAstroDate.alloc_with_date(self)
+            alt_d.__set_fraction(alt_d.fraction + ((alt_longitude - self.longitude) / 360.0))
+            return alt_d
+        return None
+
+    def to_tdt(self):
+        """
+        Convert to terrestrial dynamical time.
+        Note: this method depends on longitude being set to convert from LST.
+        Note: this method depends on zone_correction and daylight_savings being set to convert from LCT.
+        """
+        if not self.is_tdt():
+            self.to_utc()
+            self.__set_fraction(self.fraction + (deltat.calc_dt_interp(self.get_tuple()) / 86400.0))
+            self.mode = TIME_MODE_TDT
+
+    def to_utc(self):
+        """
+        Convert to coordinated universal time.
+        Note: this method depends on longitude being set to convert from LST.
+        Note: this method depends on zone_correction and daylight_savings being set to convert from LCT.
+        """
+        if self.is_lct():
+            t = self.zone_correction
+            if self.daylight_saving:
+                t += 1
+            self.__set_fraction(self.fraction - (t / 24.0))
+            self.mode = TIME_MODE_UTC
+        if self.is_lst():
+            self.to_gst()
+        if self.is_gst():
+            t = ((self.fraction * 24.0) - self.__get_gst_zero()) % 24.0
+            self.__set_fraction(t / 1.002737909 / 24.0, False)
+            self.mode = TIME_MODE_UTC
+        if self.is_tdt():
+            self.__set_fraction(self.fraction - (deltat.calc_dt_interp(self.get_tuple()) / 86400.0))
+            self.mode = TIME_MODE_UTC
+
+
+class Instant(object):
+    """
+    An immutable instant, held as the day number and the fraction of the day of its universal time (as in
+    CompactAstroDate). Instants are hashable and compare by that pair, so caches (i.e. of nutation, obliquity or
+    ephemerides) can key on them; a julian date only holds a time to about 40 microseconds, so an instant made
+    from the julian date of another is not always equal to it. Nothing changes an instant: adding time or converting to
+    a time mode returns a new value. The dynamical time and the greenwich mean sidereal time are calculated when
+    first asked for and kept by the instant.
+    """
+
+    __slots__ = ("day_number", "fraction", "jde", "gst")
+
+    def __init__(self, day_number, fraction=0.0, jde=None):
+        """
+        Create an instant.
+        :param day_number:  the day number (the julian date at noon, an int)
+        :param fraction:    the fraction of the day from midnight (in universal time, whole days are carried)
+        :param jde:         the julian date in dynamical time when already known (calculated when None)
+        """
+        days = int(math.floor(fraction))
+        object.__setattr__(self, "day_number", int(day_number) + days)
+        object.__setattr__(self, "fraction", fraction - days)
+        object.__setattr__(self, "jde", jde)
+        object.__setattr__(self, "gst", None)
+
+    @staticmethod
+    def alloc(year, month=1, day=1, hours=0, minutes=0, seconds=0.0, mode=TIME_MODE_UTC):
+        """
+        Allocate an Instant.
+        :param year:    the year
+        :param month:   the month
+        :param day:     the day
+        :param hours:   the hours
+        :param minutes: the minutes
+        :param seconds: the seconds
+        :param mode:    the time mode (UTC or TDT)
+        :return: the Instant object
+        """
+        return Instant.alloc_with_date(CompactAstroDate.alloc(year, month, day, hours, minutes, seconds, mode))
+
+    @staticmethod
+    def alloc_now():
+        return Instant.alloc_with_julian(2440587.5 + (time.time() / 86400.0))
+
+    @staticmethod
+    def alloc_with_date(date):
+        """
+        Allocate the Instant of a date (which is not changed).
+        Note: this method depends on longitude being set to convert from LST.
+        Note: this method depends on zone_correction and daylight_savings being set to convert from LCT.
+        :param date:    the AstroDate or CompactAstroDate
+        :return: the Instant object
+        """
+        d = CompactAstroDate.alloc_with_date(date)
+        if d.is_tdt():
+            return Instant.alloc_with_julian(d.get_julian(), TIME_MODE_TDT)
+        d.to_utc()
+        return Instant(d.day_number, d.fraction)
+
+    @staticmethod
+    def alloc_with_julian(jd, mode=TIME_MODE_UTC):
+        """
+        Allocate an Instant.
+        :param jd:      the julian date
+        :param mode:    the time mode of the julian date (UTC or TDT)
+        :return: the Instant object
+        """
+        n = int(math.floor(jd + 0.5))
+        if mode == TIME_MODE_UTC:
+            return Instant(n, (jd + 0.5) - n)
+        if mode == TIME_MODE_TDT:
+            dt = Instant(n, (jd + 0.5) - n).__calculate_delta_t()
+            return Instant(n, ((jd + 0.5) - n) - (dt / 86400.0), jd)
+        raise ValueError("Invalid time mode! (Must be UTC or TDT)")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Instant is immutable!")
+
+    def __delattr__(self, name):
+        raise AttributeError("Instant is immutable!")
+
+    def __eq__(self, other):
+        if isinstance(other, Instant):
+            return (self.day_number == other.day_number) and (self.fraction == other.fraction)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Instant):
+            return (self.day_number != other.day_number) or (self.fraction != other.fraction)
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Instant):
+            return (self.day_number, self.fraction) < (other.day_number, other.fraction)
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, Instant):
+            return (self.day_number, self.fraction) <= (other.day_number, other.fraction)
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, Instant):
+            return (self.day_number, self.fraction) > (other.day_number, other.fraction)
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, Instant):
+            return (self.day_number, self.fraction) >= (other.day_number, other.fraction)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.day_number, self.fraction))
+
+    def __repr__(self):
+        return "Instant({}, {!r})".format(self.day_number, self.fraction)
+
+    def __calculate_delta_t(self):
+        year, month, day = calendar_from_day_number(self.day_number)
+        return deltat.calc_dt_interp((year, month, day, 0, 0, self.fraction * 86400.0))
+
+    def add_days(self, dd):
+        """
+        Add days.
+        :param dd:  the days (a float for a part of a day)
+        :return: the new Instant
+        """
+        days = int(math.floor(dd))
+        return Instant(self.day_number + days, self.fraction + (dd - days))
+
+    def add_seconds(self, ds):
+        """
+        Add seconds.
+        :param ds:  the seconds
+        :return: the new Instant
+        """
+        return Instant(self.day_number, self.fraction + (ds / 86400.0))
+
+    def difference(self, instant):
+        """
+        Calculate the time from another instant to this one.
+        :param instant: the other Instant
+        :return: the difference in decimal days (+ when this instant is later)
+        """
+        return (self.day_number - instant.day_number) + (self.fraction - instant.fraction)
+
+    def get_delta_t(self):
+        """
+        Get the difference between dynamical time and universal time.
+        :return: delta-t (in seconds)
+        """
+        return (self.get_julianTD() - self.get_julian()) * 86400.0
+
+    def get_gst(self):
+        """
+        Get the greenwich mean sidereal time (as CompactAstroDate.to_gst calculates it).
+        :return: the sidereal time (in decimal hours)
+        """
+        if self.gst is None:
+            T = ((self.day_number - 0.5) - 2451545.0) / 36525.0
+            T0 = (6.69737455833 + (T * (2400.0513369 + (T * 0.00002586222 + (T * 0.00000000172))))) % 24.0
+            object.__setattr__(self, "gst", (T0 + (1.002737909 * self.fraction * 24.0)) % 24.0)
+        return self.gst
+
+    def get_julian(self):
+        """
+        Get the julian date.
+        :return: the julian date (in universal time)
+        """
+        return (self.day_number - 0.5) + self.fraction
+
+    def get_julianTD(self):
+        """
+        Get the julian date in dynamical time.
+        :return: the julian date (in dynamical time)
+        """
+        if self.jde is None:
+            object.__setattr__(self, "jde", self.get_julian() + (self.__calculate_delta_t() / 86400.0))
+        return self.jde
+
+    def get_lst(self, longitude):
+        """
+        Get the local mean sidereal time.
+        :param longitude:   the longitude (in degrees, - for west, + for east)
+        :return: the sidereal time (in decimal hours)
+        """
+        return (self.get_gst() + (longitude / 15.0)) % 24.0
+
+    def to_date(self, mode=TIME_MODE_UTC, zone_correction=0, daylight_saving=False, longitude=0.0):
+        """
+        Get the instant as a new AstroDate.
+        :param mode:            the time mode of the date
+        :param zone_correction: the zone correction of the date (for LCT)
+        :param daylight_saving: the daylight saving of the date (for LCT)
+        :param longitude:       the longitude of the date (for LST)
+        :return: the AstroDate object
+        """
+        if mode == TIME_MODE_TDT:
+            return AstroDate.alloc_with_julian(self.get_julianTD(), TIME_MODE_TDT)
+        d = AstroDate.alloc_with_julian(self.get_julian())
+        d.set_zone_correction(zone_correction)
+        d.set_daylight_savings(daylight_saving)
+        d.set_longitude(longitude)
+        if mode == TIME_MODE_LCT:
+            d.to_lct()
+        elif mode == TIME_MODE_GST:
+            d.to_gst()
+        elif mode == TIME_MODE_LST:
+            d.to_lst()
+        elif mode != TIME_MODE_UTC:
+            raise ValueError("Invalid time mode!")
+        return d
+
+
 if __name__ == "__main__":
 
 
@@ -1,7 +1,10 @@
 import unittest
 import astrodate
+import numpy
 
 class Test_Date(unittest.TestCase):
+    date_class = astrodate.AstroDate
+
     def setUp(self):
         self.lng_ref1 = -64
         self.utc_ref1 = (1980, 4, 22, 14, 36, 51.67, 'utc')
@@ -37,7 +40,7 @@ class Test_Date(unittest.TestCase):
         self.utc1 = (1980, 4, 22, 15, 36, 51.67, 'utc')
         self.gst1 = (1980, 4, 22, 5, 40, 15.09, 'gst')
         self.lst1 = (1980, 4, 22, 0, 40, 15.09, 'lst')
-        self.tdt1 = (1980, 4, 22, 15, 37, 42.21, 'tdt')
+        self.tdt1 = (1980, 4, 22, 15, 37, 42.48, 'tdt')
 
         self.lng2 = -111.660833
         self.zc2 = -7
@@ -46,7 +49,7 @@ class Test_Date(unittest.TestCase):
         self.utc2 = (2017, 4, 17, 22, 2, 30.0, 'utc')
         self.gst2 = (2017, 4, 17, 11, 47, 23.23, 'gst')
         self.lst2 = (2017, 4, 17, 4, 20, 44.63, 'lst')
-        self.tdt2 = (2017, 4, 17, 22, 3, 38.59, 'tdt')
+        self.tdt2 = (2017, 4, 17, 22, 3, 38.74, 'tdt')
 
     def test_get_date_of_easter(self):
         e = astrodate.get_date_of_easter(1959)
@@ -85,7 +88,7 @@ class Test_Date(unittest.TestCase):
         self.assertFalse(i)
 
     def test_to_julian_from_date_tuple(self):
-        dat = astrodate.AstroDate()
+        dat = self.date_class()
 
         dat.set_with_tuple((-4712, 1, 1, 12, 0, 0))
         jd = dat.get_julian()
@@ -124,7 +127,7 @@ class Test_Date(unittest.TestCase):
         self.assertEquals(jd, 2451545.0)
 
     def test_to_date_tuple_from_julian(self):
-        dat = astrodate.AstroDate()
+        dat = self.date_class()
 
         dat.set_with_julian(0.0)
         d = dat.get_tuple()
@@ -154,8 +157,65 @@ class Test_Date(unittest.TestCase):
         d = dat.get_tuple()
         self.assertTupleEqual(d, (2000, 1, 1, 12, 0, 0, 'utc'))
 
+    def test_julian_arrays(self):
+        # round trips of random dates and times over +/-5000 years (skipping the days dropped in October 1582)
+        rng = numpy.random.RandomState(18)
+        n = 200000
+        years = rng.randint(-5000, 5001, n)
+        months = rng.randint(1, 13, n)
+        days = rng.randint(1, 29, n)
+        keep = ~((years == 1582) & (months == 10) & (days > 4) & (days < 15))
+        years, months, days = years[keep], months[keep], days[keep]
+        hours = rng.randint(0, 24, len(years))
+        minutes = rng.randint(0, 60, len(years))
+        seconds = rng.randint(0, 6000, len(years)) / 100.0
+        jds = astrodate.julian_from_calendar(years, months, days, hours, minutes, seconds)
+        result = astrodate.calendar_from_julian(jds)
+        for a, b in zip(result[:5], (years, months, days, hours, minutes)):
+            self.assertTrue(numpy.array_equal(a, b))
+        self.assertTrue(numpy.abs(result[5] - seconds).max() < 1.0e-9)
+        self.assertTrue(numpy.abs(astrodate.julian_from_calendar(*result) - jds).max() < 1.0e-7)
+        # and of random days (so including month ends) over the same years
+        day_numbers = rng.randint(astrodate.calculate_day_number(-5000, 1, 1),
+                                  astrodate.calculate_day_number(5001, 1, 1), n)
+        result = astrodate.calendar_from_julian(day_numbers - 0.5)
+        self.assertTrue(numpy.array_equal(astrodate.julian_from_calendar(*result), day_numbers - 0.5))
+        self.assertEqual(result[2].max(), 31)
+        # the same dates and calendars as calculate_julian and set_with_julian
+        for i in range(0, len(jds), 997):
+            jd = astrodate.calculate_julian(int(years[i]), int(months[i]), int(days[i]), int(hours[i]),
+                                            int(minutes[i]), float(seconds[i]))
+            self.assertAlmostEqual(jds[i], jd, 7)
+            dat = astrodate.AstroDate.alloc_with_julian(float(jds[i]))
+            self.assertTupleEqual(dat.get_tuple()[:3], (years[i], months[i], days[i]))
+        self.assertEqual(astrodate.julian_from_calendar(1582, 10, 15), 2299160.5)
+        self.assertEqual(astrodate.julian_from_calendar(1582, 10, 4), 2299159.5)
+        self.assertEqual(astrodate.calendar_from_julian([2299160.5])[2][0], 15)
+
+    def test_sidereal_time(self):
+        date = astrodate.AstroDate().alloc(1987, 4, 10, 19, 21, 0.0)
+        jd = date.get_julian()
+        date.to_gst()
+        self.assertAlmostEqual(astrodate.gst_from_julian(jd), date.get_decimal_hours(), 5)
+        for utc, lng, gst, lst in ((self.utc_ref1, self.lng_ref1, self.gst_ref1, self.lst_ref1),
+                                   (self.utc2, self.lng2, self.gst2, self.lst2)):
+            jd = astrodate.calculate_julian(*utc[:6])
+            self.assertEqual(astrodate.hms_from_dh(float(astrodate.gst_from_julian(jd, 2))), gst[3:6])
+            self.assertEqual(astrodate.hms_from_dh(float(astrodate.lst_from_julian(jd, lng, 2))), lst[3:6])
+        # a grid of dates by longitudes
+        jds = 2457860.5 + (numpy.arange(1440) / 1440.0)
+        longitudes = numpy.linspace(-180.0, 180.0, 7)
+        lst = astrodate.lst_from_julian(jds[:, None], longitudes[None, :])
+        self.assertEqual(lst.shape, (1440, 7))
+        for i in (0, 719, 1439):
+            for j in (0, 3, 5):
+                dat = astrodate.AstroDate.alloc_with_julian(float(jds[i]))
+                dat.set_longitude(float(longitudes[j]))
+                dat.to_lst()
+                self.assertAlmostEqual(lst[i, j], dat.get_decimal_hours(), 5)
+
     def test_ref1(self):
-        dat = astrodate.AstroDate()
+        dat = self.date_class()
         dat.set_longitude(self.lng_ref1)
 
         dat.set_with_tuple(self.utc_ref1)
@@ -176,7 +236,7 @@ class Test_Date(unittest.TestCase):
         self.assertTupleEqual(t, self.utc_ref1)
     
     def test_ref2(self):
-        dat = astrodate.AstroDate()
+        dat = self.date_class()
         dat.set_longitude(self.lng_ref2)
         
         dat.set_with_tuple(self.utc_ref2)
@@ -185,7 +245,7 @@ class Test_Date(unittest.TestCase):
         self.assertTupleEqual(t, self.lst_ref2)
 
     def test_0(self):
-        dat = astrodate.AstroDate()
+        dat = self.date_class()
         dat.set_longitude(self.lng0)
         dat.set_zone_correction(self.zc0)
         dat.set_daylight_savings(self.dst0)
@@ -212,7 +272,7 @@ class Test_Date(unittest.TestCase):
         self.assertTupleEqual(t, self.lct0)
 
     def test_1(self):
-        dat = astrodate.AstroDate()
+        dat = self.date_class()
         dat.set_longitude(self.lng1)
         dat.set_zone_correction(self.zc1)
         dat.set_daylight_savings(self.dst1)
@@ -284,7 +344,7 @@ class Test_Date(unittest.TestCase):
         self.assertTupleEqual(t, self.lct1)
 
     def test_2(self):
-        dat = astrodate.AstroDate()
+        dat = self.date_class()
         dat.set_longitude(self.lng2)
         dat.set_zone_correction(self.zc2)
         dat.set_daylight_savings(self.dst2)
@@ -352,4 +412,74 @@ if __name__ == '__main__':
 
 
     unittest.main()
-    
\ No newline at end of file
+    
+
+
+class Test_CompactDate(Test_Date):
+    date_class = astrodate.CompactAstroDate
+
+    def test_compact(self):
+        dat = astrodate.CompactAstroDate.alloc(2016, 2, 28, 23, 59, 30.0)
+        self.assertFalse(hasattr(dat, "__dict__"))
+        dat.add_seconds(45.5)
+        self.assertTupleEqual(dat.get_tuple(), (2016, 2, 29, 0, 0, 15.5, 'utc'))
+        dat.add_hours(-1)
+        self.assertTupleEqual(dat.get_tuple(), (2016, 2, 28, 23, 0, 15.5, 'utc'))
+        dat.add_days(366)
+        self.assertTupleEqual(dat.get_tuple(), (2017, 2, 28, 23, 0, 15.5, 'utc'))
+        copy = astrodate.CompactAstroDate.alloc_with_date(dat)
+        copy.add_minutes(60)
+        self.assertTupleEqual(copy.get_tuple(), (2017, 3, 1, 0, 0, 15.5, 'utc'))
+        self.assertEqual(dat.get_day(), 28)
+        self.assertAlmostEqual(copy.difference(dat), 1.0 / 24.0, 12)
+        self.assertEqual(astrodate.AstroDate.alloc_with_date(copy).get_tuple(), copy.get_tuple())
+
+
+class Test_Instant(unittest.TestCase):
+
+    def setUp(self):
+        self.utc = (1980, 4, 22, 14, 36, 51.67, 'utc')
+
+    def test_instant(self):
+        instant = astrodate.Instant.alloc(1980, 4, 22, 14, 36, 51.67)
+        self.assertFalse(hasattr(instant, "__dict__"))
+        self.assertRaises(AttributeError, setattr, instant, "fraction", 0.0)
+        same = astrodate.Instant.alloc_with_date(astrodate.AstroDate.alloc_with_tuple(self.utc))
+        self.assertEqual(same, instant)
+        self.assertAlmostEqual(astrodate.Instant.alloc_with_julian(instant.get_julian()).difference(instant), 0.0, 9)
+        self.assertEqual(hash(same), hash(instant))
+        self.assertEqual(len({instant: 1, same: 2}), 1)
+        later = instant.add_days(1)
+        self.assertNotEqual(later, instant)
+        self.assertTrue(later > instant)
+        self.assertEqual(later, astrodate.Instant.alloc(1980, 4, 23, 14, 36, 51.67))
+        self.assertEqual(later.add_days(-1), instant)
+        self.assertAlmostEqual(instant.add_seconds(86400.0).difference(later), 0.0, 12)
+        self.assertAlmostEqual(later.difference(instant), 1.0, 12)
+        self.assertEqual(instant.to_date().get_tuple(), self.utc)
+        self.assertEqual(instant.to_date(astrodate.TIME_MODE_GST).get_tuple(), (1980, 4, 22, 4, 40, 5.23, 'gst'))
+        self.assertEqual(astrodate.hms_from_dh(instant.get_gst()), (4, 40, 5.23))
+        self.assertEqual(astrodate.hms_from_dh(instant.get_lst(-64)), (0, 24, 5.23))
+
+    def test_compare_other_types(self):
+        instant = astrodate.Instant.alloc(1980, 4, 22, 14, 36, 51.67)
+        for other in (None, 2444352.108931, self.utc):
+            self.assertFalse(instant == other)
+            self.assertTrue(instant != other)
+            for method in (instant.__lt__, instant.__le__, instant.__gt__, instant.__ge__):
+                self.assertIs(method(other), NotImplemented)
+        self.assertNotIn(None, [instant])
+
+    def test_dynamical_time(self):
+        date = astrodate.AstroDate.alloc_with_tuple((2012, 7, 22, 22, 37, 0.0, 'utc'))
+        instant = astrodate.Instant.alloc_with_date(date)
+        self.assertEqual(date.get_tuple(), (2012, 7, 22, 22, 37, 0.0, 'utc'))
+        date.to_tdt()
+        self.assertAlmostEqual(instant.get_julianTD(), date.get_julian(), 6)
+        self.assertEqual(instant.to_date(astrodate.TIME_MODE_TDT).get_tuple(), date.get_tuple())
+        self.assertAlmostEqual(instant.get_delta_t(), 66.9, 0)
+        tdt = astrodate.Instant.alloc_with_julian(instant.get_julianTD(), astrodate.TIME_MODE_TDT)
+        self.assertEqual(tdt.get_julianTD(), instant.get_julianTD())
+        self.assertAlmostEqual(tdt.difference(instant) * 86400.0, 0.0, 4)
+        self.assertAlmostEqual(astrodate.Instant.alloc_with_date(date).difference(instant) * 86400.0, 0.0, 1)
+        self.assertRaises(ValueError, astrodate.Instant.alloc_with_julian, 2451545.0, astrodate.TIME_MODE_GST)
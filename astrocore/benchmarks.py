@@ -0,0 +1,502 @@
+"""
+Benchmarks for the performance-sensitive parts of astrocore.
+
+Each benchmark prints a small table. Run them all with:
+
+python benchmarks.py
+
+or a single one by name:
+
+python benchmarks.py truncation
+"""
+
+import astrocoord
+import astrodate
+import chebyshev_ephemeris
+import deltat
+import earth
+import geocentric
+import heliocentric_position
+import jupiter
+import mars
+import mercury
+import neptune
+import numpy as np
+import os
+import rise_transit_set
+import saturn
+import solar_system
+import subprocess
+import sun
+import sys
+import time
+import timeit
+import uranus
+import venus
+
+PLANETS = (
+    ("Mercury", mercury),
+    ("Venus", venus),
+    ("Earth", earth),
+    ("Mars", mars),
+    ("Jupiter", jupiter),
+    ("Saturn", saturn),
+    ("Uranus", uranus),
+    ("Neptune", neptune)
+)
+
+
+def time_call(f, repeat=3, number=20):
+    """
+    Time a callable.
+    :param f: the callable to time
+    :param repeat: the number of timing runs
+    :param number: the number of calls in each run
+    :return: the best time per call (in seconds)
+    """
+    return min(timeit.repeat(f, repeat=repeat, number=number)) / number
+
+
+def benchmark_truncation(accuracies=(1.0, 10.0, 60.0)):
+    """
+    Compare the full VSOP87D series with series truncated to a target accuracy (in arcseconds).
+    For each planet and accuracy this reports the number of terms kept, the speedup over the full series for
+    Position (Python loop) and VectorPosition (NumPy), and the largest longitude/latitude error (in arcseconds)
+    and radius error (in AU) seen over 1000 to 3000.
+    """
+    jdes = np.linspace(heliocentric_position.DEFAULT_SPAN[0], heliocentric_position.DEFAULT_SPAN[1], 401)
+    print("%-8s  %6s  %6s  %8s  %8s  %9s  %9s  %9s" % ("Planet", "Acc\"", "Terms", "Position", "Vector", "Max dL\"", "Max dB\"", "Max dR"))
+    for name, planet in PLANETS:
+        full_loop = heliocentric_position.Position(planet.TERMS_VSOP87D)
+        t_full_loop = time_call(lambda: full_loop.calculate_with_julianTD(astrodate.J2000), number=2)
+        full = heliocentric_position.VectorPosition(planet.TERMS_VSOP87D)
+        t_full = time_call(lambda: full.calculate_with_julianTD(astrodate.J2000))
+        exact = heliocentric_position.calculate_positions_with_julianTD(planet.TERMS_VSOP87D, jdes)
+        n_full = full.packed.L.get_term_count() + full.packed.B.get_term_count() + full.packed.R.get_term_count()
+        print("%-8s  %6s  %6d  %8.2f  %8.2f" % (name, "full", n_full, 1.0, 1.0))
+        for accuracy in accuracies:
+            p_loop = heliocentric_position.Position(planet.TERMS_VSOP87D, accuracy)
+            t_loop = time_call(lambda: p_loop.calculate_with_julianTD(astrodate.J2000), number=2)
+            p = heliocentric_position.VectorPosition(planet.TERMS_VSOP87D, accuracy)
+            t = time_call(lambda: p.calculate_with_julianTD(astrodate.J2000))
+            approx = heliocentric_position.calculate_positions_with_julianTD(p.terms, jdes)
+            dL = np.abs(approx.L - exact.L)
+            dL = np.minimum(dL, 360.0 - dL).max() * 3600.0
+            dB = np.abs(approx.B - exact.B).max() * 3600.0
+            dR = np.abs(approx.R - exact.R).max()
+            n = p.packed.L.get_term_count() + p.packed.B.get_term_count() + p.packed.R.get_term_count()
+            print("%-8s  %6.0f  %6d  %8.2f  %8.2f  %9.4f  %9.4f  %9.2e" %
+                  (name, accuracy, n, t_full_loop / t_loop, t_full / t, dL, dB, dR))
+
+
+def benchmark_chebyshev(years=20):
+    """
+    Compare a position from the full VSOP87D series with one from a fitted Chebyshev ephemeris.
+    For each planet this reports the time per position for both and the speedup.
+    """
+    ephemeris = chebyshev_ephemeris.build(astrodate.J2000, astrodate.J2000 + (365.25 * years))
+    jde = astrodate.J2000 + 100.3
+    print("%-8s  %12s  %12s  %8s" % ("Planet", "VSOP87 (us)", "Cheb (us)", "Speedup"))
+    for name, planet in PLANETS:
+        t_full = time_call(lambda: planet.calculate_position_with_julianTD(jde))
+        p = ephemeris.get_position(name.lower())
+        t = time_call(lambda: p.calculate_with_julianTD(jde), number=1000)
+        print("%-8s  %12.1f  %12.1f  %8.1f" % (name, t_full * 1.0e6, t * 1.0e6, t_full / t))
+
+
+def measure_in_subprocess(setup, statement):
+    """
+    Measure a statement in a fresh interpreter started in this directory.
+    :param setup: the code to run first (not measured)
+    :param statement: the code to measure
+    :return: the time (in seconds), the growth of the peak resident set size (in KB)
+    """
+    code = "\n".join([
+        "import resource, time",
+        setup,
+        "r = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss",
+        "t = time.time()",
+        statement,
+        "t = time.time() - t",
+        "print('%r %r' % (t, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - r))"])
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)))
+    t, rss = out.split()
+    return float(t), int(rss)
+
+
+def benchmark_terms_files():
+    """
+    Compare building the VSOP87D term lists of each planet with mapping its binary terms file.
+    Each is measured in a fresh interpreter (after NumPy is imported) for time and peak RSS growth.
+    """
+    print("%-8s  %10s  %10s  %10s  %10s" % ("Planet", "Lists ms", "Lists KB", "File ms", "File KB"))
+    for name, planet in PLANETS:
+        name = name.lower()
+        t_lists, rss_lists = measure_in_subprocess("import numpy", "import {}_vsop87d".format(name))
+        t_file, rss_file = measure_in_subprocess("import numpy, vsop87d", "vsop87d.load_terms('{}')".format(name))
+        print("%-8s  %10.2f  %10d  %10.2f  %10d" % (name, t_lists * 1000.0, rss_lists, t_file * 1000.0, rss_file))
+
+
+def get_module_names():
+    """
+    Get the names of the astrocore modules (leaving out the tests, the benchmarks, the example and the data files).
+    :return: the sorted module names
+    """
+    names = []
+    for file_name in os.listdir(os.path.dirname(os.path.abspath(__file__))):
+        name, extension = os.path.splitext(file_name)
+        if (extension != ".py") or name.endswith("tests") or name.endswith("_vsop87d"):
+            continue
+        if name in ("__init__", "alltests", "benchmarks", "sioExample", "USCityLatLng"):
+            continue
+        names.append(name)
+    return sorted(names)
+
+
+def benchmark_startup():
+    """
+    Measure the cold import of each astrocore module, then the first use of the term tables of each planet.
+    Each is measured in a fresh interpreter for time and peak RSS growth.
+    """
+    print("%-22s  %10s  %10s" % ("Module", "Import ms", "Import KB"))
+    for name in get_module_names():
+        t, rss = measure_in_subprocess("", "import {}".format(name))
+        print("%-22s  %10.2f  %10d" % (name, t * 1000.0, rss))
+    print("")
+    print("%-8s  %10s  %10s  %10s  %10s" % ("Planet", "Import ms", "Import KB", "First ms", "First KB"))
+    for name, planet in PLANETS:
+        name = name.lower()
+        t_import, rss_import = measure_in_subprocess("import numpy", "import {}".format(name))
+        t_first, rss_first = measure_in_subprocess("import numpy, {}".format(name),
+                                                   "{}.calculate_position_with_julianTD(2451545.0)".format(name))
+        print("%-8s  %10.2f  %10d  %10.2f  %10d" % (name, t_import * 1000.0, rss_import, t_first * 1000.0, rss_first))
+
+
+def benchmark_snapshot(accuracies=(None, 1.0)):
+    """
+    Compare a solar system snapshot with calling the modules one at a time for the same results: the Sun
+    (sun.Position, which calculates Earth and the nutation), Earth, then each planet's apparent position
+    (geocentric.Position, which calculates Earth and the nutation again).
+    """
+    jde = astrodate.J2000 + 100.3
+
+    def one_at_a_time():
+        sun.calculate_position_with_julianTD(jde)
+        for name, planet in PLANETS:
+            if planet is earth:
+                earth.calculate_position_with_julianTD(jde)
+            else:
+                geocentric.calculate_position_with_julianTD(planet, jde)
+
+    t_modules = time_call(one_at_a_time)
+    print("%-10s  %12s  %12s  %8s" % ("Accuracy\"", "Modules (us)", "Snapshot (us)", "Speedup"))
+    for accuracy in accuracies:
+        s = solar_system.SolarSystem(accuracy)
+        t = time_call(lambda: s.snapshot(jde))
+        label = "full" if accuracy is None else "%.1f" % accuracy
+        print("%-10s  %12.1f  %12.1f  %8.1f" % (label, t_modules * 1.0e6, t * 1.0e6, t_modules / t))
+
+
+def benchmark_astrodate(n=20000):
+    """
+    Compare AstroDate with CompactAstroDate: the memory of one object (with its attribute dictionary) and the
+    throughput of allocating, adding time, converting to TDT and back, and reading the calendar fields.
+    """
+    date = astrodate.AstroDate.alloc(2017, 4, 17, 22, 2, 30.0)
+    compact = astrodate.CompactAstroDate.alloc(2017, 4, 17, 22, 2, 30.0)
+    sizes = (sys.getsizeof(date) + sys.getsizeof(date.__dict__), sys.getsizeof(compact))
+    print("%-20s  %14s  %14s  %8s" % ("", "AstroDate", "Compact", "Ratio"))
+    print("%-20s  %14d  %14d  %8.1f" % ("Bytes per object", sizes[0], sizes[1], float(sizes[0]) / sizes[1]))
+    operations = (
+        ("alloc_with_julian", lambda cls, d: cls.alloc_with_julian(2457861.5)),
+        ("add_seconds", lambda cls, d: d.add_seconds(61.5)),
+        ("add_hours", lambda cls, d: d.add_hours(25)),
+        ("to_tdt + to_utc", lambda cls, d: (d.to_tdt(), d.to_utc())),
+        ("to_lst + to_utc", lambda cls, d: (d.to_lst(), d.to_utc())),
+        ("get_tuple", lambda cls, d: d.get_tuple()),
+    )
+    for name, operation in operations:
+        rates = []
+        for cls in (astrodate.AstroDate, astrodate.CompactAstroDate):
+            d = cls.alloc(2017, 4, 17, 22, 2, 30.0)
+            d.set_longitude(-111.660833)
+            t = timeit.timeit(lambda: operation(cls, d), number=n)
+            rates.append(n / t)
+        print("%-20s  %12.0f/s  %12.0f/s  %8.1f" % (name, rates[0], rates[1], rates[1] / rates[0]))
+
+
+def benchmark_sidereal_time(n_sites=10000, minutes=1440, n_objects=2000):
+    """
+    Time local sidereal time for a grid of sites by the minutes of a day, with astrodate.lst_from_julian against
+    AstroDate.to_lst (on a sample of the grid, scaled up).
+    """
+    rng = np.random.RandomState(1)
+    longitudes = rng.uniform(-180.0, 180.0, n_sites)
+    jds = astrodate.calculate_julian(2024, 3, 20) + (np.arange(minutes) / float(minutes))
+    t = time.time()
+    astrodate.lst_from_julian(jds[:, None], longitudes[None, :])
+    t_array = time.time() - t
+    t = time.time()
+    astrodate.lst_from_julian(jds[:, None], longitudes[None, :], astrodate.TIME_SECONDS_PRECISION)
+    t_rounded = time.time() - t
+    t = time.time()
+    for k in range(n_objects):
+        date = astrodate.AstroDate.alloc_with_julian(float(jds[k % minutes]))
+        date.set_longitude(float(longitudes[k]))
+        date.to_lst()
+    t_objects = (time.time() - t) * (n_sites * minutes) / float(n_objects)
+    print("%d sites x %d minutes:" % (n_sites, minutes))
+    print("%-28s  %10.2f s" % ("lst_from_julian", t_array))
+    print("%-28s  %10.2f s" % ("lst_from_julian (rounded)", t_rounded))
+    print("%-28s  %10.2f s (estimated from %d)" % ("AstroDate.to_lst", t_objects, n_objects))
+
+
+def benchmark_coord_array(n_stars=100000, n_objects=2000):
+    """
+    Time converting a catalogue of equatorial coordinates to ecliptic, galactic and horizon coordinates with
+    astrocoord.AstroCoordArray against AstroCoord (on a sample of the catalogue, scaled up).
+    """
+    rng = np.random.RandomState(1)
+    ra = rng.uniform(0.0, 24.0, n_stars)
+    dec = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, n_stars)))
+    mode = astrocoord.make_mode(astrocoord.COORD_MODE_EQUATORIAL, astrocoord.COORD1_UNIT_HOURS,
+                                astrocoord.COORD1_TYPE_RA)
+    date = astrodate.AstroDate.alloc_with_tuple((2024, 3, 20, 22, 0, 0.0, astrodate.TIME_MODE_UTC))
+    date.set_longitude(-71.0833)
+    print("%d stars:" % n_stars)
+    print("%-12s  %12s  %12s" % ("Conversion", "Array s", "Objects s"))
+    for conversion in ("to_ecliptic", "to_galactic", "to_horizon"):
+        t = time.time()
+        a = astrocoord.AstroCoordArray.alloc_with_degrees(ra, dec, mode)
+        a.set_date(date)
+        a.set_latitude(42.3333)
+        getattr(a, conversion)()
+        t_array = time.time() - t
+        t = time.time()
+        for k in range(n_objects):
+            c = astrocoord.AstroCoord.alloc_with_degrees(float(ra[k]), float(dec[k]), mode)
+            c.set_date(astrodate.AstroDate.alloc_with_date(date))
+            c.set_latitude(42.3333)
+            getattr(c, conversion)()
+        t_objects = (time.time() - t) * n_stars / float(n_objects)
+        print("%-12s  %12.3f  %12.2f (estimated from %d)" % (conversion, t_array, t_objects, n_objects))
+
+
+def benchmark_coord(n=2000, round_trips=100):
+    """
+    Time AstroCoord conversions one coordinate at a time, and report the error of a coordinate after repeated
+    equatorial to ecliptic to horizon and back round trips.
+    """
+    mode = astrocoord.make_mode(astrocoord.COORD_MODE_EQUATORIAL, astrocoord.COORD1_UNIT_HOURS,
+                                astrocoord.COORD1_TYPE_RA)
+    date = astrodate.AstroDate.alloc_with_tuple((2024, 3, 20, 22, 0, 0.0, astrodate.TIME_MODE_UTC))
+    date.set_longitude(-71.0833)
+    date.to_lst()
+    c = astrocoord.AstroCoord.alloc_with_tuple((5, 14, 32.3, -8, 12, 5.9, mode))
+    c.set_date(date)
+    c.set_latitude(42.3333)
+
+    def convert(conversion):
+        c.set_with_tuple((5, 14, 32.3, -8, 12, 5.9, mode))
+        conversion()
+
+    print("%-16s  %10s" % ("Call", "us"))
+    for name, f in (("set_with_tuple", lambda: c.set_with_tuple((5, 14, 32.3, -8, 12, 5.9, mode))),
+                    ("get_tuple", c.get_tuple),
+                    ("to_ecliptic", lambda: convert(c.to_ecliptic)),
+                    ("to_galactic", lambda: convert(c.to_galactic)),
+                    ("to_horizon", lambda: convert(c.to_horizon))):
+        print("%-16s  %10.1f" % (name, timeit.timeit(f, number=n) * 1e6 / n))
+    ra, dec = 5.24230123, -8.20163891
+    c.set_with_degrees(ra, dec, mode)
+    for i in range(round_trips):
+        c.to_ecliptic()
+        c.to_horizon()
+        c.to_equatorial()
+        c.to_right_ascension()
+        c.to_hours()
+    print("Error after %d round trips: %.3g s (RA), %.3g arcsec (Dec)" %
+          (round_trips, abs(c.get_dd1() - ra) * 3600.0, abs(c.get_dd2() - dec) * 3600.0))
+
+
+def benchmark_precession(n_stars=1000000, n_objects=2000):
+    """
+    Time precessing a catalogue of J2000 coordinates to a date with astrocoord.AstroCoordArray (one product with
+    the cached precession matrix) against AstroCoord (on a sample of the catalogue, scaled up).
+    """
+    rng = np.random.RandomState(1)
+    ra = rng.uniform(0.0, 24.0, n_stars)
+    dec = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, n_stars)))
+    mode = astrocoord.make_mode(astrocoord.COORD_MODE_EQUATORIAL, astrocoord.COORD1_UNIT_HOURS,
+                                astrocoord.COORD1_TYPE_RA)
+    jde = astrodate.J2000 + (24.25 * 365.25)
+    t = time.time()
+    astrocoord.get_precession_matrix(astrodate.J2000, jde)
+    t_matrix = time.time() - t
+    a = astrocoord.AstroCoordArray.alloc_with_degrees(ra, dec, mode)
+    t = time.time()
+    a.precess(astrodate.J2000, jde)
+    t_array = time.time() - t
+    t = time.time()
+    for k in range(n_objects):
+        c = astrocoord.AstroCoord.alloc_with_degrees(float(ra[k]), float(dec[k]), mode)
+        c.precess(astrodate.J2000, jde)
+    t_objects = (time.time() - t) * n_stars / float(n_objects)
+    print("%d stars, J2000 to %.2f:" % (n_stars, 2000.0 + ((jde - astrodate.J2000) / 365.25)))
+    print("Matrix:  %10.6f s" % t_matrix)
+    print("Array:   %10.3f s" % t_array)
+    print("Objects: %10.2f s (estimated from %d)" % (t_objects, n_objects))
+
+
+def benchmark_delta_t(step=0.01):
+    """
+    Time the polynomial sets of delta-t one year at a time and as an array of fractional years over the years the
+    table covers, with the fit of each set against the table.
+    """
+    years = np.arange(deltat.DATE_TD_YEAR_MIN, deltat.DATE_TD_YEAR_MAX, step)
+    print("%-20s  %9s  %9s  %8s  %8s  %8s" % ("Set", "Scalar us", "Array us", "Max s", "Mean s", "RMS s"))
+    for name, polys in deltat.DELTA_T_POLYNOMIAL_SETS:
+        compiled = deltat.get_delta_t_polynomials(polys)
+        t = time.time()
+        for year in years:
+            compiled.calculate(float(year))
+        t_scalar = (time.time() - t) / len(years)
+        t = time.time()
+        compiled.calculate(years)
+        t_array = (time.time() - t) / len(years)
+        n, max_ae, mean_ae, rms = deltat.calculate_delta_t_errors(polys, years)
+        print("%-20s  %9.2f  %9.3f  %8.3f  %8.3f  %8.3f" % (name, t_scalar * 1e6, t_array * 1e6, max_ae, mean_ae, rms))
+
+
+def benchmark_seasons(first_year=1000, last_year=3000):
+    """
+    Compare the season start solvers of sun.Position over a range of years (all four seasons), reporting the
+    total and mean iterations, the wall time and the largest difference from the fixed-gain solver, then the
+    same for the bulk calculate_season_starts.
+    """
+    years = range(first_year, last_year + 1)
+    p = sun.Position()
+    results = {}
+    print("%-8s  %10s  %10s  %10s  %12s" % ("Method", "Iterations", "Mean", "Time s", "Max diff s"))
+    for method in sun.SEASON_METHODS:
+        jdes = []
+        iterations = 0
+        t = time.time()
+        for year in years:
+            for season in sun.SEASONS:
+                jdes.append(p.calculate_season_start(year, season, method=method))
+                iterations += p.get_season_iterations()
+        t = time.time() - t
+        results[method] = np.array(jdes)
+        diff = np.abs(results[method] - results[sun.SEASON_METHOD_FIXED]).max() * 86400.0
+        print("%-8s  %10d  %10.2f  %10.2f  %12.3f" % (method, iterations, iterations / float(len(jdes)), t, diff))
+    t = time.time()
+    jdes = sun.calculate_season_starts(years).ravel()
+    t = time.time() - t
+    diff = np.abs(jdes - results[sun.SEASON_METHOD_FIXED]).max() * 86400.0
+    print("%-8s  %10s  %10s  %10.2f  %12.3f" % ("bulk", "", "", t, diff))
+
+
+def benchmark_nutation_table(years=50):
+    """
+    Compare hourly nutation over a span of years from the series (earth.NutationArray) with a table
+    (earth.NutationTable), timing the first use (which builds the nodes) and a second use.
+    """
+    jdes = astrodate.J2000 + np.arange(0.0, 365.25 * years, 1.0 / 24.0)
+    t = time.time()
+    a = earth.calculate_nutations_with_julianTD(jdes)
+    t_series = time.time() - t
+    table = earth.NutationTable()
+    t = time.time()
+    table.calculate_with_julianTD(jdes)
+    t_first = time.time() - t
+    t = time.time()
+    table.calculate_with_julianTD(jdes)
+    t_second = time.time() - t
+    error = max(np.abs(table.get_nutation_in_longitude() - a.get_nutation_in_longitude()).max(),
+                np.abs(table.get_nutation_in_obliquity() - a.get_nutation_in_obliquity()).max()) * 3.6e9
+    print("%d hourly dates: series %.2f s, table %.2f s (first use) %.2f s (after), max error %.3f uas" %
+          (len(jdes), t_series, t_first, t_second, error))
+
+
+def benchmark_nutation_models(years=200, step=1.0):
+    """
+    Compare the IAU 1980 and IAU 2000B nutation models: the time per date of one date at a time (uncached) and of
+    an array of daily dates, and the differences between them over 1900 to 2100.
+    """
+    jdes = astrodate.calculate_julian(1900, 1, 1) + np.arange(0.0, 365.25 * years, step)
+    print("%-9s  %12s  %12s" % ("Model", "Scalar us", "Array us"))
+    values = {}
+    for model in earth.NUTATION_MODELS:
+        n = 200
+        t = timeit.timeit(lambda: earth.calculate_nutation_with_julianTD(2451545.0, model), number=n) / n
+        start = time.time()
+        values[model] = earth.calculate_nutation_with_julianTD(jdes, model)
+        t_array = (time.time() - start) / len(jdes)
+        print("%-9s  %12.1f  %12.2f" % (model, t * 1e6, t_array * 1e6))
+    psi0, eps0, obliquity0 = values[earth.NUTATION_MODEL_IAU1980]
+    psi1, eps1, obliquity1 = values[earth.NUTATION_MODEL_IAU2000B]
+    print("%d dates, IAU 2000B - IAU 1980 (mas):" % len(jdes))
+    print("%-16s  %9s  %9s" % ("", "Max", "RMS"))
+    for name, d in (("Longitude", psi1 - psi0), ("Obliquity", eps1 - eps0),
+                    ("True obliquity", (obliquity1 + eps1) - (obliquity0 + eps0))):
+        d = d * 3.6e6
+        print("%-16s  %9.3f  %9.3f" % (name, np.abs(d).max(), np.sqrt((d * d).mean())))
+
+
+RISE_TRANSIT_SET_BUDGET = 30.0      # seconds for a year of events at 1000 sites
+
+
+def benchmark_rise_transit_set(n_sites=1000, days=365.0):
+    """
+    Time a year of rise, transit and set events for the Sun and the planets at many random sites, against the
+    budget, reporting the time for the ephemeris (once per body) and for the events (all the sites).
+    """
+    rng = np.random.RandomState(1)
+    latitudes = rng.uniform(-60.0, 60.0, n_sites)
+    longitudes = rng.uniform(-180.0, 180.0, n_sites)
+    jd_start = astrodate.calculate_julian(2024, 1, 1)
+    total = 0.0
+    print("%-8s  %13s  %10s  %9s" % ("Body", "Ephemeris s", "Events s", "Events"))
+    for name, body in (("Sun", sun),) + tuple(p for p in PLANETS if p[1] is not earth):
+        t = time.time()
+        ephemeris = rise_transit_set.Ephemeris(body, jd_start, jd_start + days)
+        t_ephemeris = time.time() - t
+        t = time.time()
+        events = rise_transit_set.calculate_events(body, latitudes, longitudes, jd_start, jd_start + days,
+                                                   ephemeris=ephemeris)
+        t_events = time.time() - t
+        total += t_ephemeris + t_events
+        print("%-8s  %13.2f  %10.2f  %9d" % (name, t_ephemeris, t_events, len(events)))
+    print("Total: %.2f s for %d sites x %.0f days (budget %.0f s: %s)" %
+          (total, n_sites, days, RISE_TRANSIT_SET_BUDGET, "met" if total <= RISE_TRANSIT_SET_BUDGET else "exceeded"))
+
+
+BENCHMARKS = (
+    ("truncation", benchmark_truncation),
+    ("chebyshev", benchmark_chebyshev),
+    ("terms_files", benchmark_terms_files),
+    ("startup", benchmark_startup),
+    ("snapshot", benchmark_snapshot),
+    ("rise_transit_set", benchmark_rise_transit_set),
+    ("seasons", benchmark_seasons),
+    ("nutation_table", benchmark_nutation_table),
+    ("nutation_models", benchmark_nutation_models),
+    ("delta_t", benchmark_delta_t),
+    ("astrodate", benchmark_astrodate),
+    ("sidereal_time", benchmark_sidereal_time),
+    ("coord", benchmark_coord),
+    ("coord_array", benchmark_coord_array),
+    ("precession", benchmark_precession),
+)
+
+
+if __name__ == "__main__":
+
+
+    names = sys.argv[1:]
+    for name, benchmark in BENCHMARKS:
+        if (not names) or (name in names):
+            print("== {} ==".format(name))
+            benchmark()
+            print("")
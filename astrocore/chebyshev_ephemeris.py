@@ -0,0 +1,313 @@
+"""
+A compact ephemeris of piecewise Chebyshev polynomials fitted to the VSOP87D planet series.
+
+The date range is split into granules of equal length (8 days by default). In every granule the mean
+heliocentric longitude, latitude and radius of each planet are fitted with a short Chebyshev series,
+so that a position costs a few multiply-adds per coordinate instead of thousands of cosine terms.
+
+The ephemeris is stored in a little-endian binary file:
+
+    magic               8 bytes     'ACHEB001'
+    header              6 float64   first julian date, last julian date, granule length (days),
+                                    number of coefficients, number of granules, number of bodies
+    body names          16 bytes    per body (ascii, null padded)
+    coefficients        float64     [bodies][granules][L, B, R][coefficients]
+
+Build, write, validate and time an ephemeris with:
+
+python chebyshev_ephemeris.py <file> <first year> <last year> [granule days]
+"""
+
+import astrodate
+import earth
+import heliocentric_position
+import jupiter
+import mars
+import math
+import mathutils
+import mercury
+import neptune
+import numpy as np
+import saturn
+import sys
+import uranus
+import venus
+
+MAGIC = b'ACHEB001'
+NAME_LENGTH = 16
+DEFAULT_GRANULE = 8.0
+DEFAULT_COEFFICIENTS = 12
+
+PLANETS = (
+    ("mercury", mercury),
+    ("venus", venus),
+    ("earth", earth),
+    ("mars", mars),
+    ("jupiter", jupiter),
+    ("saturn", saturn),
+    ("uranus", uranus),
+    ("neptune", neptune)
+)
+
+
+def chebyshev_nodes(n):
+    """
+    Get the Chebyshev nodes of the first kind on [-1, 1].
+    :param n: the number of nodes
+    :return: the nodes (an ndarray)
+    """
+    return np.cos(math.pi * (np.arange(n) + 0.5) / n)
+
+
+def clenshaw(c, x):
+    """
+    Evaluate a Chebyshev series sum(c[k] * T_k(x)) with the Clenshaw recurrence.
+    :param c: the coefficients (a list of floats)
+    :param x: the argument on [-1, 1]
+    :return: the value of the series
+    """
+    b1 = 0.0
+    b2 = 0.0
+    x2 = 2.0 * x
+    for k in range(len(c) - 1, 0, -1):
+        b1, b2 = c[k] + (x2 * b1) - b2, b1
+    return c[0] + (x * b1) - b2
+
+
+def fit_granules(terms, jde_start, n_granules, granule=DEFAULT_GRANULE, n_coefficients=DEFAULT_COEFFICIENTS):
+    """
+    Fit the Chebyshev coefficients of a planet's mean longitude, latitude and radius in each granule.
+    :param terms: the [L, B, R] VSOP87 terms of the planet
+    :param jde_start: the first julian date (in dynamical time)
+    :param n_granules: the number of granules
+    :param granule: the length of a granule (in days)
+    :param n_coefficients: the number of coefficients in each fit
+    :return: the coefficients (an ndarray of shape [granules, 3, coefficients])
+    """
+    x = chebyshev_nodes(n_coefficients)
+    mid = jde_start + ((np.arange(n_granules) + 0.5) * granule)
+    jdes = mid[:, np.newaxis] + ((0.5 * granule) * x[np.newaxis, :])
+    p = heliocentric_position.calculate_positions_with_julianTD(terms, jdes.ravel())
+    L = np.degrees(np.unwrap(np.radians(p.L.reshape(jdes.shape)), axis=1))
+    B = p.B.reshape(jdes.shape)
+    R = p.R.reshape(jdes.shape)
+    k = np.arange(n_coefficients)
+    m = np.cos(math.pi * np.outer(k, np.arange(n_coefficients) + 0.5) / n_coefficients) * (2.0 / n_coefficients)
+    m[0] *= 0.5
+    coefficients = np.empty((n_granules, 3, n_coefficients))
+    coefficients[:, 0, :] = L.dot(m.T)
+    coefficients[:, 1, :] = B.dot(m.T)
+    coefficients[:, 2, :] = R.dot(m.T)
+    return coefficients
+
+
+class ChebyshevPosition(heliocentric_position.Position):
+    """
+    The heliocentric position of a planet evaluated from a fitted Chebyshev ephemeris.
+    The getters are those of Position. A scalar julian date gives floats, an array of julian dates gives arrays.
+    """
+
+    def __init__(self, ephemeris, coefficients):
+        heliocentric_position.Position.__init__(self, None)
+        self.ephemeris = ephemeris
+        self.coefficients = coefficients
+
+    def calculate_with_julianTD(self, jde):
+        """
+        Calculate the position properties for a solar body (in the standard FK5 system).
+        :param jde: the julian date (in dynamical time), or an array of them
+        """
+        if np.ndim(jde) > 0:
+            self.__calculate_array(np.asarray(jde, dtype=np.float64))
+            return
+        i, x = self.ephemeris.locate(jde)
+        c = self.coefficients[i].tolist()
+        self.T = (jde - astrodate.J2000) / 365250.0
+        self.L = mathutils.normalize_degrees(clenshaw(c[0], x))
+        self.B = clenshaw(c[1], x)
+        self.R = clenshaw(c[2], x)
+        dL, dB = heliocentric_position.calculate_fk5_corrections(self.T * 10.0, self.L, self.B)
+        self.dL = float(dL)
+        self.dB = float(dB)
+
+    def __calculate_array(self, jdes):
+        i, x = self.ephemeris.locate(jdes)
+        c = self.coefficients[i]
+        b1 = np.zeros((len(jdes), 3))
+        b2 = np.zeros((len(jdes), 3))
+        x = x[:, np.newaxis]
+        x2 = 2.0 * x
+        for k in range(c.shape[2] - 1, 0, -1):
+            b1, b2 = c[:, :, k] + (x2 * b1) - b2, b1
+        v = c[:, :, 0] + (x * b1) - b2
+        self.T = (jdes - astrodate.J2000) / 365250.0
+        self.L = mathutils.normalize_array(v[:, 0], 0.0, 360.0)
+        self.B = v[:, 1]
+        self.R = v[:, 2]
+        self.dL, self.dB = heliocentric_position.calculate_fk5_corrections(self.T * 10.0, self.L, self.B)
+
+
+class ChebyshevEphemeris:
+    """
+    A set of planets fitted with piecewise Chebyshev polynomials over a common date range.
+    """
+
+    def __init__(self, jde_start, granule, coefficients, names):
+        self.jde_start = float(jde_start)
+        self.granule = float(granule)
+        self.coefficients = coefficients
+        self.names = list(names)
+        self.jde_end = self.jde_start + (self.granule * coefficients.shape[1])
+
+    def get_names(self):
+        """
+        Get the names of the bodies in the ephemeris.
+        :return: the names
+        """
+        return list(self.names)
+
+    def get_position(self, name):
+        """
+        Get the position calculator for a body.
+        :param name: the name of the body (i.e. 'mars')
+        :return: the ChebyshevPosition
+        """
+        if name not in self.names:
+            raise ValueError("Body not in ephemeris! ({})".format(name))
+        return ChebyshevPosition(self, self.coefficients[self.names.index(name)])
+
+    def locate(self, jde):
+        """
+        Find the granule and the Chebyshev argument for a julian date.
+        :param jde: the julian date (in dynamical time), or an array of them
+        :return: the granule index, the argument on [-1, 1]
+        """
+        if np.ndim(jde) > 0:
+            if (np.min(jde) < self.jde_start) or (np.max(jde) > self.jde_end):
+                raise ValueError("Date outside of the ephemeris range!")
+            i = np.minimum(((jde - self.jde_start) // self.granule).astype(np.intp), self.coefficients.shape[1] - 1)
+        else:
+            if (jde < self.jde_start) or (jde > self.jde_end):
+                raise ValueError("Date outside of the ephemeris range!")
+            i = min(int((jde - self.jde_start) // self.granule), self.coefficients.shape[1] - 1)
+        x = (2.0 * (jde - (self.jde_start + (i * self.granule))) / self.granule) - 1.0
+        return i, x
+
+
+def build(jde_start, jde_end, granule=DEFAULT_GRANULE, n_coefficients=DEFAULT_COEFFICIENTS, planets=PLANETS):
+    """
+    Fit a Chebyshev ephemeris to the VSOP87D series of the planets.
+    :param jde_start: the first julian date (in dynamical time)
+    :param jde_end: the last julian date (in dynamical time), rounded up to a whole granule
+    :param granule: the length of a granule (in days)
+    :param n_coefficients: the number of coefficients in each fit
+    :param planets: the (name, module) pairs of the planets to fit
+    :return: the ChebyshevEphemeris
+    """
+    n_granules = int(math.ceil((jde_end - jde_start) / granule))
+    coefficients = np.empty((len(planets), n_granules, 3, n_coefficients))
+    for i, (name, planet) in enumerate(planets):
+        coefficients[i] = fit_granules(planet.TERMS_VSOP87D, jde_start, n_granules, granule, n_coefficients)
+    return ChebyshevEphemeris(jde_start, granule, coefficients, [name for name, planet in planets])
+
+
+def load(path):
+    """
+    Read a Chebyshev ephemeris file.
+    :param path: the path of the file
+    :return: the ChebyshevEphemeris
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a Chebyshev ephemeris file! ({})".format(path))
+    offset = len(MAGIC)
+    header = np.frombuffer(data, dtype='<f8', count=6, offset=offset)
+    offset += header.nbytes
+    jde_start, jde_end, granule = header[0], header[1], header[2]
+    n_coefficients, n_granules, n_bodies = int(header[3]), int(header[4]), int(header[5])
+    names = []
+    for i in range(n_bodies):
+        names.append(data[offset:offset + NAME_LENGTH].rstrip(b'\0').decode('ascii'))
+        offset += NAME_LENGTH
+    coefficients = np.frombuffer(data, dtype='<f8', count=n_bodies * n_granules * 3 * n_coefficients, offset=offset)
+    coefficients = coefficients.reshape((n_bodies, n_granules, 3, n_coefficients))
+    return ChebyshevEphemeris(jde_start, granule, coefficients, names)
+
+
+def save(path, ephemeris):
+    """
+    Write a Chebyshev ephemeris file.
+    :param path: the path of the file
+    :param ephemeris: the ChebyshevEphemeris to write
+    """
+    n_bodies, n_granules, n_series, n_coefficients = ephemeris.coefficients.shape
+    header = np.array([ephemeris.jde_start, ephemeris.jde_end, ephemeris.granule,
+                       n_coefficients, n_granules, n_bodies], dtype='<f8')
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(header.tobytes())
+        for name in ephemeris.names:
+            f.write(name.encode('ascii')[:NAME_LENGTH].ljust(NAME_LENGTH, b'\0'))
+        f.write(np.ascontiguousarray(ephemeris.coefficients, dtype='<f8').tobytes())
+
+
+def validate(ephemeris, n_samples=2000, planets=PLANETS, seed=0):
+    """
+    Measure the largest deviation of a Chebyshev ephemeris from the full VSOP87D series at random dates.
+    :param ephemeris: the ChebyshevEphemeris to validate
+    :param n_samples: the number of dates to sample
+    :param planets: the (name, module) pairs of the planets to check
+    :param seed: the seed of the random dates
+    :return: a list of (name, max longitude error ("), max latitude error ("), max radius error (AU))
+    """
+    rng = np.random.RandomState(seed)
+    jdes = rng.uniform(ephemeris.jde_start, ephemeris.jde_end, n_samples)
+    report = []
+    for name, planet in planets:
+        if name in ephemeris.names:
+            exact = planet.calculate_positions_with_julianTD(jdes)
+            p = ephemeris.get_position(name)
+            p.calculate_with_julianTD(jdes)
+            dL = np.abs(p.get_longitude0() - exact.get_longitude0())
+            dL = np.minimum(dL, 360.0 - dL).max() * 3600.0
+            dB = np.abs(p.get_latitude0() - exact.get_latitude0()).max() * 3600.0
+            dR = np.abs(p.get_radius() - exact.get_radius()).max()
+            report.append((name, dL, dB, dR))
+    return report
+
+
+def print_validation_report(report):
+    """
+    Print the report made by validate.
+    :param report: the validation report
+    """
+    print("%-8s  %12s  %12s  %12s" % ("Body", "Max dL (\")", "Max dB (\")", "Max dR (AU)"))
+    for name, dL, dB, dR in report:
+        print("%-8s  %12.3e  %12.3e  %12.3e" % (name, dL, dB, dR))
+
+
+if __name__ == "__main__":
+
+
+    import time
+
+    path = sys.argv[1]
+    jde_start = astrodate.calculate_julian(int(sys.argv[2]), 1, 1)
+    jde_end = astrodate.calculate_julian(int(sys.argv[3]), 1, 1)
+    granule = DEFAULT_GRANULE
+    if len(sys.argv) > 4:
+        granule = float(sys.argv[4])
+    t = time.time()
+    ephemeris = build(jde_start, jde_end, granule)
+    save(path, ephemeris)
+    print("Built {} in {:.1f} s".format(path, time.time() - t))
+    ephemeris = load(path)
+    print_validation_report(validate(ephemeris))
+    p = ephemeris.get_position("mars")
+    jde = 0.5 * (ephemeris.jde_start + ephemeris.jde_end)
+    n = 100000
+    t = time.time()
+    for i in range(n):
+        p.calculate_with_julianTD(jde + i * 0.001)
+    print("Scalar lookup: {:.2f} us".format((time.time() - t) * 1.0e6 / n))
@@ -0,0 +1,51 @@
+import os
+import shutil
+import tempfile
+import unittest
+import astrodate
+import chebyshev_ephemeris
+import mars
+import mercury
+
+
+class Test_ChebyshevEphemeris(unittest.TestCase):
+    def setUp(self):
+        self.planets = (("mercury", mercury), ("mars", mars))
+        self.ephemeris = chebyshev_ephemeris.build(astrodate.J2000, astrodate.J2000 + 400.0, planets=self.planets)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_position(self):
+        for name, planet in self.planets:
+            c = self.ephemeris.get_position(name)
+            for jde in (astrodate.J2000, astrodate.J2000 + 3.3, astrodate.J2000 + 251.75, astrodate.J2000 + 400.0):
+                p = planet.calculate_position_with_julianTD(jde)
+                c.calculate_with_julianTD(jde)
+                self.assertAlmostEqual(c.get_longitude(), p.get_longitude(), 8)
+                self.assertAlmostEqual(c.get_latitude(), p.get_latitude(), 8)
+                self.assertAlmostEqual(c.get_radius(), p.get_radius(), 10)
+        self.assertRaises(ValueError, c.calculate_with_julianTD, astrodate.J2000 - 1.0)
+
+    def test_save_load(self):
+        path = os.path.join(self.directory, "planets.bin")
+        chebyshev_ephemeris.save(path, self.ephemeris)
+        ephemeris = chebyshev_ephemeris.load(path)
+        self.assertEqual(ephemeris.get_names(), ["mercury", "mars"])
+        self.assertEqual(ephemeris.jde_start, self.ephemeris.jde_start)
+        self.assertEqual(ephemeris.jde_end, self.ephemeris.jde_end)
+        self.assertTrue((ephemeris.coefficients == self.ephemeris.coefficients).all())
+
+    def test_validate(self):
+        report = chebyshev_ephemeris.validate(self.ephemeris, 200, self.planets)
+        self.assertEqual([r[0] for r in report], ["mercury", "mars"])
+        for name, dL, dB, dR in report:
+            self.assertLess(dL, 0.001)
+            self.assertLess(dB, 0.001)
+            self.assertLess(dR, 1.0e-9)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -1,4 +1,9 @@
 import astrodate
+import bisect
+import csv
+import numpy as np
+import os
+import sys
 
 """
 In precise astronomical timekeeping, deltaT (Delta T, delta-T, deltaT, or DT) is the time difference obtained by
@@ -22,6 +27,7 @@ observed discrepancies.
 
 # deltat historical data - ftp://maia.usno.navy.mil/ser7/deltat.data
 # deltat predictions - ftp://maia.usno.navy.mil/ser7/deltat.preds
+# (current copies of these files can be used in place of the table, see reload_delta_t)
 
 DATE_DELTA_T_VALUES = \
 [
@@ -118,6 +124,88 @@ DELTA_T_ISLAM_SADIQ_QURESHI_POLYNOMIALS = (
 )
 
 
+DELTA_T_POLYNOMIAL_SETS = (
+    ("meeus", DELTA_T_MEEUS_POLYNOMIALS),
+    ("montenbruck_pfleger", DELTA_T_MONTENBRUCK_PFLEGER_POLYNOMIALS),
+    ("meeus_simon", DELTA_T_MEEUS_SIMON_POLYNOMIALS),
+    ("islam_sadiq_qureshi", DELTA_T_ISLAM_SADIQ_QURESHI_POLYNOMIALS)
+)
+
+
+class DeltaTPolynomials:
+    """
+    A set of delta-t polynomials compiled into the boundaries of its segments and a matrix of coefficients (one row
+    per segment, highest order last, padded with zeros) for Horner evaluation. The argument of every polynomial is
+    linear in the year, so it is kept as its value at the start of the segment and its change per year.
+    """
+
+    def __init__(self, polys):
+        """
+        Compile a set of polynomials.
+        :param polys: the (start year, end year, coefficients, argument) polynomials, in order of year
+        """
+        polys = sorted(polys, key=lambda poly: poly[0])
+        self.starts = [float(poly[0]) for poly in polys]
+        self.ends = [float(poly[1]) for poly in polys]
+        self.origins = [float(poly[3](poly[0])) for poly in polys]
+        self.rates = [(poly[3](poly[1]) - poly[3](poly[0])) / float(poly[1] - poly[0]) for poly in polys]
+        order = max(len(poly[2]) for poly in polys)
+        self.coefficients = [[float(c) for c in poly[2]] + [0.0] * (order - len(poly[2])) for poly in polys]
+        self.reversed_coefficients = [list(reversed(poly[2])) for poly in polys]
+        self.arrays = None
+
+    def get_first_year(self):
+        return self.starts[0]
+
+    def get_last_year(self):
+        return self.ends[-1]
+
+    def calculate(self, years):
+        """
+        Calculate delta-t.
+        :param years: the fractional year, or a sequence or ndarray of them
+        :return: the value of delta-t in seconds (None, or NaN in an array, for the years the set does not cover)
+        """
+        if not hasattr(years, "__len__"):
+            i = bisect.bisect_right(self.starts, years) - 1
+            if i < 0 or years >= self.ends[i]:
+                return None
+            u = self.origins[i] + ((years - self.starts[i]) * self.rates[i])
+            dt = 0.0
+            for c in self.reversed_coefficients[i]:
+                dt = (dt * u) + c
+            return dt
+        if self.arrays is None:
+            self.arrays = [np.array(a) for a in (self.starts, self.ends, self.origins, self.rates, self.coefficients)]
+        starts, ends, origins, rates, coefficients = self.arrays
+        years = np.asarray(years, dtype=np.float64)
+        i = np.searchsorted(starts, years, side="right") - 1
+        covered = (i >= 0) & (years < ends[np.maximum(i, 0)])
+        i = np.maximum(i, 0)
+        u = origins[i] + ((years - starts[i]) * rates[i])
+        c = coefficients[i]
+        dt = c[..., -1]
+        for k in range(coefficients.shape[1] - 2, -1, -1):
+            dt = (dt * u) + c[..., k]
+        return np.where(covered, dt, np.nan)
+
+
+DELTA_T_COMPILED_POLYNOMIALS = {}
+
+
+def get_delta_t_polynomials(polys):
+    """
+    Get a set of polynomials compiled, compiling it on first use.
+    :param polys: the set of polynomials (i.e. DELTA_T_MEEUS_POLYNOMIALS)
+    :return: the DeltaTPolynomials
+    """
+    compiled = DELTA_T_COMPILED_POLYNOMIALS.get(polys)
+    if compiled is None:
+        compiled = DeltaTPolynomials(polys)
+        DELTA_T_COMPILED_POLYNOMIALS[polys] = compiled
+    return compiled
+
+
 def calc_dt_poly(polys, dat):
     """
     Calculate the value of dalta-t from a polynomial equation.
@@ -126,33 +214,283 @@ def calc_dt_poly(polys, dat):
     :return: the value of delta-t
     """
     if polys and dat:
-        for poly in polys:
-            if poly[0] <= dat[0] < poly[1]:
-                u = poly[3](dat[0])
-                dt = 0.0
-                for i, coef in reversed(list(enumerate(poly[2]))):
-                    dt = coef + dt
-                    if i != 0:
-                        dt *= u
-                return dt
+        return get_delta_t_polynomials(polys).calculate(dat[0])
     return None
 
 
+DELTA_T_EXTRAPOLATION_YEARS = 70      # years either side of the table over which its end slopes are followed
+DAYS_BEFORE_MONTH = [0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+
+
+class DeltaTSpline:
+    """
+    A natural cubic spline of delta-t through a table of yearly values (at the start of each year), evaluated on
+    fractional years. The segment of a year is found by indexing, so a value costs the same anywhere in the table.
+    Beyond the table the end slopes are followed for DELTA_T_EXTRAPOLATION_YEARS, and past that the parabola of
+    Morrison & Stephenson is used. The spline is fitted once; evaluating a year is cheaper than looking it up in an
+    LRU cache would be, so values are not cached.
+    """
+
+    def __init__(self, first_year, values):
+        """
+        Create the spline.
+        :param first_year: the year of the first value
+        :param values: the values of delta-t (in seconds) for consecutive years
+        """
+        if len(values) < 2:
+            raise ValueError("Invalid delta-t table! (Needs at least 2 values)")
+        self.first_year = first_year
+        self.last_year = first_year + len(values) - 1
+        self.coefficients = self.__fit([float(v) for v in values])
+        self.coefficient_array = None
+        a, b, c, d = self.coefficients[-1]
+        self.first_value = self.coefficients[0][0]
+        self.first_slope = self.coefficients[0][1]
+        self.last_value = a + b + c + d
+        self.last_slope = b + (2.0 * c) + (3.0 * d)
+
+    @staticmethod
+    def __fit(y):
+        # the second derivatives at the knots (zero at the ends), from the tridiagonal system for unit spacing
+        n = len(y)
+        m = [0.0] * n
+        if n > 2:
+            diagonal = [4.0] * (n - 2)
+            rhs = [6.0 * (y[i + 1] - (2.0 * y[i]) + y[i - 1]) for i in range(1, n - 1)]
+            for i in range(1, n - 2):
+                w = 1.0 / diagonal[i - 1]
+                diagonal[i] -= w
+                rhs[i] -= w * rhs[i - 1]
+            m[n - 2] = rhs[-1] / diagonal[-1]
+            for i in range(n - 4, -1, -1):
+                m[i + 1] = (rhs[i] - m[i + 2]) / diagonal[i]
+        return [(y[i], (y[i + 1] - y[i]) - (((2.0 * m[i]) + m[i + 1]) / 6.0), m[i] / 2.0, (m[i + 1] - m[i]) / 6.0)
+                for i in range(n - 1)]
+
+    def __calculate_one(self, year, jd):
+        if (year < self.first_year - DELTA_T_EXTRAPOLATION_YEARS) or \
+                (year > self.last_year + DELTA_T_EXTRAPOLATION_YEARS):
+            if jd is None:
+                jd = astrodate.J2000 + ((year - 2000.0) * 365.25)
+            dy = jd - 2382148.0
+            return ((dy * dy) / 41048480.0) - 15.0
+        if year < self.first_year:
+            return self.first_value + ((year - self.first_year) * self.first_slope)
+        if year >= self.last_year:
+            return self.last_value + ((year - self.last_year) * self.last_slope)
+        x = year - self.first_year
+        i = int(x)
+        s = x - i
+        a, b, c, d = self.coefficients[i]
+        return a + (s * (b + (s * (c + (s * d)))))
+
+    def calculate(self, years, jds=None):
+        """
+        Calculate delta-t.
+        :param years: the fractional year (i.e. 2017.5), or a sequence or ndarray of them
+        :param jds: the julian dates of the years for the parabola past the table (derived from years if None)
+        :return: the value of delta-t in seconds (a float, or an ndarray matching years)
+        """
+        if not hasattr(years, "__len__"):
+            return self.__calculate_one(years, jds)
+        years = np.asarray(years, dtype=np.float64)
+        if self.coefficient_array is None:
+            self.coefficient_array = np.array(self.coefficients)
+        if jds is None:
+            jds = astrodate.J2000 + ((years - 2000.0) * 365.25)
+        x = years - self.first_year
+        i = np.clip(np.floor(x).astype(np.int64), 0, len(self.coefficients) - 1)
+        s = x - i
+        a, b, c, d = self.coefficient_array[i].T
+        dt = a + (s * (b + (s * (c + (s * d)))))
+        dt = np.where(years < self.first_year, self.first_value + ((years - self.first_year) * self.first_slope), dt)
+        dt = np.where(years >= self.last_year, self.last_value + ((years - self.last_year) * self.last_slope), dt)
+        dy = np.asarray(jds, dtype=np.float64) - 2382148.0
+        far = (years < self.first_year - DELTA_T_EXTRAPOLATION_YEARS) | \
+              (years > self.last_year + DELTA_T_EXTRAPOLATION_YEARS)
+        return np.where(far, ((dy * dy) / 41048480.0) - 15.0, dt)
+
+    def calculate_with_julian(self, jds):
+        """
+        Calculate delta-t for julian dates (taking julian years from J2000.0 as the fractional years).
+        :param jds: the julian date, or a sequence or ndarray of them
+        :return: the value of delta-t in seconds (a float, or an ndarray matching jds)
+        """
+        if hasattr(jds, "__len__"):
+            jds = np.asarray(jds, dtype=np.float64)
+        return self.calculate(2000.0 + ((jds - astrodate.J2000) / 365.25), jds)
+
+
+DELTA_T_SPLINE = None
+DELTA_T_PATH = os.environ.get("ASTROCORE_DELTA_T_PATH")   # the directory of the USNO files (None for the table)
+DELTA_T_DATA_FILE = "deltat.data"
+DELTA_T_PREDS_FILE = "deltat.preds"
+DELTA_T_CACHE_FILE = "deltat.npy"
+DELTA_T_CACHE_VERSION = 1
+
+
+def read_delta_t_data(path):
+    """
+    Read a USNO deltat.data file of observed values (lines of year, month, day, delta-t).
+    :param path: the path of the file
+    :return: a dictionary of the values at the start of each year (in seconds), by year
+    """
+    values = {}
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            try:
+                year, month, day, dt = int(fields[0]), int(fields[1]), int(fields[2]), float(fields[3])
+            except (IndexError, ValueError):
+                continue
+            if month == 1 and day == 1:
+                values[year] = dt
+    return values
+
+
+def read_delta_t_preds(path):
+    """
+    Read a USNO deltat.preds file of predicted values (lines of MJD, fractional year, delta-t, ..., or of
+    fractional year, delta-t, error in the older layout).
+    :param path: the path of the file
+    :return: a dictionary of the values at the start of each year (in seconds), by year
+    """
+    values = {}
+    with open(path) as f:
+        for line in f:
+            try:
+                fields = [float(field) for field in line.split()]
+            except ValueError:
+                continue
+            if len(fields) < 2:
+                continue
+            if fields[0] > 10000.0:
+                fields = fields[1:]
+            year, dt = fields[0], fields[1]
+            if year == int(year):
+                values[int(year)] = dt
+    return values
+
+
+def get_delta_t_file_times(path):
+    times = []
+    for name in (DELTA_T_DATA_FILE, DELTA_T_PREDS_FILE):
+        name = os.path.join(path, name)
+        times.append(os.path.getmtime(name) if os.path.exists(name) else 0.0)
+    return times
+
+
+def load_delta_t_values(path):
+    """
+    Load the yearly values of delta-t from the USNO files in a directory, over the built in table.
+    The table is kept for the years before the files start, predictions follow the last observed value, and gaps
+    are interpolated linearly. The result is kept in a .npy file beside the USNO files and read from it until
+    either of them changes.
+    :param path: the directory of deltat.data and/or deltat.preds
+    :return: the first year, the values of delta-t (in seconds) for consecutive years
+    """
+    times = get_delta_t_file_times(path)
+    if times == [0.0, 0.0]:
+        raise IOError("No delta-t files! ({})".format(path))
+    cache_path = os.path.join(path, DELTA_T_CACHE_FILE)
+    try:
+        cached = np.load(cache_path)
+        if cached[0] == DELTA_T_CACHE_VERSION and list(cached[1:3]) == times:
+            return int(cached[3]), cached[4:].tolist()
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+    values = {}
+    if times[0]:
+        values = read_delta_t_data(os.path.join(path, DELTA_T_DATA_FILE))
+    if times[1]:
+        last = max(values) if values else None
+        for year, dt in read_delta_t_preds(os.path.join(path, DELTA_T_PREDS_FILE)).items():
+            if last is None or year > last:
+                values[year] = dt
+    if not values:
+        raise IOError("No delta-t values in the files! ({})".format(path))
+    start = min(values)
+    for year, dt in zip(range(DATE_TD_YEAR_MIN, DATE_TD_YEAR_MAX + 1), DATE_DELTA_T_VALUES):
+        if year < start:
+            values[year] = dt
+    years = sorted(values)
+    first = years[0]
+    filled = np.interp(np.arange(first, years[-1] + 1), years, [values[year] for year in years])
+    try:
+        tmp_path = "{}.{}.tmp.npy".format(cache_path[:-len(".npy")], os.getpid())
+        np.save(tmp_path, np.concatenate(([DELTA_T_CACHE_VERSION], times, [first], filled)))
+        os.rename(tmp_path, cache_path)
+    except (IOError, OSError):
+        pass
+    return first, filled.tolist()
+
+
+def reload_delta_t(path=None):
+    """
+    Rebuild the spline of delta-t, from the USNO files when a path is given or DELTA_T_PATH is set, otherwise (or
+    when there are no files) from DATE_DELTA_T_VALUES. The new spline replaces the old one in a single assignment,
+    so a reload can happen while delta-t is in use.
+    :param path: the directory of the USNO files (replaces DELTA_T_PATH)
+    :return: the DeltaTSpline
+    """
+    global DELTA_T_PATH, DELTA_T_SPLINE
+    if path is not None:
+        DELTA_T_PATH = path
+    spline = None
+    if DELTA_T_PATH:
+        try:
+            spline = DeltaTSpline(*load_delta_t_values(DELTA_T_PATH))
+        except (IOError, OSError):
+            spline = None
+    if spline is None:
+        spline = DeltaTSpline(DATE_TD_YEAR_MIN, DATE_DELTA_T_VALUES)
+    DELTA_T_SPLINE = spline
+    return spline
+
+
+def get_delta_t_spline():
+    """
+    Get the spline of delta-t, building it on first use (see reload_delta_t).
+    :return: the DeltaTSpline
+    """
+    spline = DELTA_T_SPLINE
+    if spline is None:
+        spline = reload_delta_t()
+    return spline
+
+
+def calculate_delta_t(years):
+    return get_delta_t_spline().calculate(years)
+
+
+def calculate_delta_t_with_julian(jds):
+    return get_delta_t_spline().calculate_with_julian(jds)
+
+
+def calculate_fractional_year(dat):
+    """
+    Calculate the fractional year of a date tuple (i.e. (2017, 7, 2, 12, 0, 0.0) is about 2017.5).
+    :param dat: the date tuple (year, month, day[, hours, minutes, seconds[, mode]])
+    :return: the fractional year
+    """
+    year, month, day = dat[0], dat[1], dat[2]
+    leap = ((year % 4) == 0) and (((year % 100) != 0) or ((year % 400) == 0))
+    days = DAYS_BEFORE_MONTH[month] + day - 1.0
+    if leap and month > 2:
+        days += 1.0
+    if len(dat) > 3:
+        days += ((((dat[5] / 60.0) + dat[4]) / 60.0) + dat[3]) / 24.0
+    return year + (days / (366.0 if leap else 365.0))
+
+
 def calc_dt(year, jde):
-    if (year < DATE_TD_YEAR_MIN - 70) or (year > DATE_TD_YEAR_MAX + 70):
-        dy = jde - 2382148.0
-        dt = ((dy * dy) / 41048480.0) - 15.0
-    elif year < DATE_TD_YEAR_MIN:
-        m = (DATE_DELTA_T_VALUES[1] - DATE_DELTA_T_VALUES[0]) / 2.0
-        dt = ((year - DATE_TD_YEAR_MIN) * m) + DATE_DELTA_T_VALUES[0]
-    elif year > DATE_TD_YEAR_MAX:
-        last = (DATE_TD_YEAR_MAX - DATE_TD_YEAR_MIN) / 2
-        m = (DATE_DELTA_T_VALUES[last] - DATE_DELTA_T_VALUES[last - 1]) / 2.0
-        dt = ((year - DATE_TD_YEAR_MAX) * m) + DATE_DELTA_T_VALUES[last]
-    else:
-        i = year - DATE_TD_YEAR_MIN
-        dt = DATE_DELTA_T_VALUES[i]
-    return dt
+    """
+    Calculate the value of delta-t for a year.
+    :param year: the (fractional) year
+    :param jde: the julian date of the year (for the parabola past the table)
+    :return: the value of delta-t
+    """
+    return get_delta_t_spline().calculate(year, jde)
 
 
 def calc_dt_interp(dat):
@@ -162,66 +500,56 @@ def calc_dt_interp(dat):
     :return: the value for dalta-t
     """
     if dat:
-        if (dat[0] < DATE_TD_YEAR_MIN - 70) or (dat[0] > DATE_TD_YEAR_MAX + 70):
-            julian = astrodate.calculate_julian(dat[0], dat[1], dat[2])
-            dy = julian - 2382148.0
-            dt = ((dy * dy) / 41048480.0) - 15.0
-        elif dat[0] < DATE_TD_YEAR_MIN:
-            m = (DATE_DELTA_T_VALUES[1] - DATE_DELTA_T_VALUES[0]) / 2.0
-            dt = ((dat[0] - DATE_TD_YEAR_MIN) * m) + DATE_DELTA_T_VALUES[0]
-        elif dat[0] > DATE_TD_YEAR_MAX:
-            last = (DATE_TD_YEAR_MAX - DATE_TD_YEAR_MIN) / 2
-            m = (DATE_DELTA_T_VALUES[last] - DATE_DELTA_T_VALUES[last - 1]) / 2.0
-            dt = ((dat[0] - DATE_TD_YEAR_MAX) * m) + DATE_DELTA_T_VALUES[last]
-        else:
-            i = dat[0] - DATE_TD_YEAR_MIN
-            dt = DATE_DELTA_T_VALUES[i]
-        return dt
+        return get_delta_t_spline().calculate(calculate_fractional_year(dat))
     return None
 
 
-def show_delta_t_with_errors():
+def calculate_delta_t_errors(polys, years=None):
+    """
+    Calculate the errors of a set of polynomials against the table of historical values.
+    :param polys: the set of polynomials (i.e. DELTA_T_MEEUS_POLYNOMIALS)
+    :param years: the years to compare (defaults to the start of every year the set covers in the table)
+    :return: the number of years compared, the max absolute error, the mean absolute error, the rms error
+    """
+    compiled = get_delta_t_polynomials(polys)
+    if years is None:
+        years = np.arange(max(compiled.get_first_year(), DATE_TD_YEAR_MIN),
+                          min(compiled.get_last_year(), DATE_TD_YEAR_MAX), dtype=np.float64)
+    years = np.asarray(years, dtype=np.float64)
+    errors = compiled.calculate(years) - calculate_delta_t(years)
+    errors = np.abs(errors[~np.isnan(errors)])
+    if len(errors) == 0:
+        return 0, None, None, None
+    return len(errors), errors.max(), errors.mean(), np.sqrt((errors * errors).mean())
+
+
+def show_delta_t_with_errors(output=None):
     """
     Perform a comparison of polynomial generated values of delta-t with those interpolated from historical values.
-    This method produces a table of values and their absolute error followed by a summary of the errors for the
-    polynomial sets.
+    This method writes CSV: a row for each year (the table value, then the value and absolute error of each
+    polynomial set, empty where a set does not apply), a blank line, then a row summarizing the errors of each set.
+    :param output: the file to write to (defaults to sys.stdout)
     """
-    polynomial_sets = (
-        ("Meeus Polynomials", DELTA_T_MEEUS_POLYNOMIALS),
-        ("Montenbruck Pfleger Polynomials", DELTA_T_MONTENBRUCK_PFLEGER_POLYNOMIALS),
-        ("Meeus Simon Polynomials", DELTA_T_MEEUS_SIMON_POLYNOMIALS),
-        ("Islam Sadiq, Qureshi Polynomials", DELTA_T_ISLAM_SADIQ_QURESHI_POLYNOMIALS)
-    )
-    error_sets = []
-    for set in polynomial_sets:
-        e_set = [0.0, 0.0, 0]        # max ae, sum ae^2, n
-        error_sets.append(e_set)
-    for y in xrange(DATE_TD_YEAR_MIN, DATE_TD_YEAR_MAX):
-        dat = (y, 1, 1)
-        dt_i = calc_dt_interp(dat)
-        s = "%4i  %6.2f  " % (y, dt_i)
-        print s,
-        for i, poly_set in enumerate(polynomial_sets):
-            dt_p = calc_dt_poly(poly_set[1], dat)
-            if dt_p:
-                ae = abs(dt_i - dt_p)
-                if ae > error_sets[i][0]:
-                    error_sets[i][0] = ae
-                error_sets[i][1] += ae
-                error_sets[i][2] += 1
-                s = "%6.2f (%3.2f)  " % (dt_p, ae)
-                print s,
-            else:
-                print "           na  ",
-        print
-    print
-    for i, e_set in enumerate(error_sets):
-        name = polynomial_sets[i][0]
-        max_ae = e_set[0]
-        avg_ae = e_set[1] / e_set[2]
-        print "%s Error Summary" % name
-        print "  Max Absolute Error: %3.3f" % max_ae
-        print "  Avg Absolute Error: %3.3f" % avg_ae
+    if output is None:
+        output = sys.stdout
+    writer = csv.writer(output, lineterminator="\n")
+    years = np.arange(DATE_TD_YEAR_MIN, DATE_TD_YEAR_MAX, dtype=np.float64)
+    table = calculate_delta_t(years)
+    columns = [years.astype(int), np.round(table, 4)]
+    header = ["year", "table"]
+    for name, polys in DELTA_T_POLYNOMIAL_SETS:
+        dt = get_delta_t_polynomials(polys).calculate(years)
+        columns.extend((np.round(dt, 4), np.round(np.abs(dt - table), 4)))
+        header.extend((name, name + "_error"))
+    writer.writerow(header)
+    for row in zip(*columns):
+        writer.writerow(["" if v != v else v for v in row])
+    output.write("\n")
+    writer.writerow(["set", "years", "max_error", "mean_error", "rms_error"])
+    for name, polys in DELTA_T_POLYNOMIAL_SETS:
+        n, max_ae, mean_ae, rms = calculate_delta_t_errors(polys)
+        writer.writerow([name, n, "%.3f" % max_ae, "%.3f" % mean_ae, "%.3f" % rms])
+
 
 # Calculate the error for a single polynomial from a set.
 def calc_error_summary(poly):
@@ -231,24 +559,8 @@ def calc_error_summary(poly):
     :return: max error, average error
     """
     if poly:
-        max_ae = 0.0
-        sum_ae = 0.0
-        n = 0
-        for y in xrange(poly[0], poly[1]):
-            dat = (y, 1, 1)
-            dt_i = calc_dt_interp(dat)
-            u = poly[3](dat[0])
-            dt = 0.0
-            for i, coef in reversed(list(enumerate(poly[2]))):
-                dt = coef + dt
-                if i != 0:
-                    dt *= u
-            ae = abs(dt_i - dt)
-            if ae > max_ae:
-                max_ae = ae
-            sum_ae += ae
-            n += 1
-        return max_ae, (sum_ae / n)
+        n, max_ae, mean_ae, rms = calculate_delta_t_errors((poly,), range(poly[0], poly[1]))
+        return max_ae, mean_ae
     return None
 
 
@@ -0,0 +1,87 @@
+import unittest
+import deltat
+import numpy
+import os
+import shutil
+import tempfile
+
+
+class Test_DeltaT(unittest.TestCase):
+    def test_spline(self):
+        # the spline passes through the table at the start of each year
+        for i in range(0, len(deltat.DATE_DELTA_T_VALUES), 37):
+            year = deltat.DATE_TD_YEAR_MIN + i
+            self.assertAlmostEqual(deltat.calc_dt_interp((year, 1, 1)), deltat.DATE_DELTA_T_VALUES[i], 9)
+        # and is smooth across the boundaries of the years
+        before = deltat.calc_dt_interp((1979, 12, 31, 23, 59, 59.0))
+        after = deltat.calc_dt_interp((1980, 1, 1, 0, 0, 1.0))
+        self.assertAlmostEqual(before, after, 4)
+        self.assertTrue(50.54 < deltat.calc_dt_interp((1980, 4, 22, 15, 36, 51.67)) < 51.38)
+
+    def test_spline_array(self):
+        years = numpy.array([-500.0, 1500.0, 1619.5, 1700.25, 1980.3, 2026.0, 2050.5, 2200.0])
+        dts = deltat.calculate_delta_t(years)
+        for year, dt in zip(years, dts):
+            self.assertAlmostEqual(dt, deltat.calculate_delta_t(float(year)), 9)
+        jds = numpy.array([2444351.5, 2451545.0, 2457860.5])
+        dts = deltat.calculate_delta_t_with_julian(jds)
+        for jd, dt in zip(jds, dts):
+            self.assertAlmostEqual(dt, deltat.calculate_delta_t_with_julian(float(jd)), 9)
+
+    def test_fractional_year(self):
+        self.assertEqual(deltat.calculate_fractional_year((2017, 1, 1)), 2017.0)
+        self.assertEqual(deltat.calculate_fractional_year((2016, 7, 2, 0, 0, 0.0)), 2016.5)
+        self.assertEqual(deltat.calculate_fractional_year((2017, 7, 2, 12, 0, 0.0, u'utc')), 2017.5)
+
+    def test_polynomials(self):
+        # Meeus, Astronomical Algorithms (2nd ed.), the 1800-1900 and 1900-1997 polynomials
+        self.assertAlmostEqual(deltat.calc_dt_poly(deltat.DELTA_T_MEEUS_POLYNOMIALS, (1900, 1, 1)), -2.44, 9)
+        self.assertIsNone(deltat.calc_dt_poly(deltat.DELTA_T_MEEUS_POLYNOMIALS, (1997, 1, 1)))
+        years = numpy.array([1619.0, 1620.0, 1689.9, 1690.0, 1850.5, 1999.99, 2000.0])
+        for name, polys in deltat.DELTA_T_POLYNOMIAL_SETS:
+            dts = deltat.get_delta_t_polynomials(polys).calculate(years)
+            for year, dt in zip(years, dts):
+                expected = deltat.calc_dt_poly(polys, (float(year),))
+                if expected is None:
+                    self.assertTrue(numpy.isnan(dt))
+                else:
+                    self.assertAlmostEqual(dt, expected, 9)
+        n, max_ae, mean_ae, rms = deltat.calculate_delta_t_errors(deltat.DELTA_T_ISLAM_SADIQ_QURESHI_POLYNOMIALS)
+        self.assertEqual(n, 380)
+        self.assertTrue(mean_ae <= rms <= max_ae < 1.0)
+
+    def test_files(self):
+        saved_path = deltat.DELTA_T_PATH
+        path = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(path, deltat.DELTA_T_DATA_FILE), "w") as f:
+                f.write(" 2024  1  1  69.2000\n 2024  2  1  69.2100\n 2025  1  1  69.3000\n")
+            with open(os.path.join(path, deltat.DELTA_T_PREDS_FILE), "w") as f:
+                f.write("     MJD      YEAR    TT-UT Pred  UT1-UTC Pred  ERROR\n")
+                f.write("  60676.00  2025.00     69.350      -0.0500      0.000\n")
+                f.write("  60767.00  2025.25     69.380      -0.0600      0.010\n")
+                f.write("  61406.00  2027.00     69.500      -0.1000      0.200\n")
+            spline = deltat.reload_delta_t(path)
+            self.assertTrue(os.path.exists(os.path.join(path, deltat.DELTA_T_CACHE_FILE)))
+            self.assertEqual(spline.last_year, 2027)
+            self.assertAlmostEqual(deltat.calc_dt_interp((2024, 1, 1)), 69.2, 9)
+            self.assertAlmostEqual(deltat.calc_dt_interp((2025, 1, 1)), 69.3, 9)
+            self.assertAlmostEqual(deltat.calc_dt_interp((2026, 1, 1)), 69.4, 9)
+            self.assertAlmostEqual(deltat.calc_dt_interp((1980, 1, 1)), 50.5387, 9)
+            # the values are read from the cache until the files change
+            cache_path = os.path.join(path, deltat.DELTA_T_CACHE_FILE)
+            cached = numpy.load(cache_path)
+            cached[-1] = 99.0
+            numpy.save(cache_path, cached)
+            self.assertEqual(deltat.load_delta_t_values(path)[1][-1], 99.0)
+            with open(os.path.join(path, deltat.DELTA_T_PREDS_FILE), "a") as f:
+                f.write("  61771.00  2028.00     69.600      -0.1000      0.300\n")
+            os.utime(os.path.join(path, deltat.DELTA_T_PREDS_FILE), (0, 1.0e9))
+            self.assertEqual(deltat.reload_delta_t().last_year, 2028)
+            os.remove(os.path.join(path, deltat.DELTA_T_DATA_FILE))
+            os.remove(os.path.join(path, deltat.DELTA_T_PREDS_FILE))
+            self.assertEqual(deltat.reload_delta_t().last_year, deltat.DATE_TD_YEAR_MAX)
+        finally:
+            shutil.rmtree(path)
+            deltat.DELTA_T_PATH = saved_path
+            deltat.reload_delta_t()
@@ -1,6 +1,7 @@
 import unittest
 import astrodate
 import earth
+import numpy
 
 class Test_Earth(unittest.TestCase):
     def setUp(self):
@@ -20,6 +21,61 @@ class Test_Earth(unittest.TestCase):
         self.assertEqual(mean_obliquity, 23.440946290957324)
         self.assertEqual(true_obliquity, 23.443569238112364)
 
+    def test_nutation_array(self):
+        jdes = [2446895.5, 2451545.0, 2469807.5]
+        a = earth.calculate_nutations_with_julianTD(jdes)
+        self.assertEqual(len(a), 3)
+        for i, jde in enumerate(jdes):
+            n = earth.Nutation()
+            n.calculate_with_julianTD(jde)
+            self.assertEqual(a.get_nutation_in_longitude()[i], n.get_nutation_in_longitude())
+            self.assertEqual(a.get_nutation_in_obliquity()[i], n.get_nutation_in_obliquity())
+            self.assertEqual(a.get_true_obliquity()[i], n.get_true_obliquity())
+
+    def test_nutation_cache(self):
+        earth.NUTATION_CACHE.clear()
+        n = earth.Nutation()
+        n.calculate_with_julianTD(2446895.5)
+        n.calculate_with_julianTD(2446895.5)
+        self.assertEqual(earth.NUTATION_CACHE.get_misses(), 1)
+        self.assertEqual(earth.NUTATION_CACHE.get_hits(), 1)
+        self.assertEqual(n.get_nutation_in_longitude(), -0.001052332550403307)
+
+    def test_nutation_iau2000b(self):
+        # the SOFA test of iauNut00b (2400000.5 + 53736.0), in radians
+        n = earth.Nutation(earth.NUTATION_MODEL_IAU2000B)
+        n.calculate_with_julianTD(2400000.5 + 53736.0)
+        self.assertAlmostEqual(numpy.radians(n.get_nutation_in_longitude()), -0.9632552291148362783e-5, 13)
+        self.assertAlmostEqual(numpy.radians(n.get_nutation_in_obliquity()), 0.4063197106621159367e-4, 13)
+        jdes = numpy.array([2446895.5, 2451545.0, 2469807.5])
+        a = earth.calculate_nutations_with_julianTD(jdes, earth.NUTATION_MODEL_IAU2000B)
+        b = earth.calculate_nutations_with_julianTD(jdes)
+        self.assertTrue(numpy.abs(a.get_nutation_in_longitude() - b.get_nutation_in_longitude()).max() < 0.05 / 3600.0)
+        self.assertTrue(numpy.abs(a.get_nutation_in_obliquity() - b.get_nutation_in_obliquity()).max() < 0.05 / 3600.0)
+        psi_rate, eps_rate = earth.calculate_nutation_rates_with_julianTD(jdes, earth.NUTATION_MODEL_IAU2000B)
+        psi0, eps0, obliquity = earth.calculate_nutation_with_julianTD(jdes - 0.001, earth.NUTATION_MODEL_IAU2000B)
+        psi1, eps1, obliquity = earth.calculate_nutation_with_julianTD(jdes + 0.001, earth.NUTATION_MODEL_IAU2000B)
+        self.assertTrue(numpy.abs(psi_rate - ((psi1 - psi0) / 0.002)).max() < 1.0e-10)
+        self.assertTrue(numpy.abs(eps_rate - ((eps1 - eps0) / 0.002)).max() < 1.0e-10)
+        self.assertRaises(ValueError, earth.Nutation, u"iau2000a")
+
+    def test_nutation_table(self):
+        jdes = numpy.linspace(2415020.5, 2488070.5, 5001)
+        t = earth.NutationTable()
+        t.calculate_with_julianTD(jdes)
+        a = earth.calculate_nutations_with_julianTD(jdes)
+        self.assertTrue(numpy.abs(t.get_nutation_in_longitude() - a.get_nutation_in_longitude()).max() < 1.0e-6 / 3600.0)
+        self.assertTrue(numpy.abs(t.get_nutation_in_obliquity() - a.get_nutation_in_obliquity()).max() < 1.0e-6 / 3600.0)
+        self.assertTrue(numpy.abs(t.get_true_obliquity() - a.get_true_obliquity()).max() < 1.0e-6 / 3600.0)
+        n = earth.Nutation()
+        n.calculate_with_julianTD(2446895.5)
+        t = earth.NutationTable()
+        t.calculate_with_julianTD(2446895.5)
+        self.assertTrue(isinstance(t.get_nutation_in_longitude(), float))
+        self.assertAlmostEqual(t.get_nutation_in_longitude(), n.get_nutation_in_longitude(), 9)
+        self.assertAlmostEqual(t.get_mean_obliquity(), n.get_mean_obliquity(), 12)
+        self.assertIs(t.nodes, earth.NUTATION_TABLE_NODES[(earth.NUTATION_MODEL_IAU1980, earth.NUTATION_TABLE_STEP)])
+
     def test_position(self):
         p = earth.Position(earth.TERMS_VSOP87D)
 
@@ -0,0 +1,420 @@
+"""
+Geocentric apparent positions of the planets.
+
+The position of a planet is seen from Earth where it was when its light left it, so the planet is
+recalculated back along the light-time until the light-time stops changing. Earth's position and the
+nutation depend only on the instant of observation, so they are calculated once and reused by every
+iteration. The FK5 correction, aberration and nutation then give the apparent ecliptical and equatorial
+coordinates (Meeus, Astronomical Algorithms, chapters 23 and 33).
+"""
+
+import astrocoord
+import astrodate
+import earth
+import heliocentric_position
+import math
+import mathutils
+import numpy as np
+
+LIGHT_TIME_PER_AU = 0.0057755183                # days
+LIGHT_TIME_TOLERANCE = 1.0E-9                   # days
+MAX_LIGHT_TIME_ITERATIONS = 10
+ABERRATION_CONSTANT = 20.49552 / 3600.0         # degrees
+
+
+def calculate_aberration(T, lng, lat, sun_lng):
+    """
+    Calculate the annual aberration of a body.
+    :param T: the time in julian centuries from J2000.0
+    :param lng: the geocentric ecliptical longitude of the body (in degrees)
+    :param lat: the geocentric ecliptical latitude of the body (in degrees)
+    :param sun_lng: the true geometric longitude of the Sun (in degrees)
+    :return: the aberration in longitude, the aberration in latitude (in degrees)
+    """
+    toRad = math.pi / 180.0
+    e = 0.016708634 - (T * (0.000042037 + (T * 0.0000001267)))
+    pi = (102.93735 + (T * (1.71946 + (T * 0.00046)))) * toRad
+    lng = lng * toRad
+    lat = lat * toRad
+    sun_lng = sun_lng * toRad
+    dL = ABERRATION_CONSTANT * ((-np.cos(sun_lng - lng)) + (e * np.cos(pi - lng))) / np.cos(lat)
+    dB = -ABERRATION_CONSTANT * np.sin(lat) * (np.sin(sun_lng - lng) - (e * np.sin(pi - lng)))
+    return dL, dB
+
+
+def calculate_equatorial(lng, lat, obliquity):
+    """
+    Convert ecliptical coordinates to equatorial coordinates.
+    :param lng: the ecliptical longitude (in degrees)
+    :param lat: the ecliptical latitude (in degrees)
+    :param obliquity: the obliquity of the ecliptic (in degrees)
+    :return: the right ascension, the declination (in degrees)
+    """
+    toRad = math.pi / 180.0
+    lng = lng * toRad
+    lat = lat * toRad
+    obliquity = obliquity * toRad
+    sin_e = np.sin(obliquity)
+    cos_e = np.cos(obliquity)
+    ra = np.arctan2((np.sin(lng) * cos_e) - (np.tan(lat) * sin_e), np.cos(lng)) / toRad
+    dec = np.arcsin((np.sin(lat) * cos_e) + (np.cos(lat) * sin_e * np.sin(lng))) / toRad
+    return mathutils.normalize_array(ra, 0.0, 360.0), dec
+
+
+def calculate_xyz(lng, lat, r):
+    """
+    Convert ecliptical spherical coordinates to rectangular coordinates.
+    :param lng: the ecliptical longitude (in degrees)
+    :param lat: the ecliptical latitude (in degrees)
+    :param r: the radius
+    :return: x, y, z
+    """
+    toRad = math.pi / 180.0
+    lng = lng * toRad
+    lat = lat * toRad
+    cos_lat = np.cos(lat)
+    return r * cos_lat * np.cos(lng), r * cos_lat * np.sin(lng), r * np.sin(lat)
+
+
+class Position:
+    """
+    The geocentric apparent position of a planet.
+    """
+
+    def __init__(self, planet):
+        """
+        Create the position calculator for a planet.
+        :param planet: the planet module (i.e. mars)
+        """
+        if planet is earth:
+            raise ValueError("Earth has no geocentric position!")
+        self.planet = planet
+        self.planet_position = heliocentric_position.VectorPosition(planet.TERMS_VSOP87D)
+        self.earth_position = None
+        self.earth_nutation = None
+        self.light_time = 0.0
+        self.iterations = 0
+        self.distance = 0.0
+        self.longitude = 0.0
+        self.latitude = 0.0
+        self.dL_ABERRATION = 0.0
+        self.dB_ABERRATION = 0.0
+        self.ra = 0.0
+        self.dec = 0.0
+
+    def calculate_with_dateTD(self, dateTD):
+        if dateTD is None:
+            raise ValueError("Date (TD) is required!")
+        dateTD.to_td()
+        self.calculate_with_julianTD(dateTD.get_julian())
+
+    def calculate_with_julianTD(self, jde, earth_position=None, earth_nutation=None):
+        """
+        Calculate the apparent position of the planet.
+        Earth's position and the nutation can be provided when they are already known for the date.
+        :param jde: the julian date (in dynamical time)
+        :param earth_position: the heliocentric position of Earth for jde (calculated when None)
+        :param earth_nutation: the earth.Nutation for jde (calculated when None)
+        """
+        if earth_position is None:
+            earth_position = earth.calculate_position_with_julianTD(jde)
+        if earth_nutation is None:
+            earth_nutation = earth.Nutation()
+            earth_nutation.calculate_with_julianTD(jde)
+        self.earth_position = earth_position
+        self.earth_nutation = earth_nutation
+        x0, y0, z0 = calculate_xyz(earth_position.get_longitude0(), earth_position.get_latitude0(),
+                                   earth_position.get_radius())
+        tau = 0.0
+        self.iterations = 0
+        while True:
+            self.iterations += 1
+            p = self.planet_position
+            p.calculate_with_julianTD(jde - tau)
+            x, y, z = calculate_xyz(p.get_longitude0(), p.get_latitude0(), p.get_radius())
+            x -= x0
+            y -= y0
+            z -= z0
+            distance = math.sqrt((x * x) + (y * y) + (z * z))
+            new_tau = LIGHT_TIME_PER_AU * distance
+            done = abs(new_tau - tau) < LIGHT_TIME_TOLERANCE
+            tau = new_tau
+            if done or (self.iterations >= MAX_LIGHT_TIME_ITERATIONS):
+                break
+        self.light_time = tau
+        self.distance = distance
+        T = (jde - astrodate.J2000) / 36525.0
+        lng = mathutils.normalize_degrees(math.degrees(math.atan2(y, x)))
+        lat = math.degrees(math.atan2(z, math.sqrt((x * x) + (y * y))))
+        dL, dB = heliocentric_position.calculate_fk5_corrections(T, lng, lat)
+        self.longitude = mathutils.normalize_degrees(lng + float(dL))
+        self.latitude = lat + float(dB)
+        sun_lng = earth_position.get_longitude() + 180.0
+        dL, dB = calculate_aberration(T, self.longitude, self.latitude, sun_lng)
+        self.dL_ABERRATION = float(dL)
+        self.dB_ABERRATION = float(dB)
+        ra, dec = calculate_equatorial(self.get_apparent_longitude(), self.get_apparent_latitude(),
+                                       earth_nutation.get_true_obliquity())
+        self.ra = float(ra)
+        self.dec = float(dec)
+
+    def get_apparent_latitude(self):
+        """
+        Get the apparent ecliptical latitude (in degrees).
+        :return: the apparent latitude
+        """
+        return self.latitude + self.dB_ABERRATION
+
+    def get_apparent_longitude(self):
+        """
+        Get the apparent ecliptical longitude (in degrees), corrected for aberration and nutation.
+        :return: the apparent longitude
+        """
+        l = self.longitude + self.dL_ABERRATION + self.earth_nutation.get_nutation_in_longitude()
+        return mathutils.normalize_degrees(l)
+
+    def get_declination(self):
+        """
+        Get the apparent declination (in degrees).
+        :return: the declination
+        """
+        return self.dec
+
+    def get_distance(self):
+        """
+        Get the distance from Earth when the light left the planet (in astronomical units).
+        :return: the distance
+        """
+        return self.distance
+
+    def get_ecliptic_coordinate(self, apparent):
+        """
+        Get the ecliptical coordinate.
+        :param apparent: true=apparent position, false=true position (light-time only)
+        :return: the AstroCoord
+        """
+        if apparent:
+            lng = self.get_apparent_longitude()
+            lat = self.get_apparent_latitude()
+        else:
+            lng = self.get_longitude()
+            lat = self.get_latitude()
+        mode = astrocoord.make_mode(astrocoord.COORD_MODE_ECLIPTIC)
+        return astrocoord.AstroCoord().alloc_with_degrees(lng, lat, mode)
+
+    def get_equatorial_coordinate(self):
+        """
+        Get the apparent equatorial coordinate (right ascension in hours).
+        :return: the AstroCoord
+        """
+        mode = astrocoord.make_mode(astrocoord.COORD_MODE_EQUATORIAL, astrocoord.COORD1_UNIT_HOURS,
+                                    astrocoord.COORD1_TYPE_RA)
+        return astrocoord.AstroCoord().alloc_with_degrees(self.ra / 15.0, self.dec, mode)
+
+    def get_iterations(self):
+        """
+        Get the number of planet positions the light-time iteration calculated.
+        :return: the number of iterations
+        """
+        return self.iterations
+
+    def get_latitude(self):
+        """
+        Get the true ecliptical latitude (in degrees), corrected for light-time and to FK5.
+        :return: the latitude
+        """
+        return self.latitude
+
+    def get_light_time(self):
+        """
+        Get the light-time (in days).
+        :return: the light-time
+        """
+        return self.light_time
+
+    def get_longitude(self):
+        """
+        Get the true ecliptical longitude (in degrees), corrected for light-time and to FK5.
+        :return: the longitude
+        """
+        return self.longitude
+
+    def get_right_ascension(self):
+        """
+        Get the apparent right ascension (in degrees).
+        :return: the right ascension
+        """
+        return self.ra
+
+
+class PositionArray:
+    """
+    The geocentric apparent positions of a planet for an array of dates.
+    The light-time iteration runs over all the dates at once until every date has converged.
+    """
+
+    def __init__(self, planet):
+        """
+        Create the position calculator for a planet.
+        :param planet: the planet module (i.e. mars)
+        """
+        if planet is earth:
+            raise ValueError("Earth has no geocentric position!")
+        self.planet = planet
+        self.planet_position = heliocentric_position.PositionArray(planet.TERMS_VSOP87D)
+        self.earth_position = None
+        self.nutation_in_longitude = None
+        self.true_obliquity = None
+        self.light_time = None
+        self.iterations = 0
+        self.distance = None
+        self.longitude = None
+        self.latitude = None
+        self.dL_ABERRATION = None
+        self.dB_ABERRATION = None
+        self.ra = None
+        self.dec = None
+
+    def __len__(self):
+        if self.ra is None:
+            return 0
+        return len(self.ra)
+
+    def calculate_with_julianTD(self, jdes):
+        """
+        Calculate the apparent positions of the planet.
+        :param jdes: a sequence or ndarray of julian dates (in dynamical time)
+        """
+        jdes = np.atleast_1d(np.asarray(jdes, dtype=np.float64))
+        self.earth_position = earth.calculate_positions_with_julianTD(jdes)
+        nutation = earth.calculate_nutations_with_julianTD(jdes)
+        self.nutation_in_longitude = nutation.get_nutation_in_longitude()
+        self.true_obliquity = nutation.get_true_obliquity()
+        e = self.earth_position
+        x0, y0, z0 = calculate_xyz(e.get_longitude0(), e.get_latitude0(), e.get_radius())
+        tau = np.zeros(jdes.shape)
+        self.iterations = 0
+        while True:
+            self.iterations += 1
+            p = self.planet_position
+            p.calculate_with_julianTD(jdes - tau)
+            x, y, z = calculate_xyz(p.get_longitude0(), p.get_latitude0(), p.get_radius())
+            x -= x0
+            y -= y0
+            z -= z0
+            distance = np.sqrt((x * x) + (y * y) + (z * z))
+            new_tau = LIGHT_TIME_PER_AU * distance
+            done = np.abs(new_tau - tau).max() < LIGHT_TIME_TOLERANCE
+            tau = new_tau
+            if done or (self.iterations >= MAX_LIGHT_TIME_ITERATIONS):
+                break
+        self.light_time = tau
+        self.distance = distance
+        T = (jdes - astrodate.J2000) / 36525.0
+        lng = mathutils.normalize_array(np.degrees(np.arctan2(y, x)), 0.0, 360.0)
+        lat = np.degrees(np.arctan2(z, np.sqrt((x * x) + (y * y))))
+        dL, dB = heliocentric_position.calculate_fk5_corrections(T, lng, lat)
+        self.longitude = mathutils.normalize_array(lng + dL, 0.0, 360.0)
+        self.latitude = lat + dB
+        sun_lng = e.get_longitude() + 180.0
+        self.dL_ABERRATION, self.dB_ABERRATION = calculate_aberration(T, self.longitude, self.latitude, sun_lng)
+        self.ra, self.dec = calculate_equatorial(self.get_apparent_longitude(), self.get_apparent_latitude(),
+                                                 self.true_obliquity)
+
+    def get_apparent_latitude(self):
+        """
+        Get the apparent ecliptical latitudes (in degrees).
+        :return: the apparent latitudes
+        """
+        return self.latitude + self.dB_ABERRATION
+
+    def get_apparent_longitude(self):
+        """
+        Get the apparent ecliptical longitudes (in degrees), corrected for aberration and nutation.
+        :return: the apparent longitudes
+        """
+        l = self.longitude + self.dL_ABERRATION + self.nutation_in_longitude
+        return mathutils.normalize_array(l, 0.0, 360.0)
+
+    def get_declination(self):
+        """
+        Get the apparent declinations (in degrees).
+        :return: the declinations
+        """
+        return self.dec
+
+    def get_distance(self):
+        """
+        Get the distances from Earth when the light left the planet (in astronomical units).
+        :return: the distances
+        """
+        return self.distance
+
+    def get_iterations(self):
+        """
+        Get the number of light-time iterations the slowest date needed.
+        :return: the number of iterations
+        """
+        return self.iterations
+
+    def get_latitude(self):
+        """
+        Get the true ecliptical latitudes (in degrees), corrected for light-time and to FK5.
+        :return: the latitudes
+        """
+        return self.latitude
+
+    def get_light_time(self):
+        """
+        Get the light-times (in days).
+        :return: the light-times
+        """
+        return self.light_time
+
+    def get_longitude(self):
+        """
+        Get the true ecliptical longitudes (in degrees), corrected for light-time and to FK5.
+        :return: the longitudes
+        """
+        return self.longitude
+
+    def get_right_ascension(self):
+        """
+        Get the apparent right ascensions (in degrees).
+        :return: the right ascensions
+        """
+        return self.ra
+
+
+def calculate_position_with_dateTD(planet, dateTD):
+    p = Position(planet)
+    p.calculate_with_dateTD(dateTD)
+    return p
+
+
+def calculate_position_with_julianTD(planet, jde):
+    p = Position(planet)
+    p.calculate_with_julianTD(jde)
+    return p
+
+
+def calculate_positions_with_julianTD(planet, jdes):
+    p = PositionArray(planet)
+    p.calculate_with_julianTD(jdes)
+    return p
+
+
+if __name__ == "__main__":
+
+
+    import venus
+
+    jde = 2448976.5
+    p = calculate_position_with_julianTD(venus, jde)
+    print("Light-time: {} ({} iterations)".format(p.get_light_time(), p.get_iterations()))
+    print("Distance: {}".format(p.get_distance()))
+    print("Longitude: {}".format(p.get_longitude()))
+    print("Latitude: {}".format(p.get_latitude()))
+    print("Apparent Longitude: {}".format(p.get_apparent_longitude()))
+    print("Apparent Latitude: {}".format(p.get_apparent_latitude()))
+    print("Equatorial: {}".format(p.get_equatorial_coordinate().get_pretty_string()))
@@ -0,0 +1,34 @@
+import unittest
+import earth
+import geocentric
+import mars
+import venus
+
+
+class Test_Geocentric(unittest.TestCase):
+    def test_position(self):
+        # Meeus, Astronomical Algorithms, example 33.a
+        p = geocentric.calculate_position_with_julianTD(venus, 2448976.5)
+        self.assertAlmostEqual(p.get_light_time(), 0.0052612, 7)
+        self.assertAlmostEqual(p.get_distance(), 0.910947, 5)
+        self.assertAlmostEqual(p.get_right_ascension(), 316.172725, 5)
+        self.assertAlmostEqual(p.get_declination(), -18.888011, 5)
+        c = p.get_equatorial_coordinate()
+        self.assertTrue(c.is_hours())
+        self.assertAlmostEqual(c.get_dd1() * 15.0, p.get_right_ascension(), 4)
+        self.assertRaises(ValueError, geocentric.Position, earth)
+
+    def test_position_array(self):
+        jdes = [2448976.5, 2451545.0, 2460000.25]
+        a = geocentric.calculate_positions_with_julianTD(mars, jdes)
+        self.assertEqual(len(a), 3)
+        for i, jde in enumerate(jdes):
+            p = geocentric.calculate_position_with_julianTD(mars, jde)
+            self.assertAlmostEqual(a.get_right_ascension()[i], p.get_right_ascension(), 9)
+            self.assertAlmostEqual(a.get_declination()[i], p.get_declination(), 9)
+            self.assertAlmostEqual(a.get_light_time()[i], p.get_light_time(), 12)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
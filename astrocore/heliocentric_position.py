@@ -14,11 +14,86 @@ https://omniweb.gsfc.nasa.gov/coho/helios/planet.html
 import astrodate
 import math
 import mathutils
+import mmap
+import numpy as np
+
+
+ARCSECONDS_PER_RADIAN = 180.0 * 3600.0 / math.pi
+DEFAULT_SPAN = (astrodate.J2000 - 365250.0, astrodate.J2000 + 365250.0)     # 1000 to 3000
+
+
+def truncate_series(series, max_error, t_max):
+    """
+    Select the smallest amplitude-sorted prefix of each power of a series whose dropped terms cannot
+    sum to more than max_error for any |T| <= t_max.
+    Each dropped term [A, B, C] of power i can contribute at most |A| * t_max^i, so the terms are dropped
+    in order of that bound until the error budget is spent.
+    :param series: the series terms (a list of [A, B, C] lists for each power of T)
+    :param max_error: the error bound (in the units of the series)
+    :param t_max: the largest |T| (in julian millennia from J2000.0) the series will be evaluated at
+    :return: the truncated series
+    """
+    ordered = [sorted(s, key=lambda term: -abs(term[0])) for s in series]
+    bounds = []
+    for i, s in enumerate(ordered):
+        f = t_max ** i
+        for j, term in enumerate(s):
+            bounds.append((abs(term[0]) * f, i, -j))
+    bounds.sort()
+    keep = [len(s) for s in ordered]
+    dropped = 0.0
+    for bound, i, j in bounds:
+        if dropped + bound > max_error:
+            break
+        dropped += bound
+        keep[i] = -j
+    return [s[:keep[i]] for i, s in enumerate(ordered)]
+
+
+TRUNCATED_TERMS_CACHE = {}
+
+
+def truncate_terms(terms, accuracy, radius_accuracy=None, span=None):
+    """
+    Truncate a planet's VSOP87 terms to a target accuracy.
+    :param terms: the [L, B, R] terms of the planet
+    :param accuracy: the accuracy of the longitude and latitude (in arcseconds)
+    :param radius_accuracy: the accuracy of the radius (in AU, defaults to accuracy in radians)
+    :param span: the (first, last) julian dates (in dynamical time) the terms will be used for
+    :return: the truncated [L, B, R] terms
+    """
+    terms = resolve_terms(terms)
+    if span is None:
+        span = DEFAULT_SPAN
+    t_max = max([abs(jde - astrodate.J2000) / 365250.0 for jde in span])
+    max_error = accuracy / ARCSECONDS_PER_RADIAN
+    if radius_accuracy is None:
+        radius_accuracy = max_error
+    key = (id(terms), accuracy, radius_accuracy, t_max)
+    entry = TRUNCATED_TERMS_CACHE.get(key)
+    if (entry is None) or (entry[0] is not terms):
+        truncated = [truncate_series(terms[0], max_error, t_max),
+                     truncate_series(terms[1], max_error, t_max),
+                     truncate_series(terms[2], radius_accuracy, t_max)]
+        entry = (terms, truncated)
+        TRUNCATED_TERMS_CACHE[key] = entry
+    return entry[1]
 
 
 class Position:
 
-    def __init__(self, terms):
+    def __init__(self, terms, accuracy=None, radius_accuracy=None, span=None):
+        """
+        Create the position calculator for a solar body.
+        Providing an accuracy evaluates only as many of the largest terms as are needed to stay within it.
+        :param terms: the [L, B, R] VSOP87 terms of the body
+        :param accuracy: the accuracy of the longitude and latitude (in arcseconds, None for all terms)
+        :param radius_accuracy: the accuracy of the radius (in AU, defaults to accuracy in radians)
+        :param span: the (first, last) julian dates (in dynamical time) the accuracy must hold over
+        """
+        terms = resolve_terms(terms)
+        if accuracy is not None:
+            terms = truncate_terms(terms, accuracy, radius_accuracy, span)
         self.terms = terms
         self.T = 0.0
         self.L = 0.0
@@ -37,6 +112,9 @@ class Position:
         return v
 
     def __calculate_series(self, terms):
+        if isinstance(terms, PackedSeries):
+            # one pass over the packed arrays, which sums the terms in the same order as the loop below
+            return float(terms.evaluate(self.T))
         v = 0.0
         t = 0.0
         for i in range(0, len(terms)):
@@ -117,3 +195,488 @@ class Position:
         :return: the radius
         """
         return self.R
+
+
+EVALUATE_BLOCK_SIZE = 1 << 21   # the most terms x dates elements evaluated at once
+
+
+class PackedSeries:
+    """
+    A VSOP87 series (L, B or R) packed into contiguous amplitude (A), phase (B) and frequency (C) arrays.
+    The terms for every power of T are stored back to back; segments holds (power, start, end) for each power.
+    Indexing by power gives that power's terms as a list of [A, B, C] lists (made on first use), so the series can
+    stand in for the lists.
+    """
+
+    def __init__(self, series=None):
+        self.A = None
+        self.B = None
+        self.C = None
+        self.counts = []
+        self.segments = []
+        self.rows = {}
+        if series is not None:
+            self.set_with_series(series)
+
+    @staticmethod
+    def alloc_with_arrays(A, B, C, counts):
+        s = PackedSeries()
+        s.set_with_arrays(A, B, C, counts)
+        return s
+
+    def __getitem__(self, i):
+        if (i < 0) or (i >= len(self.counts)):
+            raise IndexError("Power of T out of range!")
+        rows = self.rows.get(i)
+        if rows is None:
+            start = sum(self.counts[:i])
+            end = start + self.counts[i]
+            rows = np.column_stack((self.A[start:end], self.B[start:end], self.C[start:end])).tolist()
+            self.rows[i] = rows
+        return rows
+
+    def __iter__(self):
+        for i in range(len(self.counts)):
+            yield self[i]
+
+    def __len__(self):
+        return len(self.counts)
+
+    def evaluate(self, T):
+        """
+        Evaluate the series, sum(T^i * sum(A * cos(B + C * T))).
+        :param T: the time in julian millennia from J2000.0 (a float or an array of floats)
+        :return: the value of the series (a float or an array matching T)
+        """
+        T = np.asarray(T, dtype=np.float64)
+        if T.ndim > 1:
+            return self.evaluate(T.ravel()).reshape(T.shape)
+        n_terms = self.get_term_count()
+        if T.size * n_terms > EVALUATE_BLOCK_SIZE:
+            n = max(1, EVALUATE_BLOCK_SIZE // n_terms)
+            return np.concatenate([self.evaluate(T[i:i + n]) for i in range(0, T.size, n)])
+        return self.sum_components(self.evaluate_components(T), T)
+
+    def evaluate_derivative(self, T):
+        """
+        Evaluate the derivative of the series with respect to T.
+        :param T: the time in julian millennia from J2000.0 (a float or an array of floats)
+        :return: the derivative of the series (a float or an array matching T)
+        """
+        T = np.asarray(T, dtype=np.float64)
+        if T.ndim > 1:
+            return self.evaluate_derivative(T.ravel()).reshape(T.shape)
+        n_terms = self.get_term_count()
+        if T.size * n_terms > EVALUATE_BLOCK_SIZE:
+            n = max(1, EVALUATE_BLOCK_SIZE // n_terms)
+            return np.concatenate([self.evaluate_derivative(T[i:i + n]) for i in range(0, T.size, n)])
+        shape = self.A.shape + (1,) * T.ndim
+        a = self.B.reshape(shape) + np.multiply.outer(self.C, T)
+        c = self.A.reshape(shape) * np.cos(a)
+        s = (self.A * self.C).reshape(shape) * np.sin(a)
+        v = 0.0
+        for power, start, end in self.segments:
+            v = v - ((T ** power) * s[start:end].sum(axis=0))
+            if power > 0:
+                v = v + ((power * (T ** (power - 1))) * c[start:end].sum(axis=0))
+        return v
+
+    def evaluate_components(self, T):
+        """
+        Evaluate the terms of the series, A * cos(B + C * T), without summing them.
+        :param T: the time in julian millennia from J2000.0 (a float or a 1-d array of floats)
+        :return: the terms (an array of terms, or of terms x dates)
+        """
+        T = np.asarray(T, dtype=np.float64)
+        shape = self.A.shape + (1,) * T.ndim
+        return self.A.reshape(shape) * np.cos(self.B.reshape(shape) + np.multiply.outer(self.C, T))
+
+    def sum_components(self, c, T):
+        """
+        Sum the evaluated terms of the series, sum(T^i * sum(c)).
+        :param c: the terms from evaluate_components (they may be a slice of a larger evaluation)
+        :param T: the time in julian millennia from J2000.0 (a float or a 1-d array of floats)
+        :return: the value of the series (a float or an array matching T)
+        """
+        T = np.asarray(T, dtype=np.float64)
+        v = 0.0
+        for power, start, end in self.segments:
+            # accumulate in term order so the sums round exactly as the Position loop does
+            v = v + ((T ** power) * np.add.accumulate(c[start:end], axis=0)[-1])
+        return v
+
+    def get_term_count(self):
+        """
+        Get the number of terms in the series (over all powers of T).
+        :return: the number of terms
+        """
+        return len(self.A)
+
+    def tolist(self):
+        """
+        Get the series as lists, as in the <planet>_vsop87d modules.
+        :return: the series terms (a list of [A, B, C] lists for each power of T)
+        """
+        return list(self)
+
+    def set_with_arrays(self, A, B, C, counts):
+        """
+        Set the series from its packed arrays (which are used as given, without copying).
+        :param A: the amplitudes
+        :param B: the phases
+        :param C: the frequencies
+        :param counts: the number of terms for each power of T
+        """
+        self.A = A
+        self.B = B
+        self.C = C
+        self.counts = [int(n) for n in counts]
+        self.segments = []
+        self.rows = {}
+        start = 0
+        for i, n in enumerate(self.counts):
+            if n > 0:
+                self.segments.append((i, start, start + n))
+                start += n
+
+    def set_with_series(self, series):
+        """
+        Set the series by packing its terms.
+        :param series: the series terms (a list of [A, B, C] lists for each power of T)
+        """
+        packed = np.array([term for s in series for term in s], dtype=np.float64).reshape(-1, 3)
+        A = np.ascontiguousarray(packed[:, 0])
+        B = np.ascontiguousarray(packed[:, 1])
+        C = np.ascontiguousarray(packed[:, 2])
+        self.set_with_arrays(A, B, C, [len(s) for s in series])
+
+
+class PackedTerms:
+    """
+    The L, B and R series of a planet packed for vectorized evaluation.
+    Like the [L, B, R] terms lists it can be indexed and unpacked.
+    """
+
+    def __init__(self, terms=None):
+        self.L = None
+        self.B = None
+        self.R = None
+        if terms is not None:
+            self.L = PackedSeries(terms[0])
+            self.B = PackedSeries(terms[1])
+            self.R = PackedSeries(terms[2])
+
+    @staticmethod
+    def alloc_with_series(L, B, R):
+        t = PackedTerms()
+        t.L = L
+        t.B = B
+        t.R = R
+        return t
+
+    def __getitem__(self, i):
+        return (self.L, self.B, self.R)[i]
+
+    def __iter__(self):
+        return iter((self.L, self.B, self.R))
+
+    def __len__(self):
+        return 3
+
+
+class LazyTerms:
+    """
+    The [L, B, R] terms of a planet, loaded by a loader function on first use.
+    The series can be taken from it (i.e. unpacked) without loading; they load when they are used.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.terms = None
+        self.L = LazySeries(self, 0)
+        self.B = LazySeries(self, 1)
+        self.R = LazySeries(self, 2)
+
+    def __getitem__(self, i):
+        return (self.L, self.B, self.R)[i]
+
+    def __iter__(self):
+        return iter((self.L, self.B, self.R))
+
+    def __len__(self):
+        return 3
+
+    def is_loaded(self):
+        """
+        Test if the terms have been loaded.
+        :return: true=is loaded
+        """
+        return self.terms is not None
+
+    def load(self):
+        """
+        Load the terms (only the first call runs the loader).
+        :return: the terms
+        """
+        if self.terms is None:
+            self.terms = self.loader()
+        return self.terms
+
+
+class LazySeries:
+    """
+    One series of a LazyTerms, standing in for the loaded series.
+    """
+
+    def __init__(self, terms, index):
+        self.lazy_terms = terms
+        self.index = index
+
+    def __eq__(self, other):
+        return list(self) == other
+
+    def __ne__(self, other):
+        return list(self) != other
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __getitem__(self, i):
+        return self.load()[i]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def load(self):
+        """
+        Load the terms this series belongs to.
+        :return: the series
+        """
+        return self.lazy_terms.load()[self.index]
+
+
+def resolve_terms(terms):
+    """
+    Get the loaded terms of a LazyTerms (other terms are returned as given).
+    :param terms: the [L, B, R] terms of a planet
+    :return: the loaded terms
+    """
+    if isinstance(terms, LazyTerms):
+        return terms.load()
+    return terms
+
+
+PACKED_TERMS_CACHE = {}
+
+
+def pack_terms(terms):
+    """
+    Get the packed form of a planet's VSOP87 terms, packing them on first use.
+    :param terms: the [L, B, R] terms of the planet
+    :return: the PackedTerms
+    """
+    terms = resolve_terms(terms)
+    if isinstance(terms, PackedTerms):
+        return terms
+    key = id(terms)
+    entry = PACKED_TERMS_CACHE.get(key)
+    if (entry is None) or (entry[0] is not terms):
+        entry = (terms, PackedTerms(terms))
+        PACKED_TERMS_CACHE[key] = entry
+    return entry[1]
+
+
+#
+# Binary terms files
+#
+# A terms file holds the packed L, B and R series of a planet as little-endian float64 values:
+#
+#   magic           8 bytes                     'AVSOP87D'
+#   header          3 + 3 * TERMS_FILE_POWERS   version, number of series (3), powers per series,
+#                                               then the term count of every power of L, B and R
+#   term blocks     for L, B and R in turn      A[n], B[n], C[n]
+#
+# read_terms maps the file into memory and the packed arrays are views on the mapping.
+#
+
+TERMS_FILE_MAGIC = b'AVSOP87D'
+TERMS_FILE_VERSION = 1
+TERMS_FILE_POWERS = 6
+
+
+def read_terms(path):
+    """
+    Read a binary terms file through mmap without copying the term arrays.
+    :param path: the path of the file
+    :return: the PackedTerms
+    """
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if data[:len(TERMS_FILE_MAGIC)] != TERMS_FILE_MAGIC:
+        raise ValueError("Not a VSOP87D terms file! ({})".format(path))
+    offset = len(TERMS_FILE_MAGIC)
+    n_header = 3 + (3 * TERMS_FILE_POWERS)
+    header = np.frombuffer(data, dtype='<f8', count=n_header, offset=offset)
+    if int(header[0]) != TERMS_FILE_VERSION:
+        raise ValueError("Unsupported VSOP87D terms file version! ({})".format(path))
+    offset += 8 * n_header
+    series = []
+    for i in range(3):
+        counts = header[3 + (i * TERMS_FILE_POWERS):3 + ((i + 1) * TERMS_FILE_POWERS)]
+        n = int(counts.sum())
+        abc = []
+        for j in range(3):
+            abc.append(np.frombuffer(data, dtype='<f8', count=n, offset=offset))
+            offset += 8 * n
+        series.append(PackedSeries.alloc_with_arrays(abc[0], abc[1], abc[2], counts))
+    return PackedTerms.alloc_with_series(series[0], series[1], series[2])
+
+
+def write_terms(path, terms):
+    """
+    Write the VSOP87 terms of a planet to a binary terms file.
+    :param path: the path of the file
+    :param terms: the [L, B, R] terms of the planet
+    """
+    packed = pack_terms(terms)
+    header = [TERMS_FILE_VERSION, 3, TERMS_FILE_POWERS]
+    for series in packed:
+        if len(series) > TERMS_FILE_POWERS:
+            raise ValueError("Too many powers of T for a terms file!")
+        header.extend(series.counts + [0] * (TERMS_FILE_POWERS - len(series)))
+    with open(path, 'wb') as f:
+        f.write(TERMS_FILE_MAGIC)
+        f.write(np.array(header, dtype='<f8').tobytes())
+        for series in packed:
+            for a in (series.A, series.B, series.C):
+                f.write(np.ascontiguousarray(a, dtype='<f8').tobytes())
+
+
+class VectorPosition(Position):
+    """
+    The heliocentric position of a planet evaluated with NumPy over packed VSOP87 series.
+    The results match Position to within 1e-12 and the getters are the same.
+    """
+
+    def __init__(self, terms, accuracy=None, radius_accuracy=None, span=None):
+        Position.__init__(self, terms, accuracy, radius_accuracy, span)
+        self.packed = pack_terms(self.terms)
+
+    def calculate_with_julianTD(self, jde):
+        """
+        Calculate the position properties for a solar body (in the standard FK5 system).
+        :param jde: the julian date (in dynamical time)
+        """
+        self.T = (jde - astrodate.J2000) / 365250.0
+        tL = float(self.packed.L.evaluate(self.T)) * (180.0 / math.pi)
+        self.L = mathutils.normalize_degrees(tL)
+        tB = float(self.packed.B.evaluate(self.T)) * (180.0 / math.pi)
+        self.B = mathutils.normalize_degrees(tB, -360.0, 360.0)
+        self.R = float(self.packed.R.evaluate(self.T))
+        dL, dB = calculate_fk5_corrections(self.T * 10.0, self.L, self.B)
+        self.dL = float(dL)
+        self.dB = float(dB)
+
+
+class PositionArray:
+    """
+    The heliocentric positions of a planet for an array of dates.
+    Each series is evaluated as a single terms x dates computation and the getters return arrays.
+    """
+
+    def __init__(self, terms, accuracy=None, radius_accuracy=None, span=None):
+        terms = resolve_terms(terms)
+        if accuracy is not None:
+            terms = truncate_terms(terms, accuracy, radius_accuracy, span)
+        self.terms = terms
+        self.packed = pack_terms(terms)
+        self.T = None
+        self.L = None
+        self.B = None
+        self.R = None
+        self.dL = None
+        self.dB = None
+
+    def __len__(self):
+        if self.T is None:
+            return 0
+        return len(self.T)
+
+    def calculate_with_julianTD(self, jdes):
+        """
+        Calculate the position properties for a solar body (in the standard FK5 system).
+        :param jdes: a sequence or ndarray of julian dates (in dynamical time)
+        """
+        jdes = np.atleast_1d(np.asarray(jdes, dtype=np.float64))
+        self.T = (jdes - astrodate.J2000) / 365250.0
+        tL = self.packed.L.evaluate(self.T) * (180.0 / math.pi)
+        self.L = mathutils.normalize_array(tL, 0.0, 360.0)
+        tB = self.packed.B.evaluate(self.T) * (180.0 / math.pi)
+        self.B = mathutils.normalize_array(tB, -360.0, 360.0)
+        self.R = self.packed.R.evaluate(self.T)
+        self.dL, self.dB = calculate_fk5_corrections(self.T * 10.0, self.L, self.B)
+
+    def get_latitude0(self):
+        """
+        Get the mean ecliptical latitudes (in degrees).
+        :return: the mean latitudes
+        """
+        return self.B
+
+    def get_latitude(self):
+        """
+        Get the corrected ecliptical latitudes (in degrees).
+        :return: the corrected latitudes
+        """
+        return self.B + self.dB
+
+    def get_longitude0(self):
+        """
+        Get the mean ecliptical longitudes (in degrees).
+        :return: the mean longitudes
+        """
+        return self.L
+
+    def get_longitude(self):
+        """
+        Get the corrected ecliptical longitudes (in degrees).
+        :return: the corrected longitudes
+        """
+        return self.L + self.dL
+
+    def get_radius(self):
+        """
+        Get the radii (in astronomical units).
+        :return: the radii
+        """
+        return self.R
+
+
+def calculate_fk5_corrections(t, lng, lat):
+    """
+    Calculate the corrections from the VSOP87 dynamical ecliptic to FK5.
+    :param t: the time in julian centuries from J2000.0 (a float or an array)
+    :param lng: the ecliptical longitudes (in degrees, a float or an array)
+    :param lat: the ecliptical latitudes (in degrees, a float or an array)
+    :return: the corrections in longitude, the corrections in latitude (in degrees)
+    """
+    toRad = math.pi / 180.0
+    Lp = (lng + (((-0.00031 * t) - 1.397) * t)) * toRad
+    dL = (-0.09033 + (0.03916 * (np.cos(Lp) + np.sin(Lp)) * np.tan(lat * toRad))) / 3600.0
+    dB = (0.03916 * (np.cos(Lp) - np.sin(Lp))) / 3600.0
+    return dL, dB
+
+
+def calculate_positions_with_julianTD(terms, jdes):
+    """
+    Calculate the positions of a solar body for an array of dates.
+    :param terms: the [L, B, R] VSOP87 terms of the body
+    :param jdes: a sequence or ndarray of julian dates (in dynamical time)
+    :return: the PositionArray
+    """
+    p = PositionArray(terms)
+    p.calculate_with_julianTD(jdes)
+    return p
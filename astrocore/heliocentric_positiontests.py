@@ -0,0 +1,174 @@
+import os
+import shutil
+import tempfile
+import unittest
+import astrodate
+import earth
+import heliocentric_position
+import jupiter
+import mars
+import mercury
+import neptune
+import numpy
+import saturn
+import uranus
+import venus
+import vsop87d
+
+PLANETS = [mercury, venus, earth, mars, jupiter, saturn, uranus, neptune]
+
+
+class Test_HeliocentricPosition(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_vector_position(self):
+        for planet in PLANETS:
+            p = planet.Position(planet.TERMS_VSOP87D)
+            vp = heliocentric_position.VectorPosition(planet.TERMS_VSOP87D)
+            for year in (1000, 1998, 2008, 2018, 3000):
+                jde = astrodate.calculate_julian(year, 1, 1)
+                p.calculate_with_julianTD(jde)
+                vp.calculate_with_julianTD(jde)
+                self.assertAlmostEqual(vp.get_latitude(), p.get_latitude(), 12)
+                self.assertAlmostEqual(vp.get_longitude(), p.get_longitude(), 12)
+                self.assertAlmostEqual(vp.get_radius(), p.get_radius(), 12)
+
+    def test_packed_position(self):
+        p = heliocentric_position.Position(mars.TERMS_VSOP87D)
+        q = heliocentric_position.Position(vsop87d.read_term_lists("mars"))
+        for jde in (astrodate.J2000 - 300000.0, astrodate.J2000, astrodate.J2000 + 1234.5):
+            p.calculate_with_julianTD(jde)
+            q.calculate_with_julianTD(jde)
+            for value in (p.L, p.B, p.R, p.dL, p.dB):
+                self.assertIs(type(value), float)
+            self.assertEqual((p.L, p.B, p.R), (q.L, q.B, q.R))
+
+    def test_position_array(self):
+        jdes = [astrodate.calculate_julian(year, 1, 1) + 0.25 for year in range(1900, 2101, 25)]
+        for planet in PLANETS:
+            pa = planet.calculate_positions_with_julianTD(jdes)
+            self.assertEqual(len(pa), len(jdes))
+            for i, jde in enumerate(jdes):
+                p = planet.calculate_position_with_julianTD(jde)
+                self.assertAlmostEqual(pa.get_latitude()[i], p.get_latitude(), 12)
+                self.assertAlmostEqual(pa.get_longitude()[i], p.get_longitude(), 12)
+                self.assertAlmostEqual(pa.get_radius()[i], p.get_radius(), 12)
+                self.assertAlmostEqual(pa.dL[i], p.dL, 15)
+                self.assertAlmostEqual(pa.dB[i], p.dB, 15)
+
+    def test_position_array_blocks(self):
+        jdes = astrodate.J2000 + (numpy.arange(2000) * 1.5)
+        block_size = heliocentric_position.EVALUATE_BLOCK_SIZE
+        try:
+            heliocentric_position.EVALUATE_BLOCK_SIZE = 100000
+            blocked = heliocentric_position.calculate_positions_with_julianTD(mars.TERMS_VSOP87D, jdes)
+        finally:
+            heliocentric_position.EVALUATE_BLOCK_SIZE = block_size
+        whole = heliocentric_position.calculate_positions_with_julianTD(mars.TERMS_VSOP87D, jdes)
+        self.assertTrue(numpy.array_equal(blocked.get_longitude(), whole.get_longitude()))
+        self.assertTrue(numpy.array_equal(blocked.get_radius(), whole.get_radius()))
+
+    def test_truncated_position(self):
+        jdes = numpy.linspace(heliocentric_position.DEFAULT_SPAN[0], heliocentric_position.DEFAULT_SPAN[1], 101)
+        for planet in (mercury, earth, neptune):
+            exact = planet.calculate_positions_with_julianTD(jdes)
+            for accuracy in (1.0, 10.0, 60.0):
+                p = heliocentric_position.PositionArray(planet.TERMS_VSOP87D, accuracy)
+                p.calculate_with_julianTD(jdes)
+                dL = numpy.abs(p.L - exact.L)
+                dL = numpy.minimum(dL, 360.0 - dL)
+                self.assertLessEqual(dL.max() * 3600.0, accuracy)
+                self.assertLessEqual(numpy.abs(p.B - exact.B).max() * 3600.0, accuracy)
+                self.assertLessEqual(numpy.abs(p.R - exact.R).max(), accuracy / heliocentric_position.ARCSECONDS_PER_RADIAN)
+                self.assertLess(p.packed.L.get_term_count(), exact.packed.L.get_term_count())
+
+    def test_truncate_series(self):
+        series = [[[1.0, 0.0, 0.0], [0.001, 0.0, 0.0], [0.01, 0.0, 0.0]], [[0.002, 0.0, 0.0]]]
+        truncated = heliocentric_position.truncate_series(series, 0.0025, 1.0)
+        self.assertEqual(truncated, [[[1.0, 0.0, 0.0], [0.01, 0.0, 0.0]], [[0.002, 0.0, 0.0]]])
+        truncated = heliocentric_position.truncate_series(series, 0.0025, 0.1)
+        self.assertEqual(truncated, [[[1.0, 0.0, 0.0], [0.01, 0.0, 0.0]], []])
+        p = heliocentric_position.Position(mars.TERMS_VSOP87D, 1.0)
+        self.assertIs(p.terms, heliocentric_position.Position(mars.TERMS_VSOP87D, 1.0).terms)
+        self.assertIs(heliocentric_position.Position(mars.TERMS_VSOP87D).terms, mars.TERMS_VSOP87D.load())
+
+    def test_terms_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "mars.vsop87d")
+            heliocentric_position.write_terms(path, vsop87d.read_term_lists("mars"))
+            terms = heliocentric_position.read_terms(path)
+            self.assertFalse(terms.L.A.flags.owndata)
+            self.assertFalse(terms.R.C.flags.writeable)
+            for series, lists in zip(terms, vsop87d.read_term_lists("mars")):
+                self.assertEqual(len(series), len(lists))
+                for i in range(len(lists)):
+                    self.assertEqual(series[i], lists[i])
+            p = heliocentric_position.Position(terms)
+            p.calculate_with_julianTD(astrodate.J2000 + 1234.5)
+            q = mars.calculate_position_with_julianTD(astrodate.J2000 + 1234.5)
+            self.assertAlmostEqual(p.get_longitude(), q.get_longitude(), 12)
+            self.assertAlmostEqual(p.get_radius(), q.get_radius(), 12)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_stale_terms_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "mars.vsop87d")
+            self.assertFalse(vsop87d.is_terms_file_current("mars", path))
+            vsop87d.load_terms("mars", path)
+            self.assertTrue(vsop87d.is_terms_file_current("mars", path))
+            # a file older than the term lists module is generated again
+            lists_time = os.path.getmtime(vsop87d.get_term_lists_path("mars"))
+            os.utime(path, (lists_time - 10.0, lists_time - 10.0))
+            self.assertFalse(vsop87d.is_terms_file_current("mars", path))
+            terms = vsop87d.load_terms("mars", path)
+            self.assertTrue(vsop87d.is_terms_file_current("mars", path))
+            self.assertEqual(terms.L.get_term_count(), sum(len(s) for s in mars.L_VSOP87D))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_pack_terms(self):
+        packed = heliocentric_position.pack_terms(mars.TERMS_VSOP87D)
+        self.assertIs(packed, heliocentric_position.pack_terms(mars.TERMS_VSOP87D))
+        self.assertEqual(packed.L.get_term_count(), sum(len(s) for s in mars.L_VSOP87D))
+        self.assertEqual(packed.L.A[1], mars.L_VSOP87D[0][1][0])
+        self.assertEqual(packed.L.C[1], mars.L_VSOP87D[0][1][2])
+
+    def test_lazy_terms(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return mars.TERMS_VSOP87D.load()
+
+        terms = heliocentric_position.LazyTerms(loader)
+        L, B, R = terms
+        self.assertFalse(terms.is_loaded())
+        self.assertEqual(calls, [])
+        p = heliocentric_position.VectorPosition(terms)
+        p.calculate_with_julianTD(astrodate.J2000 + 1234.5)
+        q = mars.calculate_position_with_julianTD(astrodate.J2000 + 1234.5)
+        self.assertEqual(p.get_longitude(), q.get_longitude())
+        self.assertTrue(terms.is_loaded())
+        self.assertIs(L.load(), mars.L_VSOP87D.load())
+        self.assertEqual(len(R), len(mars.R_VSOP87D))
+        heliocentric_position.PositionArray(terms)
+        self.assertEqual(calls, [1])
+
+    def test_term_lists(self):
+        # the planet modules keep the lists API of the term tables
+        lists = vsop87d.read_term_lists("mars")
+        self.assertEqual(mars.L_VSOP87D[0][0], lists[0][0][0])
+        self.assertIs(type(mars.L_VSOP87D[0]), list)
+        self.assertIs(type(mars.B_VSOP87D[1][0]), list)
+        self.assertEqual(mars.R_VSOP87D, lists[2])
+        self.assertNotEqual(mars.R_VSOP87D, lists[1])
+        self.assertEqual(mars.L_VSOP87D.tolist(), lists[0])
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,85 @@
+import collections
+
+
+class LRUCache:
+    """
+    A cache of a bounded number of values, dropping the least recently used value when it is full.
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        Create the cache.
+        :param max_size: the most values the cache keeps
+        """
+        if max_size < 1:
+            raise ValueError("Invalid cache size! (Must be at least 1)")
+        self.max_size = max_size
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """
+        Remove all the values (and reset the hit and miss counts).
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """
+        Get a value, making it the most recently used.
+        :param key: the key of the value
+        :param default: the value to return when the key is not in the cache
+        :return: the value
+        """
+        try:
+            value = self.entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.entries[key] = value
+        self.hits += 1
+        return value
+
+    def get_hits(self):
+        """
+        Get the number of gets that found their key.
+        :return: the number of hits
+        """
+        return self.hits
+
+    def get_misses(self):
+        """
+        Get the number of gets that did not find their key.
+        :return: the number of misses
+        """
+        return self.misses
+
+    def put(self, key, value):
+        """
+        Put a value, making it the most recently used (and dropping the least recently used value when full).
+        :param key: the key of the value
+        :param value: the value
+        """
+        self.entries.pop(key, None)
+        self.entries[key] = value
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
+if __name__ == "__main__":
+
+
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    print("Keys: {}".format(list(cache.entries.keys())))
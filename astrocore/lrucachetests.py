@@ -0,0 +1,24 @@
+import unittest
+import lrucache
+
+
+class Test_LRUCache(unittest.TestCase):
+    def test_cache(self):
+        cache = lrucache.LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertTrue("a" in cache)
+        self.assertFalse("b" in cache)
+        self.assertEqual(cache.get("b", 0), 0)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.get_hits(), cache.get_misses()), (1, 1))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertRaises(ValueError, lrucache.LRUCache, 0)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
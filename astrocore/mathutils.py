@@ -1,5 +1,6 @@
+import numpy as np
+
 
-    
 def fix(v, prec):
     """
     Round the provided value to the specified precision.
@@ -41,6 +42,20 @@ def make_int_readable(s):
         d = s
     return "{:,d}".format(d)
 
+def normalize_array(a, min_v, max_v):
+    """
+    Normalize an array of values into the range [min_v, max_v).
+    Values already in range are returned unchanged, the others are wrapped with modular arithmetic.
+
+    :param a:       the values to normalize
+    :param min_v:   the minimum value
+    :param max_v:   the maximum value
+    :return:        the normalized values (an ndarray)
+    """
+    a = np.asarray(a, dtype=np.float64)
+    in_range = (a >= min_v) & (a < max_v)
+    return np.where(in_range, a, np.mod(a - min_v, max_v - min_v) + min_v)
+
 def normalize_float(f, min_f, max_f):
     diff_f = max_f - min_f
     while f >= max_f:
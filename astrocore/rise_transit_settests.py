@@ -0,0 +1,47 @@
+import unittest
+import astrocoord
+import astrodate
+import geocentric
+import rise_transit_set
+import sun
+import venus
+
+
+class Test_RiseTransitSet(unittest.TestCase):
+    def test_events_for_site(self):
+        # Meeus, Astronomical Algorithms, example 15.a (Venus at Boston, 1988 March 20)
+        jd = astrodate.calculate_julian(1988, 3, 20)
+        events = rise_transit_set.calculate_events_for_site(venus, 42.3333, -71.0833, jd, jd + 1.0)
+        self.assertEqual([e for e, t in events], [rise_transit_set.SET, rise_transit_set.RISE,
+                                                  rise_transit_set.TRANSIT])
+        for (e, t), expected in zip(events, (0.12113, 0.51766, 0.81980)):
+            self.assertAlmostEqual(t - jd, expected, 3)
+
+    def test_horizon(self):
+        jd = astrodate.calculate_julian(2017, 6, 1)
+        latitudes = [51.4769, -33.8688, 64.8378]
+        longitudes = [0.0, 151.2093, -147.7164]
+        events = rise_transit_set.calculate_events(sun, latitudes, longitudes, jd, jd + 10.0)
+        self.assertEqual(len(events.get_jds(rise_transit_set.TRANSIT, 0)), 10)
+        self.assertEqual(len(events.get_jds(rise_transit_set.RISE, 1)), 10)
+        for site, event, t in events.get_events():
+            if event == rise_transit_set.TRANSIT:
+                continue
+            # the altitude from the full Sun position and astrocoord's horizon conversion
+            date = astrodate.AstroDate().alloc_with_julian(t)
+            date.set_longitude(longitudes[site])
+            p = sun.calculate_position_with_julianTD(t + (68.0 / 86400.0))
+            ra, dec = geocentric.calculate_equatorial(p.get_apparent_longitude(), p.get_latitude(),
+                                                      p.earth_nutation.get_true_obliquity())
+            mode = astrocoord.make_mode(astrocoord.COORD_MODE_EQUATORIAL, astrocoord.COORD1_UNIT_HOURS,
+                                        astrocoord.COORD1_TYPE_RA)
+            c = astrocoord.AstroCoord().alloc_with_degrees(float(ra) / 15.0, float(dec), mode)
+            c.set_date(date)
+            c.set_latitude(latitudes[site])
+            c.to_horizon()
+            self.assertAlmostEqual(c.get_dd1(), rise_transit_set.STANDARD_ALTITUDE_SUN, 2)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
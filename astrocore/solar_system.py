@@ -0,0 +1,339 @@
+"""
+Snapshots of the Sun and the planets at one instant.
+
+A snapshot shares all the work the bodies have in common: the VSOP87 series of every planet are evaluated
+together (one NumPy pass over all their terms for each of L, B and R), Earth's position and the nutation are
+calculated once, and the FK5 corrections and geocentric conversions are done for all bodies at once.
+
+The geocentric positions are corrected for light-time as in geocentric.Position: every planet is evaluated
+again at the time its light left it (each term at the time of its own planet, still in one pass) until the
+light-times of all the planets stop changing. The apparent positions add aberration (as geocentric.Position
+for the planets and sun.Position for the Sun) and nutation.
+"""
+
+import astrocoord
+import astrodate
+import earth
+import geocentric
+import heliocentric_position
+import jupiter
+import mars
+import math
+import mathutils
+import mercury
+import neptune
+import numpy as np
+import saturn
+import sun
+import uranus
+import venus
+
+SUN = "Sun"
+BODIES = (SUN, "Mercury", "Venus", "Earth", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune")
+PLANETS = (mercury, venus, earth, mars, jupiter, saturn, uranus, neptune)
+EARTH_INDEX = BODIES.index("Earth")
+
+
+class Snapshot:
+    """
+    The positions of the Sun and the planets at one instant.
+    Heliocentric coordinates are ecliptical longitude, latitude (in degrees) and radius (in AU), corrected to FK5.
+    Geocentric coordinates are true (corrected for light-time) ecliptical longitude, latitude (in degrees) and
+    distance (in AU), corrected to FK5; the apparent coordinates and the equatorial coordinates add aberration and
+    nutation.
+    """
+
+    def __init__(self):
+        self.jde = None
+        self.L = None
+        self.B = None
+        self.R = None
+        self.dL = None
+        self.dB = None
+        self.light_time = None
+        self.iterations = 0
+        self.longitude = None
+        self.latitude = None
+        self.distance = None
+        self.dL_ABERRATION = None
+        self.dB_ABERRATION = None
+        self.nutation = None
+        self.ra = None
+        self.dec = None
+
+    def __get_index(self, name, geocentric=False):
+        if name not in BODIES:
+            raise ValueError("Unknown body! ({})".format(name))
+        i = BODIES.index(name)
+        if geocentric and (i == EARTH_INDEX):
+            raise ValueError("Earth has no geocentric position!")
+        return i
+
+    def get_apparent_latitude(self, name):
+        """
+        Get the geocentric apparent ecliptical latitude of a body (in degrees), corrected for aberration.
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the apparent latitude
+        """
+        i = self.__get_index(name, True)
+        return float(self.latitude[i] + self.dB_ABERRATION[i])
+
+    def get_apparent_longitude(self, name):
+        """
+        Get the geocentric apparent ecliptical longitude of a body (in degrees), corrected for aberration and
+        nutation.
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the apparent longitude
+        """
+        i = self.__get_index(name, True)
+        l = float(self.longitude[i] + self.dL_ABERRATION[i]) + self.nutation.get_nutation_in_longitude()
+        return mathutils.normalize_degrees(l)
+
+    def get_distance(self, name):
+        """
+        Get the distance of a body from Earth when its light left it (in astronomical units).
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the distance
+        """
+        return float(self.distance[self.__get_index(name, True)])
+
+    def get_ecliptic_coordinate(self, name, apparent):
+        """
+        Get the geocentric ecliptical coordinate of a body.
+        :param name: the name of the body (i.e. 'Mars')
+        :param apparent: true=apparent longitude, false=true longitude
+        :return: the AstroCoord
+        """
+        if apparent:
+            lng = self.get_apparent_longitude(name)
+            lat = self.get_apparent_latitude(name)
+        else:
+            lng = self.get_geocentric_longitude(name)
+            lat = self.get_geocentric_latitude(name)
+        mode = astrocoord.make_mode(astrocoord.COORD_MODE_ECLIPTIC)
+        return astrocoord.AstroCoord().alloc_with_degrees(lng, lat, mode)
+
+    def get_declination(self, name):
+        """
+        Get the apparent declination of a body (in degrees).
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the declination
+        """
+        return float(self.dec[self.__get_index(name, True)])
+
+    def get_geocentric_latitude(self, name):
+        """
+        Get the geocentric true ecliptical latitude of a body (in degrees), corrected for light-time.
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the latitude
+        """
+        return float(self.latitude[self.__get_index(name, True)])
+
+    def get_geocentric_longitude(self, name):
+        """
+        Get the geocentric true ecliptical longitude of a body (in degrees), corrected for light-time.
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the longitude
+        """
+        return float(self.longitude[self.__get_index(name, True)])
+
+    def get_iterations(self):
+        """
+        Get the number of planet positions the light-time iteration calculated.
+        :return: the number of iterations
+        """
+        return self.iterations
+
+    def get_julianTD(self):
+        """
+        Get the instant of the snapshot.
+        :return: the julian date (in dynamical time)
+        """
+        return self.jde
+
+    def get_latitude(self, name):
+        """
+        Get the heliocentric ecliptical latitude of a body (in degrees).
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the latitude
+        """
+        i = self.__get_index(name)
+        return float(self.B[i] + self.dB[i])
+
+    def get_light_time(self, name):
+        """
+        Get the light-time of a body (in days).
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the light-time
+        """
+        return float(self.light_time[self.__get_index(name, True)])
+
+    def get_longitude(self, name):
+        """
+        Get the heliocentric ecliptical longitude of a body (in degrees).
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the longitude
+        """
+        i = self.__get_index(name)
+        return float(self.L[i] + self.dL[i])
+
+    def get_nutation(self):
+        """
+        Get the nutation shared by all the bodies.
+        :return: the earth.Nutation
+        """
+        return self.nutation
+
+    def get_radius(self, name):
+        """
+        Get the heliocentric radius of a body (in astronomical units).
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the radius
+        """
+        return float(self.R[self.__get_index(name)])
+
+    def get_right_ascension(self, name):
+        """
+        Get the apparent right ascension of a body (in degrees).
+        :param name: the name of the body (i.e. 'Mars')
+        :return: the right ascension
+        """
+        return float(self.ra[self.__get_index(name, True)])
+
+
+class SolarSystem:
+    """
+    The calculator of snapshots, holding the packed VSOP87 terms of all the planets back to back.
+    """
+
+    def __init__(self, accuracy=None, radius_accuracy=None, span=None):
+        """
+        Create the snapshot calculator.
+        :param accuracy: the accuracy of the longitudes and latitudes (in arcseconds, None for all terms)
+        :param radius_accuracy: the accuracy of the radii (in AU, defaults to accuracy in radians)
+        :param span: the (first, last) julian dates (in dynamical time) the accuracy must hold over
+        """
+        self.packed = []
+        for planet in PLANETS:
+            terms = heliocentric_position.resolve_terms(planet.TERMS_VSOP87D)
+            if accuracy is not None:
+                terms = heliocentric_position.truncate_terms(terms, accuracy, radius_accuracy, span)
+            self.packed.append(heliocentric_position.pack_terms(terms))
+        # the L, B and R series of all the planets, each stacked into one series
+        self.stacked = []
+        for k in range(3):
+            series = [p[k] for p in self.packed]
+            A = np.concatenate([s.A for s in series])
+            B = np.concatenate([s.B for s in series])
+            C = np.concatenate([s.C for s in series])
+            self.stacked.append(heliocentric_position.PackedSeries.alloc_with_arrays(A, B, C, [len(A)]))
+
+    def __evaluate_series(self, k, T):
+        # every term is evaluated at the time of its planet, rounding as evaluate_components does for one time
+        stacked = self.stacked[k]
+        T_terms = np.repeat(T, [p[k].get_term_count() for p in self.packed])
+        c = stacked.A * np.cos(stacked.B + (stacked.C * T_terms))
+        values = []
+        start = 0
+        for p, t in zip(self.packed, T):
+            end = start + p[k].get_term_count()
+            values.append(float(p[k].sum_components(c[start:end], t)))
+            start = end
+        return values
+
+    def __calculate_heliocentric(self, T):
+        # the positions normalized exactly as in heliocentric_position.Position, with the Sun at the origin
+        L = [mathutils.normalize_degrees(v * (180.0 / math.pi)) for v in self.__evaluate_series(0, T)]
+        B = [mathutils.normalize_degrees(v * (180.0 / math.pi), -360.0, 360.0) for v in self.__evaluate_series(1, T)]
+        R = self.__evaluate_series(2, T)
+        return np.array([0.0] + L), np.array([0.0] + B), np.array([0.0] + R)
+
+    def snapshot(self, jde):
+        """
+        Calculate the positions of the Sun and the planets.
+        :param jde: the julian date (in dynamical time)
+        :return: the Snapshot
+        """
+        s = Snapshot()
+        s.jde = jde
+        n_planets = len(PLANETS)
+        s.L, s.B, s.R = self.__calculate_heliocentric(np.repeat((jde - astrodate.J2000) / 365250.0, n_planets))
+        T = (jde - astrodate.J2000) / 36525.0
+        s.dL, s.dB = heliocentric_position.calculate_fk5_corrections(T, s.L, s.B)
+        s.dL[0] = 0.0
+        s.dB[0] = 0.0
+        # geocentric positions, each body where it was when its light left it (as geocentric.Position)
+        x0, y0, z0 = geocentric.calculate_xyz(s.L[EARTH_INDEX], s.B[EARTH_INDEX], s.R[EARTH_INDEX])
+        L, B, R = s.L, s.B, s.R
+        tau = np.zeros(len(BODIES))
+        active = np.ones(len(BODIES), dtype=bool)
+        x = y = z = distance = tau
+        s.iterations = 0
+        while True:
+            s.iterations += 1
+            xi, yi, zi = geocentric.calculate_xyz(L, B, R)
+            x = np.where(active, xi - x0, x)
+            y = np.where(active, yi - y0, y)
+            z = np.where(active, zi - z0, z)
+            distance = np.sqrt((x * x) + (y * y) + (z * z))
+            new_tau = geocentric.LIGHT_TIME_PER_AU * distance
+            done = np.abs(new_tau - tau) < geocentric.LIGHT_TIME_TOLERANCE
+            tau = np.where(active, new_tau, tau)
+            active &= ~done
+            if (not active[1:].any()) or (s.iterations >= geocentric.MAX_LIGHT_TIME_ITERATIONS):
+                break
+            L, B, R = self.__calculate_heliocentric(((jde - tau[1:]) - astrodate.J2000) / 365250.0)
+        s.light_time = tau
+        s.distance = distance
+        lng = mathutils.normalize_array(np.degrees(np.arctan2(y, x)), 0.0, 360.0)
+        lat = np.degrees(np.arctan2(z, np.sqrt((x * x) + (y * y))))
+        dL, dB = heliocentric_position.calculate_fk5_corrections(T, lng, lat)
+        s.longitude = mathutils.normalize_array(lng + dL, 0.0, 360.0)
+        s.latitude = lat + dB
+        # aberration, for the Sun from the variation of its longitude (as sun.Position)
+        sun_lng = s.L[EARTH_INDEX] + s.dL[EARTH_INDEX] + 180.0
+        s.dL_ABERRATION, s.dB_ABERRATION = geocentric.calculate_aberration(T, s.longitude, s.latitude, sun_lng)
+        s.dL_ABERRATION[0] = float(sun.calculate_aberrations_with_julianTD(jde, s.R[EARTH_INDEX])) / 3600.0
+        s.dB_ABERRATION[0] = 0.0
+        s.dL_ABERRATION[EARTH_INDEX] = 0.0
+        s.dB_ABERRATION[EARTH_INDEX] = 0.0
+        # apparent equatorial coordinates, from the one nutation
+        s.nutation = earth.Nutation()
+        s.nutation.calculate_with_julianTD(jde)
+        lng = s.longitude + s.dL_ABERRATION + s.nutation.get_nutation_in_longitude()
+        s.ra, s.dec = geocentric.calculate_equatorial(lng, s.latitude + s.dB_ABERRATION,
+                                                      s.nutation.get_true_obliquity())
+        return s
+
+
+SOLAR_SYSTEM = None
+
+
+def calculate_snapshot_with_dateTD(dateTD):
+    if dateTD is None:
+        raise ValueError("Date (TD) is required!")
+    dateTD.to_td()
+    return calculate_snapshot_with_julianTD(dateTD.get_julian())
+
+
+def calculate_snapshot_with_julianTD(jde):
+    global SOLAR_SYSTEM
+    if SOLAR_SYSTEM is None:
+        SOLAR_SYSTEM = SolarSystem()
+    return SOLAR_SYSTEM.snapshot(jde)
+
+
+if __name__ == "__main__":
+
+
+    jde = 2448976.5
+    s = calculate_snapshot_with_julianTD(jde)
+    for name in BODIES:
+        print("{:8s} L: {:12.6f}  B: {:10.6f}  R: {:12.8f}".format(name, s.get_longitude(name), s.get_latitude(name),
+                                                                  s.get_radius(name)))
+    print
+    for name in BODIES:
+        if name != "Earth":
+            print("{:8s} RA: {:12.6f}  Dec: {:10.6f}  Distance: {:12.8f}".format(name, s.get_right_ascension(name),
+                                                                               s.get_declination(name),
+                                                                               s.get_distance(name)))
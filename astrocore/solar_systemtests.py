@@ -0,0 +1,58 @@
+import unittest
+import astrodate
+import earth
+import geocentric
+import solar_system
+import sun
+
+
+class Test_SolarSystem(unittest.TestCase):
+    def test_heliocentric(self):
+        jde = astrodate.J2000 + 1234.5
+        s = solar_system.calculate_snapshot_with_julianTD(jde)
+        for name, planet in zip(solar_system.BODIES[1:], solar_system.PLANETS):
+            p = planet.calculate_position_with_julianTD(jde)
+            self.assertEqual(s.get_longitude(name), p.get_longitude())
+            self.assertEqual(s.get_latitude(name), p.get_latitude())
+            self.assertEqual(s.get_radius(name), p.get_radius())
+        self.assertEqual(s.get_radius(solar_system.SUN), 0.0)
+
+    def test_geocentric(self):
+        # Meeus, Astronomical Algorithms, example 33.a
+        jde = 2448976.5
+        s = solar_system.calculate_snapshot_with_julianTD(jde)
+        self.assertAlmostEqual(s.get_light_time("Venus"), 0.0052612, 7)
+        self.assertAlmostEqual(s.get_distance("Venus"), 0.910947, 5)
+        self.assertAlmostEqual(s.get_right_ascension("Venus"), 316.172725, 5)
+        self.assertAlmostEqual(s.get_declination("Venus"), -18.888011, 5)
+        for name, planet in zip(solar_system.BODIES[1:], solar_system.PLANETS):
+            if planet is earth:
+                continue
+            p = geocentric.calculate_position_with_julianTD(planet, jde)
+            self.assertAlmostEqual(s.get_light_time(name), p.get_light_time(), 9)
+            self.assertAlmostEqual(s.get_distance(name), p.get_distance(), 9)
+            self.assertAlmostEqual(s.get_geocentric_longitude(name), p.get_longitude(), 7)
+            self.assertAlmostEqual(s.get_geocentric_latitude(name), p.get_latitude(), 7)
+            self.assertAlmostEqual(s.get_apparent_longitude(name), p.get_apparent_longitude(), 7)
+            self.assertAlmostEqual(s.get_apparent_latitude(name), p.get_apparent_latitude(), 7)
+            self.assertAlmostEqual(s.get_right_ascension(name), p.get_right_ascension(), 7)
+            self.assertAlmostEqual(s.get_declination(name), p.get_declination(), 7)
+        p = sun.calculate_position_with_julianTD(jde)
+        self.assertAlmostEqual(s.get_geocentric_longitude(solar_system.SUN), p.get_true_longitude(), 9)
+        self.assertAlmostEqual(s.get_geocentric_latitude(solar_system.SUN), p.get_latitude(), 9)
+        self.assertAlmostEqual(s.get_distance(solar_system.SUN), p.get_earth_sun_radius(), 12)
+        self.assertAlmostEqual(s.get_apparent_longitude(solar_system.SUN), p.get_apparent_longitude(), 9)
+        self.assertAlmostEqual(s.get_apparent_latitude(solar_system.SUN), p.get_latitude(), 9)
+        ra, dec = geocentric.calculate_equatorial(p.get_apparent_longitude(), p.get_latitude(),
+                                                  p.earth_nutation.get_true_obliquity())
+        self.assertAlmostEqual(s.get_right_ascension(solar_system.SUN), float(ra), 9)
+        self.assertAlmostEqual(s.get_declination(solar_system.SUN), float(dec), 9)
+        n = earth.Nutation()
+        n.calculate_with_julianTD(jde)
+        self.assertEqual(s.get_nutation().get_nutation_in_longitude(), n.get_nutation_in_longitude())
+        self.assertRaises(ValueError, s.get_distance, "Earth")
+        self.assertRaises(ValueError, s.get_radius, "Pluto")
+
+if __name__ == '__main__':
+
+    unittest.main()
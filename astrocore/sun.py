@@ -2,6 +2,8 @@ import astrocoord
 import astrodate
 import earth
 import math
+import mathutils
+import numpy as np
 
 # Sun Properties
 
@@ -42,6 +44,99 @@ VERNAL_EQUINOX = 0.0
 SUMMER_SOLSTICE = 90.0
 AUTUMNAL_EQUINOX = 180.0
 WINTER_SOLSTICE = 270.0
+SEASONS = [VERNAL_EQUINOX, SUMMER_SOLSTICE, AUTUMNAL_EQUINOX, WINTER_SOLSTICE]
+
+SEASON_METHOD_FIXED = u"fixed"          # the fixed-gain correction, 58 * sin(season - longitude)
+SEASON_METHOD_NEWTON = u"newton"        # Newton's method with the derivative of Earth's longitude series
+SEASON_METHOD_SECANT = u"secant"        # the secant method
+SEASON_METHODS = [SEASON_METHOD_FIXED, SEASON_METHOD_NEWTON, SEASON_METHOD_SECANT]
+SEASON_TOLERANCE = 0.000005             # days
+SEASON_MAX_ITERATIONS = 50
+MEAN_LONGITUDE_RATE = 360.0 / 365.2422  # degrees per day
+
+# the mean starts of the seasons (Meeus, Astronomical Algorithms, tables 27.A for the years -1000 to 1000 and 27.B
+# for the years 1000 to 3000), as coefficients of the powers of the millennia from the highest down
+SEASON_START_TERMS_27A = {
+    VERNAL_EQUINOX: (-0.00071, 0.00111, 0.06134, 365242.1374, 1721139.29189),
+    SUMMER_SOLSTICE: (0.00025, 0.00907, -0.05323, 365241.72562, 1721233.25401),
+    AUTUMNAL_EQUINOX: (0.00074, -0.00297, -0.11677, 365242.49558, 1721325.70455),
+    WINTER_SOLSTICE: (-0.00006, -0.00933, -0.00769, 365242.88257, 1721414.39987)
+}
+SEASON_START_TERMS_27B = {
+    VERNAL_EQUINOX: (-0.00057, -0.00411, 0.05169, 365242.37404, 2451623.80984),
+    SUMMER_SOLSTICE: (-0.0003, 0.00888, 0.00325, 365241.62603, 2451716.56767),
+    AUTUMNAL_EQUINOX: (0.00078, 0.00337, -0.11575, 365242.01767, 2451810.21715),
+    WINTER_SOLSTICE: (0.00032, -0.00823, -0.06223, 365242.74049, 2451900.05952)
+}
+
+ABERRATION_TERMS = (
+    # power of t, amplitude, phase, frequency
+    (0, 118.568, 87.5287, 359993.7286),
+    (0, 2.476, 85.0561, 719987.4571),
+    (0, 1.376, 27.8502, 4452671.1152),
+    (0, 0.119, 73.1375, 450368.8564),
+    (0, 0.114, 337.2264, 329644.6718),
+    (0, 0.086, 222.54, 659289.3436),
+    (0, 0.078, 162.8136, 9224659.7915),
+    (0, 0.054, 82.5823, 1079981.1857),
+    (0, 0.052, 171.5189, 225184.4282),
+    (0, 0.034, 30.3214, 4092677.3866),
+    (0, 0.033, 119.8105, 337181.4711),
+    (0, 0.023, 247.5418, 299295.6151),
+    (0, 0.023, 325.1526, 315559.556),
+    (0, 0.021, 155.1241, 675553.2846),
+    (1, 7.311, 333.4515, 359993.7286),
+    (1, 0.305, 330.9814, 719987.4571),
+    (1, 0.01, 328.517, 1079981.1857),
+    (2, 0.309, 241.4518, 359993.7286),
+    (2, 0.021, 205.0482, 719987.4571),
+    (2, 0.004, 297.861, 4452671.1152),
+    (3, 0.01, 154.7066, 359993.7286)
+)
+
+
+def calculate_aberrations_with_julianTD(jdes, radii):
+    """
+    Calculate the aberration of the Sun for an array of dates (as Position.calculate_aberration_with_julianTD).
+    :param jdes: the julian dates (in dynamical time, an array)
+    :param radii: the Earth-Sun radii for the dates (in AU, an array)
+    :return: the aberrations (in arcseconds)
+    """
+    t = (np.asarray(jdes, dtype=np.float64) - astrodate.J2000) / 365250.0
+    d = 3548.193
+    for power, amplitude, phase, frequency in ABERRATION_TERMS:
+        d = d + ((amplitude * (t ** power)) * np.sin((phase + (frequency * t)) * math.pi / 180.0))
+    return -0.005775518 * radii * d
+
+
+def calculate_approximate_season_starts(years, season):
+    """
+    Calculate the approximate start of a season for an array of years (as Position.calculate_approximate_season_start).
+    :param years: the years (an array)
+    :param season: the season (i.e. VERNAL_EQUINOX)
+    :return: the julian dates (in dynamical time, 0.0 for years outside -1000..3000)
+    """
+    years = np.asarray(years).astype(np.int64)
+    if season not in SEASON_START_TERMS_27A:
+        return np.zeros(years.shape)
+    early = calculate_mean_season_start(years / 1000.0, SEASON_START_TERMS_27A[season])
+    late = calculate_mean_season_start((years - 2000) / 1000.0, SEASON_START_TERMS_27B[season])
+    jde0 = np.where((years >= 1000) & (years <= 3000), late, 0.0)
+    return np.where((years >= -1000) & (years < 1000), early, jde0)
+
+
+def calculate_mean_season_start(yr, terms):
+    """
+    Calculate the mean start of a season from the coefficients of table 27.A or 27.B.
+    :param yr: the millennia from the start of the table (a float or an array)
+    :param terms: the coefficients (i.e. SEASON_START_TERMS_27B[VERNAL_EQUINOX])
+    :return: the julian dates (in dynamical time)
+    """
+    jde0 = 0.0
+    for c in terms:
+        jde0 = (jde0 * yr) + c
+    return jde0
+
 
 class Position:
 
@@ -54,6 +149,7 @@ class Position:
         self.z = 0.0
         self.earth_position = None
         self.earth_nutation = None
+        self.season_iterations = 0
 
     def calculate_aberration_with_julianTD(self, jde):
         t = (jde - astrodate.J2000) / 365250.0
@@ -87,26 +183,11 @@ class Position:
     def calculate_approximate_season_start(self, year, season):
         jde0 = 0.0
         year = int(year)
-        if (year >= -1000) and (year < 1000):
-            yr = year / 1000.0
-            if season == VERNAL_EQUINOX:
-                jde0 = (((((((-0.00071 * yr) + 0.00111) * yr) + 0.06134) * yr) + 365242.1374) * yr) + 1721139.29189
-            elif season == SUMMER_SOLSTICE:
-                jde0 = (((((((0.00025 * yr) + 0.00907) * yr) - 0.05323) * yr) + 365241.72562) * yr) + 1721233.25401
-            elif season == AUTUMNAL_EQUINOX:
-                jde0 = (((((((0.00074 * yr) - 0.00297) * yr) - 0.11677) * yr) + 365242.49558) * yr) + 1721325.70455
-            elif season == WINTER_SOLSTICE:
-                jde0 = (((((((-0.00006 * yr) - 0.00933) * yr) - 0.00769) * yr) + 365242.88257) * yr) + 1721414.39987
-        elif (year >= 1000) and (year <= 3000):
-            yr = (year - 2000) / 1000.0
-            if season == VERNAL_EQUINOX:
-                jde0 = (((((((-0.00057 * yr) - 0.00411) * yr) + 0.05169) * yr) + 365242.37404) * yr) + 2451623.80984
-            elif season == SUMMER_SOLSTICE:
-                jde0 = (((((((-0.0003 * yr) + 0.00888) * yr) + 0.00325) * yr) + 365241.62603) * yr) + 2451716.56767
-            elif season == AUTUMNAL_EQUINOX:
-                jde0 = (((((((0.00078 * yr) + 0.00337) * yr) - 0.11575) * yr) + 365242.01767) * yr) + 2451810.21715
-            elif season == WINTER_SOLSTICE:
-                jde0 = (((((((0.00032 * yr) - 0.00823) * yr) - 0.06223) * yr) + 365242.74049) * yr) + 2451900.05952
+        if season in SEASON_START_TERMS_27A:
+            if (year >= -1000) and (year < 1000):
+                jde0 = calculate_mean_season_start(year / 1000.0, SEASON_START_TERMS_27A[season])
+            elif (year >= 1000) and (year <= 3000):
+                jde0 = calculate_mean_season_start((year - 2000) / 1000.0, SEASON_START_TERMS_27B[season])
         return jde0
 
     def calculate_eccentricity_of_orbit_with_julianTD(self, jde1900):
@@ -136,17 +217,52 @@ class Position:
         self.dB = (0.03916 * (math.cos(Lp) - math.sin(Lp))) / 3600.0
         self.calculate_xyz(useSun2000)
 
-    def calculate_season_start(self, year, season, useSun2000=False):
+    def calculate_longitude_rate(self):
+        """
+        Calculate the rate of change of the Sun's longitude (from the derivative of Earth's longitude series).
+        Note: this method depends on a position having been calculated.
+        :return: the rate (in degrees per day)
+        """
+        p = self.earth_position
+        return float(p.packed.L.evaluate_derivative(p.T)) * (180.0 / math.pi) / 365250.0
+
+    def calculate_season_start(self, year, season, useSun2000=False, method=SEASON_METHOD_FIXED):
+        """
+        Calculate the start of a season (when the apparent longitude of the Sun is the season).
+        :param year: the year
+        :param season: the season (i.e. VERNAL_EQUINOX)
+        :param useSun2000: true=use the J2000 ecliptic for x, y and z
+        :param method: the solver (SEASON_METHOD_FIXED, SEASON_METHOD_NEWTON or SEASON_METHOD_SECANT)
+        :return: the julian date (in dynamical time, 0.0 for years outside -1000..3000)
+        """
+        if method not in SEASON_METHODS:
+            raise ValueError("Invalid season method! ({})".format(method))
+        self.season_iterations = 0
         jde = self.calculate_approximate_season_start(year, season)
         if jde != 0.0:
             djde = 0.0
+            last_jde = None
+            last_f = None
             while True:
                 jde += djde
                 self.calculate_with_julianTD(jde, useSun2000)
+                self.season_iterations += 1
                 ap_long = self.get_apparent_longitude()
-                djde = 58.0 * math.sin(season - ap_long) * math.pi / 180.0
+                if method == SEASON_METHOD_FIXED:
+                    djde = 58.0 * math.sin((season - ap_long) * math.pi / 180.0)
+                else:
+                    f = mathutils.normalize_degrees(ap_long - season, -180.0, 180.0)
+                    if method == SEASON_METHOD_NEWTON:
+                        rate = self.calculate_longitude_rate()
+                    elif (last_f is None) or (f == last_f):
+                        rate = MEAN_LONGITUDE_RATE
+                    else:
+                        rate = (f - last_f) / (jde - last_jde)
+                    last_jde = jde
+                    last_f = f
+                    djde = -f / rate
                 adjde = abs(djde)
-                if adjde < 0.000005:
+                if (adjde < SEASON_TOLERANCE) or (self.season_iterations >= SEASON_MAX_ITERATIONS):
                     break
         return jde
 
@@ -171,6 +287,13 @@ class Position:
             self.y = r * ((cosLatSinLong * cosMObl) - (sinLat * sinMObl))
             self.z = r * ((cosLatSinLong * sinMObl) - (sinLat * cosMObl))
 
+    def get_season_iterations(self):
+        """
+        Get the number of positions the last calculate_season_start calculated.
+        :return: the number of iterations
+        """
+        return self.season_iterations
+
     def get_apparent_longitude(self):
         tr_long = self.get_true_longitude()
         ea_nut = self.earth_nutation.get_nutation_in_longitude()
@@ -224,6 +347,36 @@ class Position:
         return self.z
 
 
+def calculate_season_starts(years, seasons=SEASONS):
+    """
+    Calculate the starts of seasons for a range of years at once, with Newton's method run over all of them.
+    :param years: the years (a sequence, from -1000 to 3000)
+    :param seasons: the seasons (i.e. [VERNAL_EQUINOX, AUTUMNAL_EQUINOX])
+    :return: the julian dates (in dynamical time), an array of years x seasons
+    """
+    years = np.atleast_1d(np.asarray(years))
+    if (years.min() < -1000) or (years.max() > 3000):
+        raise ValueError("Years must be from -1000 to 3000!")
+    targets = np.tile(np.asarray(seasons, dtype=np.float64), (len(years), 1))
+    jdes = np.column_stack([calculate_approximate_season_starts(years, season) for season in seasons])
+    shape = jdes.shape
+    jdes = jdes.ravel()
+    targets = targets.ravel()
+    for i in range(SEASON_MAX_ITERATIONS):
+        p = earth.calculate_positions_with_julianTD(jdes)
+        nutation = earth.calculate_nutations_with_julianTD(jdes)
+        ap_long = p.get_longitude0() + 180.0 - (0.09033 / 3600.0)
+        ap_long += calculate_aberrations_with_julianTD(jdes, p.get_radius()) / 3600.0
+        ap_long += nutation.get_nutation_in_longitude()
+        f = np.mod(ap_long - targets + 180.0, 360.0) - 180.0
+        rate = p.packed.L.evaluate_derivative(p.T) * (180.0 / math.pi) / 365250.0
+        djde = -f / rate
+        jdes = jdes + djde
+        if np.abs(djde).max() < SEASON_TOLERANCE:
+            break
+    return jdes.reshape(shape)
+
+
 def calculate_position_with_dateTD(dateTD):
     p = Position()
     p.calculate_with_dateTD(dateTD)
@@ -11,6 +11,30 @@ class Test_Sun(unittest.TestCase):
         crn = sun.calculate_crn_with_dateTD(d)
         self.assertEqual(crn, 1624)
 
+    def test_season_start(self):
+        # Meeus, Astronomical Algorithms, example 27.a (the June solstice of 1962)
+        p = sun.Position()
+        for method in sun.SEASON_METHODS:
+            jde = p.calculate_season_start(1962, sun.SUMMER_SOLSTICE, method=method)
+            self.assertAlmostEqual(jde, 2437837.39245, 3)
+            jde = p.calculate_season_start(1596, sun.VERNAL_EQUINOX, method=method)
+            p.calculate_with_julianTD(jde)
+            self.assertAlmostEqual(sun.mathutils.normalize_degrees(p.get_apparent_longitude(), -180.0, 180.0), 0.0, 5)
+        p.calculate_season_start(1962, sun.SUMMER_SOLSTICE, method=sun.SEASON_METHOD_NEWTON)
+        self.assertTrue(p.get_season_iterations() <= 3)
+        self.assertRaises(ValueError, p.calculate_season_start, 1962, sun.SUMMER_SOLSTICE, method=u"bisect")
+
+    def test_season_starts(self):
+        jdes = sun.calculate_season_starts([1962, 2017], [sun.VERNAL_EQUINOX, sun.SUMMER_SOLSTICE])
+        self.assertEqual(jdes.shape, (2, 2))
+        self.assertAlmostEqual(jdes[0, 1], 2437837.39245, 3)
+        p = sun.Position()
+        self.assertAlmostEqual(jdes[1, 0], p.calculate_season_start(2017, sun.VERNAL_EQUINOX), 4)
+        years = [-1001, -1000, 0, 999, 1000, 1962, 3000, 3001]
+        for season in sun.SEASONS:
+            expected = [p.calculate_approximate_season_start(year, season) for year in years]
+            self.assertEqual(sun.calculate_approximate_season_starts(years, season).tolist(), expected)
+
 
 if __name__ == '__main__':
     
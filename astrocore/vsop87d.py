@@ -0,0 +1,113 @@
+"""
+The VSOP87D term tables of the planets as binary terms files.
+
+The term tables are kept as Python lists in the <planet>_vsop87d modules. Importing those builds tens of
+thousands of small lists, so the planet modules map a binary terms file generated from them instead
+(see heliocentric_position.read_terms). The planet modules only load their terms when they are first used,
+and a file that is missing or older than its term lists module is generated at that point. Regenerate them
+all with:
+
+python vsop87d.py
+"""
+
+import functools
+import heliocentric_position
+import os
+
+PLANETS = ("mercury", "venus", "earth", "mars", "jupiter", "saturn", "uranus", "neptune")
+TERMS_FILE_EXTENSION = ".vsop87d"
+
+
+def convert_terms(name, path=None):
+    """
+    Generate the binary terms file of a planet from its term lists.
+    :param name: the name of the planet (i.e. 'mars')
+    :param path: the path of the file (defaults to get_terms_path(name))
+    :return: the path of the file
+    """
+    if path is None:
+        path = get_terms_path(name)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    heliocentric_position.write_terms(tmp_path, read_term_lists(name))
+    os.rename(tmp_path, path)
+    return path
+
+
+def get_terms_path(name):
+    """
+    Get the path of the binary terms file of a planet.
+    :param name: the name of the planet (i.e. 'mars')
+    :return: the path of the file
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name + TERMS_FILE_EXTENSION)
+
+
+def load_terms(name, path=None):
+    """
+    Load the VSOP87D terms of a planet from its binary terms file, generating the file if it is missing or older
+    than the term lists module. If the file can not be written the terms are packed in memory from the term lists.
+    :param name: the name of the planet (i.e. 'mars')
+    :param path: the path of the file (defaults to get_terms_path(name))
+    :return: the PackedTerms
+    """
+    if path is None:
+        path = get_terms_path(name)
+    if not is_terms_file_current(name, path):
+        try:
+            convert_terms(name, path)
+        except (IOError, OSError):
+            return heliocentric_position.PackedTerms(read_term_lists(name))
+    return heliocentric_position.read_terms(path)
+
+
+def get_term_lists_path(name):
+    """
+    Get the path of the term lists module of a planet.
+    :param name: the name of the planet (i.e. 'mars')
+    :return: the path of the module source
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name + "_vsop87d.py")
+
+
+def is_terms_file_current(name, path=None):
+    """
+    Check that the binary terms file of a planet exists and is not older than its term lists module.
+    :param name: the name of the planet (i.e. 'mars')
+    :param path: the path of the file (defaults to get_terms_path(name))
+    :return: true if the file can be used
+    """
+    if path is None:
+        path = get_terms_path(name)
+    if not os.path.exists(path):
+        return False
+    lists_path = get_term_lists_path(name)
+    if not os.path.exists(lists_path):
+        return True
+    return os.path.getmtime(path) >= os.path.getmtime(lists_path)
+
+
+def lazy_terms(name):
+    """
+    Get the VSOP87D terms of a planet, to be loaded with load_terms on first use.
+    :param name: the name of the planet (i.e. 'mars')
+    :return: the LazyTerms
+    """
+    return heliocentric_position.LazyTerms(functools.partial(load_terms, name))
+
+
+def read_term_lists(name):
+    """
+    Import the term lists of a planet.
+    :param name: the name of the planet (i.e. 'mars')
+    :return: the [L, B, R] term lists
+    """
+    tables = __import__(name + "_vsop87d", globals())
+    return [tables.L_VSOP87D, tables.B_VSOP87D, tables.R_VSOP87D]
+
+
+if __name__ == "__main__":
+
+
+    for name in PLANETS:
+        path = convert_terms(name)
+        print("{}: {:,d} bytes".format(path, os.path.getsize(path)))